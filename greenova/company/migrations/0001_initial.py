@@ -0,0 +1,99 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import core.storage
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Company',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('logo', models.ImageField(blank=True, null=True, upload_to='company_logos/')),
+                ('description', models.TextField(blank=True)),
+                ('website', models.URLField(blank=True)),
+                ('phone', models.CharField(blank=True, max_length=50)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('address', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company_type', models.CharField(choices=[('client', 'Client'), ('contractor', 'Contractor'), ('consultant', 'Consultant'), ('regulator', 'Regulator'), ('internal', 'Internal Department'), ('other', 'Other')], default='client', max_length=20)),
+                ('size', models.CharField(blank=True, choices=[('small', 'Small (1-49 employees)'), ('medium', 'Medium (50-249 employees)'), ('large', 'Large (250+ employees)')], max_length=10)),
+                ('industry', models.CharField(blank=True, choices=[('manufacturing', 'Manufacturing'), ('construction', 'Construction'), ('mining', 'Mining'), ('energy', 'Energy'), ('transportation', 'Transportation'), ('government', 'Government'), ('consulting', 'Consulting'), ('other', 'Other')], max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('users', models.ManyToManyField(related_name='companies', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Company',
+                'verbose_name_plural': 'Companies',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CompanyDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('file', models.FileField(storage=core.storage.deduplicated_storage, upload_to='company_documents/')),
+                ('document_type', models.CharField(blank=True, max_length=100)),
+                ('uploaded_at', models.DateTimeField(auto_now_add=True)),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='documents', to='company.company')),
+                ('uploaded_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='uploaded_company_documents', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Company Document',
+                'verbose_name_plural': 'Company Documents',
+                'ordering': ['-uploaded_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Obligation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('due_date', models.DateField()),
+                ('status', models.CharField(choices=[('not_started', 'Not Started'), ('in_progress', 'In Progress'), ('completed', 'Completed')], default='not_started', max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('company', models.ForeignKey(help_text='The company associated with this obligation.', on_delete=django.db.models.deletion.CASCADE, related_name='obligations', to='company.company')),
+            ],
+            options={
+                'verbose_name': 'Obligation',
+                'verbose_name_plural': 'Obligations',
+                'ordering': ['due_date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CompanyMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('owner', 'Owner'), ('admin', 'Administrator'), ('manager', 'Manager'), ('member', 'Member'), ('client_contact', 'Client Contact'), ('contractor', 'Contractor'), ('view_only', 'View Only')], default='member', max_length=20)),
+                ('department', models.CharField(blank=True, max_length=100)),
+                ('position', models.CharField(blank=True, max_length=100)),
+                ('date_joined', models.DateTimeField(default=django.utils.timezone.now)),
+                ('is_primary', models.BooleanField(default=False, help_text="Designates if this is the user's primary company.")),
+                ('company', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='company.company')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='company_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Company Membership',
+                'verbose_name_plural': 'Company Memberships',
+                'ordering': ['company', 'user'],
+                'unique_together': {('user', 'company')},
+            },
+        ),
+    ]
@@ -1,5 +1,6 @@
 import logging
 
+from core.storage import deduplicated_storage
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -204,7 +205,9 @@ class CompanyDocument(models.Model):
     )
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
-    file = models.FileField(upload_to="company_documents/")
+    file = models.FileField(
+        upload_to="company_documents/", storage=deduplicated_storage
+    )
     document_type = models.CharField(max_length=100, blank=True)
     uploaded_by = models.ForeignKey(
         User,
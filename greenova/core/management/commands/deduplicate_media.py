@@ -0,0 +1,81 @@
+# Copyright 2025 Enveng Group.
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Management command to move existing uploads into the deduplicating store."""
+
+import logging
+import os
+from collections import defaultdict
+
+from core.storage import DeduplicatingFileSystemStorage, file_digest
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+
+def deduplicated_file_fields() -> list[tuple[type[models.Model], str]]:
+    """Return the (model, field name) pairs stored with the deduplicating storage."""
+    return [
+        (model, field.name)
+        for model in apps.get_models()
+        for field in model._meta.get_fields()
+        if isinstance(field, models.FileField)
+        and isinstance(field.storage, DeduplicatingFileSystemStorage)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Hash existing evidence, company document and procedure files, store "
+        "each distinct content once and replace duplicates with links to it"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report duplicates and reclaimable space without changing files",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        seen: dict[str, set[tuple[int, int]]] = defaultdict(set)
+        files = missing = freed = 0
+        storages = set()
+
+        for model, field_name in deduplicated_file_fields():
+            storage = model._meta.get_field(field_name).storage
+            storages.add(storage)
+            names = (
+                model._default_manager.exclude(**{field_name: ""})
+                .exclude(**{f"{field_name}__isnull": True})
+                .values_list(field_name, flat=True)
+                .iterator()
+            )
+            for name in dict.fromkeys(names):
+                if not storage.exists(name):
+                    missing += 1
+                    logger.warning("Missing file for %s: %s", model.__name__, name)
+                    continue
+                files += 1
+                if dry_run:
+                    stat = os.stat(storage.path(name))
+                    inodes = seen[file_digest(storage.path(name))]
+                    if inodes and (stat.st_dev, stat.st_ino) not in inodes:
+                        freed += stat.st_size
+                    inodes.add((stat.st_dev, stat.st_ino))
+                else:
+                    freed += storage.deduplicate(name)
+
+        if not dry_run:
+            for storage in storages:
+                freed += storage.collect_garbage()
+
+        verb = "Would free" if dry_run else "Freed"
+        self.stdout.write(
+            f"Checked {files} files ({missing} missing). "
+            f"{verb} {freed / (1024 * 1024):.1f} MB"
+        )
+        self.stdout.write(self.style.SUCCESS("Media deduplication complete"))
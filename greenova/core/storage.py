@@ -0,0 +1,260 @@
+# Copyright 2025 Enveng Group.
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""
+Content-addressed, deduplicating file storage.
+
+Uploads are hashed with SHA-256 while they are streamed to disk. Each distinct
+content is kept once as a blob under ``.blobs/<aa>/<bb>/<digest>`` in the
+media root, and the name Django records for an upload is a hard link to its
+blob. Names, URLs and ``open()`` therefore behave exactly as with
+``FileSystemStorage``, while the bytes of a file attached to many records are
+stored (and backed up by link-aware tools) once.
+
+The hard-link count is the blob's reference count: a blob whose only link is
+its own ``.blobs`` entry is unreferenced and is removed when the last name
+pointing at it is deleted, or by ``collect_garbage()``.
+
+Names share their blob's inode, so each blob is also indexed by inode as a
+``.blobs/inodes/<device>-<inode>`` symlink whose target is the digest. Deleting
+a name finds its blob there instead of hashing the file again.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Iterator
+from typing import Any, NamedTuple
+
+from django.core.files.storage import FileSystemStorage, Storage, storages
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIRECTORY = ".blobs"
+# Directories under BLOB_DIRECTORY that hold no blobs
+TEMPORARY_DIRECTORY = "tmp"
+INODE_DIRECTORY = "inodes"
+# Link count of a blob's last remaining name: the name and the blob itself
+LAST_NAME_LINKS = 2
+STORAGE_ALIAS = "deduplicated"
+
+
+class BlobInfo(NamedTuple):
+    """A stored blob and the number of names that reference it."""
+
+    digest: str
+    path: str
+    size: int
+    references: int
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of the file at ``path``."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+class DeduplicatingFileSystemStorage(FileSystemStorage):
+    """``FileSystemStorage`` that stores each distinct content once."""
+
+    def blob_path(self, digest: str) -> str:
+        """Absolute path of the blob for ``digest``."""
+        return os.path.join(
+            self.location, BLOB_DIRECTORY, digest[:2], digest[2:4], digest
+        )
+
+    def _temporary_directory(self) -> str:
+        # Inside the media root, so blobs can be renamed and linked into place
+        directory = os.path.join(self.location, BLOB_DIRECTORY, TEMPORARY_DIRECTORY)
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    def _inode_path(self, stat: os.stat_result) -> str:
+        return os.path.join(
+            self.location,
+            BLOB_DIRECTORY,
+            INODE_DIRECTORY,
+            f"{stat.st_dev}-{stat.st_ino}",
+        )
+
+    def _index_blob(self, blob: str, digest: str) -> None:
+        """Record ``digest`` under the inode of ``blob``."""
+        entry = self._inode_path(os.stat(blob))
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        try:
+            os.symlink(digest, entry)
+        except FileExistsError:
+            # Left behind by a removed blob whose inode number was reused
+            os.unlink(entry)
+            os.symlink(digest, entry)
+
+    def _remove_blob(self, blob: str) -> None:
+        entry = self._inode_path(os.stat(blob))
+        os.remove(blob)
+        try:
+            os.unlink(entry)
+        except FileNotFoundError:
+            pass
+
+    def find_blob(self, path: str) -> str:
+        """
+        Return the blob path for the stored file at ``path``.
+
+        The blob is looked up by inode; only files without an index entry
+        (e.g. linked before the index existed) are hashed.
+        """
+        try:
+            blob = self.blob_path(os.readlink(self._inode_path(os.stat(path))))
+            if os.path.samefile(blob, path):
+                return blob
+        except OSError:
+            pass
+        return self.blob_path(file_digest(path))
+
+    def _stream_to_temporary(self, content: Any) -> tuple[str, str, int]:
+        """Write ``content`` to a temporary file, hashing it on the way."""
+        digest = hashlib.sha256()
+        size = 0
+        fd, temporary = tempfile.mkstemp(dir=self._temporary_directory())
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                for chunk in content.chunks():
+                    data = chunk.encode() if isinstance(chunk, str) else chunk
+                    digest.update(data)
+                    handle.write(data)
+                    size += len(data)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return temporary, digest.hexdigest(), size
+
+    def store_blob(self, temporary: str, digest: str) -> str:
+        """
+        Move a temporary file into the blob store, unless the blob exists.
+
+        Returns:
+            str: Path of the blob holding the content
+        """
+        blob = self.blob_path(digest)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        try:
+            # os.link fails if the blob exists, so concurrent uploads of the
+            # same content cannot replace a blob that names already link to
+            os.link(temporary, blob)
+        except FileExistsError:
+            pass
+        else:
+            if self.file_permissions_mode is not None:
+                os.chmod(blob, self.file_permissions_mode)
+            self._index_blob(blob, digest)
+        finally:
+            os.unlink(temporary)
+        return blob
+
+    def _save(self, name: str, content: Any) -> str:
+        temporary, digest, size = self._stream_to_temporary(content)
+        blob = self.store_blob(temporary, digest)
+
+        full_path = self.path(name)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        while True:
+            try:
+                os.link(blob, full_path)
+            except FileExistsError:
+                # Another upload took the name after get_available_name()
+                name = self.get_available_name(name)
+                full_path = self.path(name)
+            else:
+                break
+
+        # Let callers record the digest without reading the file again
+        content.content_digest = digest
+        content.content_size = size
+        return str(name).replace("\\", "/")
+
+    def delete(self, name: str) -> None:
+        """Delete ``name``, and its blob if no other name links to it."""
+        if not name:
+            raise ValueError("The name must be given to delete().")
+        full_path = self.path(name)
+        try:
+            links = os.stat(full_path).st_nlink
+        except FileNotFoundError:
+            return
+        # The blob is orphaned after the name goes, so remove it too
+        blob = self.find_blob(full_path) if links == LAST_NAME_LINKS else None
+        super().delete(name)
+        if blob and os.path.exists(blob) and os.stat(blob).st_nlink == 1:
+            self._remove_blob(blob)
+
+    def iter_blobs(self) -> Iterator[BlobInfo]:
+        """Yield every blob in the store with its reference count."""
+        root = os.path.join(self.location, BLOB_DIRECTORY)
+        for directory, subdirectories, files in os.walk(root):
+            if directory == root:
+                subdirectories[:] = [
+                    d
+                    for d in subdirectories
+                    if d not in (TEMPORARY_DIRECTORY, INODE_DIRECTORY)
+                ]
+            for digest in files:
+                path = os.path.join(directory, digest)
+                stat = os.stat(path)
+                yield BlobInfo(digest, path, stat.st_size, stat.st_nlink - 1)
+
+    def collect_garbage(self) -> int:
+        """
+        Remove blobs that no stored name references.
+
+        Returns:
+            int: Bytes freed
+        """
+        freed = removed = 0
+        for blob in self.iter_blobs():
+            if blob.references == 0:
+                self._remove_blob(blob.path)
+                freed += blob.size
+                removed += 1
+        if removed:
+            logger.info("Removed %s unreferenced blobs (%s bytes)", removed, freed)
+        return freed
+
+    def deduplicate(self, name: str) -> int:
+        """
+        Replace the file stored as ``name`` with a link to its blob.
+
+        Files saved before this storage was in use are hashed and either
+        become the blob for their content or are swapped for a link to the
+        existing blob.
+
+        Returns:
+            int: Bytes freed (the size of the file if it was a duplicate)
+        """
+        full_path = self.path(name)
+        digest = file_digest(full_path)
+        blob = self.blob_path(digest)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        try:
+            os.link(full_path, blob)
+        except FileExistsError:
+            pass
+        else:
+            self._index_blob(blob, digest)
+            return 0
+        if os.path.samefile(full_path, blob):
+            return 0
+
+        stat = os.stat(full_path)
+        temporary = os.path.join(self._temporary_directory(), f"{digest}.link")
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+        os.link(blob, temporary)
+        os.replace(temporary, full_path)
+        # The replaced file is freed only if nothing else linked to it
+        return stat.st_size if stat.st_nlink == 1 else 0
+
+
+def deduplicated_storage() -> Storage:
+    """Storage for uploads that are commonly attached to many records."""
+    return storages[STORAGE_ALIAS]
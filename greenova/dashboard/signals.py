@@ -103,11 +103,11 @@ def update_dashboard_data(
     """
     # This currently just logs the event
     # In a real-time application, this might trigger WebSocket updates
-    logger.debug("Dashboard data updated due to change in obligation %s", instance.id)
+    logger.debug("Dashboard data updated due to change in obligation %s", instance.pk)
 
     # Send the custom signal
     dashboard_data_updated.send(
         sender=sender,
-        obligation_id=instance.id,
+        obligation_id=instance.pk,
         project_id=instance.project_id if hasattr(instance, "project") else None,
     )
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BugReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200, verbose_name='Title')),
+                ('description', models.TextField(verbose_name='Description')),
+                ('environment', models.TextField(verbose_name='Environment Details')),
+                ('application_version', models.CharField(max_length=50, verbose_name='Application Version')),
+                ('operating_system', models.CharField(max_length=100, verbose_name='Operating System')),
+                ('browser', models.CharField(blank=True, max_length=100, verbose_name='Browser (if applicable)')),
+                ('device_type', models.CharField(max_length=100, verbose_name='Device Type')),
+                ('steps_to_reproduce', models.TextField(verbose_name='Steps to Reproduce')),
+                ('expected_behavior', models.TextField(verbose_name='Expected Result')),
+                ('actual_behavior', models.TextField(verbose_name='Actual Result')),
+                ('error_messages', models.TextField(blank=True, verbose_name='Error Messages')),
+                ('trace_report', models.TextField(blank=True, verbose_name='Trace Report')),
+                ('frequency', models.CharField(choices=[('always', 'Always (100% of attempts)'), ('frequently', 'Frequently (about 7 out of 10 attempts)'), ('occasionally', 'Occasionally (about 3 out of 10 attempts)'), ('rarely', 'Rarely (happened once or twice)')], max_length=20, verbose_name='Frequency')),
+                ('impact_severity', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High'), ('critical', 'Critical')], default='medium', max_length=10, verbose_name='Impact Severity')),
+                ('user_impact', models.TextField(verbose_name='User Impact Description')),
+                ('workarounds', models.TextField(blank=True, verbose_name='Workarounds')),
+                ('additional_comments', models.TextField(blank=True, verbose_name='Additional Comments')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('github_issue_url', models.URLField(blank=True, null=True, verbose_name='GitHub Issue URL')),
+                ('severity', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High'), ('critical', 'Critical')], default='medium', max_length=10, verbose_name='Severity')),
+                ('status', models.CharField(choices=[('open', 'Open'), ('in_progress', 'In Progress'), ('resolved', 'Resolved'), ('closed', 'Closed'), ('rejected', 'Rejected')], default='open', max_length=15, verbose_name='Status')),
+                ('admin_comment', models.TextField(blank=True, verbose_name='Admin Comment')),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bug_reports', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+            ],
+            options={
+                'verbose_name': 'Bug Report',
+                'verbose_name_plural': 'Bug Reports',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -225,6 +225,13 @@ def validate_settings() -> None:
 # Run validation
 validate_settings()
 
+# Seconds between in-process overdue counter rollovers, run by each server
+# process from its first request on (0 disables; use the
+# rollover_overdue_counts management command from cron instead)
+MECHANISM_OVERDUE_ROLLOVER_INTERVAL = int(
+    os.environ.get("MECHANISM_OVERDUE_ROLLOVER_INTERVAL", "0")
+)
+
 # Security Headers Configuration
 CSP_DEFAULT_SRC = ("'self'",)
 CSP_SCRIPT_SRC = (
@@ -472,6 +479,10 @@ def validate_settings() -> None:
     "default": {
         "BACKEND": "django.core.files.storage.FileSystemStorage",
     },
+    # Content-addressed storage for evidence and documents (core.storage)
+    "deduplicated": {
+        "BACKEND": "core.storage.DeduplicatingFileSystemStorage",
+    },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
@@ -613,6 +624,24 @@ def filter(self, record: logging.LogRecord) -> bool:
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "greenova", "media")
 
+# Evidence previews (obligations.previews): cache directory, worker threads
+# and maximum queued or running jobs
+EVIDENCE_PREVIEW_ROOT = os.path.join(MEDIA_ROOT, "evidence_previews")
+EVIDENCE_PREVIEW_WORKERS = 2
+EVIDENCE_PREVIEW_QUEUE = 32
+
+# Procedure chart rendering (procedures.rendering): worker processes (0 renders
+# in the request thread), maximum queued jobs and the seconds each request waits
+# for all of its charts
+PROCEDURE_CHART_RENDER_WORKERS = 2
+PROCEDURE_CHART_RENDER_QUEUE = 32
+PROCEDURE_CHART_RENDER_TIMEOUT = 10
+
+# Mechanism status figures (mechanisms.figure_cache): cache directory and the
+# size it is trimmed to by evicting least recently used figures
+MECHANISM_FIGURE_CACHE_ROOT = os.path.join(MEDIA_ROOT, "mechanism_figures")
+MECHANISM_FIGURE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 26214400  # 25MB in bytes
 
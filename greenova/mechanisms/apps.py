@@ -4,3 +4,9 @@
 class MechanismsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "mechanisms"
+
+    def ready(self):
+        """Start the in-process overdue rollover in server processes."""
+        from .scheduler import start_overdue_rollover_on_request
+
+        start_overdue_rollover_on_request()
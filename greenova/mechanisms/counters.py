@@ -0,0 +1,246 @@
+"""Incremental maintenance of EnvironmentalMechanism status counters.
+
+Instead of recounting every obligation of a mechanism whenever one of them
+changes, each obligation is reduced to a small ``CounterState`` tuple. The
+difference between the state before and after a change is applied to the
+affected mechanisms as atomic ``F()`` updates, so a save costs at most one
+UPDATE per mechanism involved.
+
+``EnvironmentalMechanism.update_obligation_counts`` remains available as a
+repair path for counters that have drifted (e.g. after ``QuerySet.update``).
+
+Overdue status changes with the calendar as well as with edits, so overdue
+counters are kept accurate as of the ``CounterCheckpoint`` date and
+``rollover_overdue_counts`` moves that date forward.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Any, NamedTuple
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+from obligations.constants import (
+    STATUS_COMPLETED,
+    STATUS_IN_PROGRESS,
+    STATUS_NOT_STARTED,
+)
+from obligations.utils import is_obligation_overdue
+
+from .models import (
+    OVERDUE_CHECKPOINT,
+    CounterCheckpoint,
+    EnvironmentalMechanism,
+    update_all_mechanism_counts,
+)
+
+logger = logging.getLogger(__name__)
+
+# Maps an obligation status to the mechanism counter it contributes to
+STATUS_COUNTER_FIELDS: dict[str, str] = {
+    STATUS_NOT_STARTED: "not_started_count",
+    STATUS_IN_PROGRESS: "in_progress_count",
+    STATUS_COMPLETED: "completed_count",
+}
+OVERDUE_COUNTER_FIELD = "overdue_count"
+
+# Fields needed to build a CounterState from the database
+COUNTER_SOURCE_FIELDS: tuple[str, ...] = (
+    "primary_environmental_mechanism_id",
+    "status",
+    "action_due_date",
+)
+
+CounterDeltas = dict[int, dict[str, int]]
+
+
+class CounterState(NamedTuple):
+    """The contribution of a single obligation to its mechanism's counters."""
+
+    mechanism_id: int | None
+    status: str | None
+    overdue: bool
+
+
+def counter_state(
+    obligation: Any, reference_date: date | None = None
+) -> CounterState | None:
+    """
+    Build the counter state for an obligation.
+
+    Args:
+        obligation: An Obligation instance or a dict with the
+            ``COUNTER_SOURCE_FIELDS`` keys
+        reference_date: Date used to evaluate overdue status (defaults to the
+            counter checkpoint date)
+
+    Returns:
+        CounterState or None if the obligation is not linked to a mechanism
+    """
+    if isinstance(obligation, dict):
+        mechanism_id = obligation.get("primary_environmental_mechanism_id")
+        status = obligation.get("status")
+    else:
+        mechanism_id = obligation.primary_environmental_mechanism_id
+        status = obligation.status
+
+    if mechanism_id is None:
+        return None
+    if reference_date is None:
+        reference_date = CounterCheckpoint.reference_date()
+
+    return CounterState(
+        mechanism_id=mechanism_id,
+        status=status,
+        overdue=is_obligation_overdue(obligation, reference_date),
+    )
+
+
+def _add_state(deltas: CounterDeltas, state: CounterState | None, sign: int) -> None:
+    """Accumulate the counters touched by ``state`` into ``deltas``."""
+    if state is None or state.mechanism_id is None:
+        return
+    field = STATUS_COUNTER_FIELDS.get(state.status or "")
+    if field:
+        deltas[state.mechanism_id][field] += sign
+    if state.overdue:
+        deltas[state.mechanism_id][OVERDUE_COUNTER_FIELD] += sign
+
+
+def compute_counter_deltas(
+    old: CounterState | None, new: CounterState | None
+) -> CounterDeltas:
+    """
+    Compute the counter changes for an obligation moving from ``old`` to ``new``.
+
+    Args:
+        old: State before the change (None for newly created obligations)
+        new: State after the change (None for deleted obligations)
+
+    Returns:
+        Mapping of mechanism id to ``{counter_field: delta}``, without zero deltas
+    """
+    deltas: CounterDeltas = defaultdict(lambda: defaultdict(int))
+    if old == new:
+        return {}
+    _add_state(deltas, old, -1)
+    _add_state(deltas, new, 1)
+    return {
+        mechanism_id: {field: delta for field, delta in fields.items() if delta}
+        for mechanism_id, fields in deltas.items()
+        if any(fields.values())
+    }
+
+
+def merge_counter_deltas(*deltas: CounterDeltas) -> CounterDeltas:
+    """Combine several delta mappings into one."""
+    merged: CounterDeltas = defaultdict(lambda: defaultdict(int))
+    for delta in deltas:
+        for mechanism_id, fields in delta.items():
+            for field, value in fields.items():
+                merged[mechanism_id][field] += value
+    return {
+        mechanism_id: {field: value for field, value in fields.items() if value}
+        for mechanism_id, fields in merged.items()
+        if any(fields.values())
+    }
+
+
+def apply_counter_deltas(deltas: CounterDeltas) -> int:
+    """
+    Apply counter deltas with one atomic UPDATE per mechanism.
+
+    Args:
+        deltas: Mapping produced by ``compute_counter_deltas``
+
+    Returns:
+        int: Number of mechanism rows updated
+    """
+    updated = 0
+    now = timezone.now()
+    for mechanism_id, fields in deltas.items():
+        if not fields:
+            continue
+        updated += EnvironmentalMechanism.objects.filter(pk=mechanism_id).update(
+            updated_at=now,
+            **{field: F(field) + delta for field, delta in fields.items()},
+        )
+    return updated
+
+
+def apply_counter_change(old: CounterState | None, new: CounterState | None) -> int:
+    """Apply the counter changes for a single obligation transition."""
+    deltas = compute_counter_deltas(old, new)
+    if deltas:
+        logger.debug("Applying mechanism counter deltas: %s", deltas)
+    return apply_counter_deltas(deltas)
+
+
+def rollover_overdue_counts(as_of: date | None = None) -> int:
+    """
+    Advance overdue counters to ``as_of`` touching only newly overdue rows.
+
+    Obligations whose due date falls between the stored high-water mark and
+    ``as_of`` are counted per mechanism in one range query and added to
+    ``overdue_count``. Without a previous mark, all counters are recomputed once.
+
+    Args:
+        as_of: Date to roll forward to (defaults to today)
+
+    Returns:
+        int: Number of obligations that became overdue since the last run
+    """
+    from obligations.models import Obligation
+
+    as_of = as_of or timezone.now().date()
+
+    with transaction.atomic():
+        last = (
+            CounterCheckpoint.objects.filter(name=OVERDUE_CHECKPOINT)
+            .values_list("as_of", flat=True)
+            .first()
+        )
+        if last is None:
+            logger.info("No overdue checkpoint found, recounting all mechanisms")
+            update_all_mechanism_counts()
+            return 0
+        if as_of <= last:
+            return 0
+
+        # Claim the range; a concurrent run that got here first wins.
+        claimed = CounterCheckpoint.objects.filter(
+            name=OVERDUE_CHECKPOINT, as_of=last
+        ).update(as_of=as_of, updated_at=timezone.now())
+        if not claimed:
+            return 0
+
+        rows = (
+            Obligation.objects.filter(
+                primary_environmental_mechanism__isnull=False,
+                action_due_date__gte=last,
+                action_due_date__lt=as_of,
+            )
+            .exclude(status=STATUS_COMPLETED)
+            .order_by()
+            .values("primary_environmental_mechanism_id")
+            .annotate(crossed=Count("pk"))
+        )
+        deltas: CounterDeltas = {
+            row["primary_environmental_mechanism_id"]: {
+                OVERDUE_COUNTER_FIELD: row["crossed"]
+            }
+            for row in rows
+        }
+        apply_counter_deltas(deltas)
+
+    crossed = sum(fields[OVERDUE_COUNTER_FIELD] for fields in deltas.values())
+    logger.info(
+        "Rolled overdue counters from %s to %s: %s obligations across %s mechanisms",
+        last,
+        as_of,
+        crossed,
+        len(deltas),
+    )
+    return crossed
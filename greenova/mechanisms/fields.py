@@ -0,0 +1,94 @@
+"""Model fields for the mechanisms app."""
+
+import io
+import logging
+from base64 import b64encode
+from typing import Any
+
+from django_matplotlib.fields import (  # type: ignore
+    FigureObject,
+    MatplotlibFigureField,
+)
+
+from . import figure_cache
+
+logger = logging.getLogger(__name__)
+
+
+class MechanismStatusChartField(MatplotlibFigureField):
+    """
+    Status pie chart of a mechanism, served from the on-disk figure cache.
+
+    ``MatplotlibFigureField`` renders per model class and re-executes the
+    app's figures module on every access. This field renders per instance
+    from the counters already loaded on it, so a cache hit needs neither a
+    query nor matplotlib.
+    """
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        # formfield() passes '' for the instance; keep the library behaviour
+        if not instance:
+            return super().__get__(instance, owner)
+        return self.figure_for(instance)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        # Model.__init__ assigns None to every field; as a data descriptor the
+        # field keeps that from shadowing __get__ in the instance __dict__
+        pass
+
+    def figure_for(self, mechanism: Any) -> FigureObject:
+        """Return the figure object for ``mechanism``."""
+        fig_object = FigureObject(
+            width=self.fig_width, height=self.fig_height, type="string"
+        )
+        fig_object.format = self.output_format
+        counts = [
+            mechanism.not_started_count,
+            mechanism.in_progress_count,
+            mechanism.completed_count,
+            mechanism.overdue_count,
+        ]
+        digest = figure_cache.figure_digest(
+            mechanism.id, counts, self.fig_width, self.fig_height, self.output_format
+        )
+        try:
+            data = figure_cache.get_or_render(
+                digest,
+                self.output_format,
+                lambda: self._render(mechanism.id, counts),
+            )
+        except Exception as e:
+            logger.exception(
+                "Rendering status chart of mechanism %s failed", mechanism.id
+            )
+            if not self.silent:
+                raise
+            fig_object.error = e
+            return fig_object
+
+        if self.output_format == "png":
+            fig_object.source = b64encode(data).decode("ascii")
+        else:
+            fig_object.source = data.decode("utf-8")
+        return fig_object
+
+    def _render(self, mechanism_id: int, counts: list[int]) -> bytes:
+        from .figures import PieChartParams, generate_pie_chart
+        from .svg_charts import STATUS_COLORS, STATUS_LABELS
+
+        fig = generate_pie_chart(
+            PieChartParams(
+                data=counts,
+                labels=list(STATUS_LABELS),
+                colors=list(STATUS_COLORS),
+                mechanism_id=mechanism_id,
+                fig_width=self.fig_width,
+                fig_height=self.fig_height,
+            )
+        )
+        try:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=self.output_format, bbox_inches="tight")
+            return buffer.getvalue()
+        finally:
+            fig.clear()
@@ -0,0 +1,224 @@
+"""On-disk, content-addressed cache for rendered mechanism status figures.
+
+Rendering a status chart with matplotlib costs tens of milliseconds, while
+the chart only depends on a mechanism's four status counters and the output
+size and format. Rendered figures are stored under
+``MECHANISM_FIGURE_CACHE_ROOT`` by a SHA-256 digest of exactly those inputs
+(plus ``RENDERER_VERSION``), so an unchanged mechanism costs a file read and
+a changed one simply gets a new file.
+
+Stale files are never invalidated explicitly. Instead the directory is kept
+under ``MECHANISM_FIGURE_CACHE_MAX_BYTES`` by evicting the least recently used
+files: a hit refreshes the file's modification time, and eviction removes the
+oldest files first.
+
+Each process keeps a running estimate of the directory size: measured once,
+then increased by every figure it writes. Only when the estimate passes the
+limit is the directory walked, which evicts and re-measures it, so a miss
+normally costs one write and no ``stat`` calls. Figures written by other
+processes are picked up at the next walk.
+
+``cache_stats()`` reports this process's hits and misses, and the
+``warm_mechanism_charts`` command renders every figure not yet cached.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the figures themselves change, to stop serving old renders
+RENDERER_VERSION = 1
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_lock = threading.Lock()
+
+# Estimated size in bytes of each cache root, as last measured plus writes since
+_estimated_bytes: dict[str, int] = {}
+
+
+@dataclass
+class FigureCacheStats:
+    """Hit and miss counters for this process."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_stats = FigureCacheStats()
+
+
+def cache_stats() -> FigureCacheStats:
+    """Return a snapshot of the hit and miss counters."""
+    with _lock:
+        return FigureCacheStats(_stats.hits, _stats.misses)
+
+
+def reset_cache_stats() -> None:
+    """Zero the hit and miss counters."""
+    with _lock:
+        _stats.hits = _stats.misses = 0
+
+
+def cache_root() -> str:
+    """Directory holding cached figures."""
+    return getattr(
+        settings,
+        "MECHANISM_FIGURE_CACHE_ROOT",
+        os.path.join(settings.MEDIA_ROOT, "mechanism_figures"),
+    )
+
+
+def max_cache_bytes() -> int:
+    """Size the cache directory is trimmed to after each write."""
+    return getattr(settings, "MECHANISM_FIGURE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)
+
+
+def figure_digest(
+    mechanism_id: int,
+    counts: Sequence[int],
+    width: int,
+    height: int,
+    output_format: str,
+) -> str:
+    """Digest identifying the figure drawn from these inputs."""
+    key = "|".join(
+        [
+            f"v{RENDERER_VERSION}",
+            str(mechanism_id),
+            ",".join(str(count) for count in counts),
+            f"{width}x{height}",
+            output_format,
+        ]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def figure_path(digest: str, output_format: str) -> str:
+    """Cache path of the figure with ``digest``."""
+    return os.path.join(cache_root(), digest[:2], f"{digest}.{output_format}")
+
+
+def _read(path: str) -> bytes | None:
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except FileNotFoundError:
+        return None
+    try:
+        # Mark as recently used; atime is unreliable on noatime mounts
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+    return data
+
+
+def _write(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        # Readers only ever see a complete figure
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+
+
+def evict(max_bytes: int | None = None) -> int:
+    """
+    Remove least recently used figures until the cache fits in ``max_bytes``.
+
+    Returns:
+        int: Number of files removed
+    """
+    limit = max_cache_bytes() if max_bytes is None else max_bytes
+    entries: list[tuple[float, int, str]] = []
+    root = cache_root()
+    for directory, _dirs, files in os.walk(root):
+        for name in files:
+            path = os.path.join(directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _mtime, size, _path in entries)
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            continue
+        total -= size
+        removed += 1
+    _estimated_bytes[root] = total
+    if removed:
+        logger.info("Evicted %s cached mechanism figures from %s", removed, root)
+    return removed
+
+
+def _record_write(size: int) -> None:
+    """Add a written figure to the size estimate, evicting when over the limit."""
+    root = cache_root()
+    with _lock:
+        if root not in _estimated_bytes:
+            # Measure once per process, including this figure; evict()
+            # records the total it finds
+            evict()
+            return
+        _estimated_bytes[root] += size
+        if _estimated_bytes[root] > max_cache_bytes():
+            evict()
+
+
+def get_or_render(
+    digest: str, output_format: str, render: Callable[[], bytes]
+) -> bytes:
+    """
+    Return the cached figure for ``digest``, calling ``render`` on a miss.
+
+    Args:
+        digest: Value of figure_digest() for the figure's inputs
+        output_format: File extension of the figure ("png" or "svg")
+        render: Produces the figure's bytes
+
+    Returns:
+        bytes: The rendered figure
+    """
+    path = figure_path(digest, output_format)
+    cached = _read(path)
+    with _lock:
+        if cached is None:
+            _stats.misses += 1
+        else:
+            _stats.hits += 1
+    if cached is not None:
+        return cached
+
+    data = render()
+    try:
+        _write(path, data)
+        _record_write(len(data))
+    except OSError:
+        # A read-only or full disk only costs the cache, not the figure
+        logger.exception("Could not cache mechanism figure %s", digest)
+    return data
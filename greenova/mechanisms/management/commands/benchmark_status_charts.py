@@ -0,0 +1,75 @@
+"""Management command to time the matplotlib and SVG status chart renderers."""
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from matplotlib import pyplot as plt
+from mechanisms.figures import get_mechanism_chart
+from mechanisms.models import EnvironmentalMechanism
+from mechanisms.svg_charts import render_mechanism_chart
+
+
+class Command(BaseCommand):
+    """Draw each mechanism's status chart with both renderers and compare."""
+
+    help = (
+        "Compare the time to draw mechanism status charts with matplotlib "
+        "and with the dependency-free SVG renderer"
+    )
+
+    def add_arguments(self, parser):
+        """Add the --repeat and --mechanisms options."""
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of times each chart is drawn by each renderer",
+        )
+        parser.add_argument(
+            "--mechanisms",
+            type=int,
+            default=20,
+            help="Maximum number of mechanisms to draw",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **options: dict[str, Any]) -> None:
+        """Time both renderers and report the mean time per chart."""
+        repeat = max(1, options["repeat"])
+        ids = list(
+            EnvironmentalMechanism.objects.order_by("pk").values_list("pk", flat=True)[
+                : options["mechanisms"]
+            ]
+        )
+        if not ids:
+            self.stdout.write(self.style.WARNING("No mechanisms to benchmark"))
+            return
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for mechanism_id in ids:
+                fig, _svg = get_mechanism_chart(mechanism_id)
+                plt.close(fig)
+        matplotlib_ms = (time.perf_counter() - started) * 1000
+
+        # Both renderers load the mechanism, so the comparison includes the query
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for mechanism_id in ids:
+                render_mechanism_chart(
+                    EnvironmentalMechanism.objects.get(pk=mechanism_id)
+                )
+        svg_ms = (time.perf_counter() - started) * 1000
+
+        charts = repeat * len(ids)
+        matplotlib_mean = matplotlib_ms / charts
+        svg_mean = svg_ms / charts
+        speedup = matplotlib_mean / svg_mean if svg_mean else float("inf")
+        self.stdout.write(f"matplotlib: {matplotlib_mean:.3f} ms per chart")
+        self.stdout.write(f"svg:        {svg_mean:.3f} ms per chart")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Drew {charts} charts per renderer; SVG renderer is "
+                f"{speedup:.1f}x faster"
+            )
+        )
@@ -0,0 +1,60 @@
+"""Management command to pre-render mechanism status charts into the cache."""
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from mechanisms.figure_cache import (
+    RENDERER_VERSION,
+    cache_stats,
+    reset_cache_stats,
+)
+from mechanisms.models import EnvironmentalMechanism
+
+
+class Command(BaseCommand):
+    """Render every mechanism status chart not cached for its current counts."""
+
+    help = (
+        "Render and cache the status chart of every mechanism that is not "
+        "cached for its current counts"
+    )
+
+    def add_arguments(self, parser):
+        """Add the --project option."""
+        parser.add_argument(
+            "--project",
+            type=int,
+            help="Only warm charts of the project with this id",
+        )
+
+    def handle(self, *args: tuple[Any, ...], **options: dict[str, Any]) -> None:
+        """Render the missing charts and report hits, misses and failures."""
+        mechanisms = EnvironmentalMechanism.objects.only(
+            "id",
+            "not_started_count",
+            "in_progress_count",
+            "completed_count",
+            "overdue_count",
+        ).order_by("pk")
+        if options.get("project"):
+            mechanisms = mechanisms.filter(project_id=options["project"])
+
+        reset_cache_stats()
+        started = time.perf_counter()
+        count = failed = 0
+        for mechanism in mechanisms.iterator():
+            count += 1
+            if mechanism.status_chart.error:
+                failed += 1
+        elapsed = time.perf_counter() - started
+        stats = cache_stats()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Warmed status charts for {count} mechanisms "
+                f"(renderer v{RENDERER_VERSION}) in {elapsed:.3f}s: "
+                f"{stats.misses} rendered, {stats.hits} already cached, "
+                f"{failed} failed"
+            )
+        )
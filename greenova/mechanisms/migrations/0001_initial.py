@@ -0,0 +1,52 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import mechanisms.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CounterCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('as_of', models.DateField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Counter Checkpoint',
+                'verbose_name_plural': 'Counter Checkpoints',
+            },
+        ),
+        migrations.CreateModel(
+            name='EnvironmentalMechanism',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('category', models.CharField(blank=True, max_length=100, null=True)),
+                ('reference_number', models.CharField(blank=True, max_length=50, null=True)),
+                ('effective_date', models.DateField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('not started', 'Not Started'), ('in progress', 'In Progress'), ('completed', 'Completed')], default='not started', max_length=20)),
+                ('not_started_count', models.IntegerField(default=0)),
+                ('in_progress_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('overdue_count', models.IntegerField(default=0)),
+                ('primary_environmental_mechanism', models.CharField(blank=True, max_length=255, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('status_chart', mechanisms.fields.MechanismStatusChartField()),
+            ],
+            options={
+                'verbose_name': 'Environmental Mechanism',
+                'verbose_name_plural': 'Environmental Mechanisms',
+                'ordering': ['name'],
+            },
+        ),
+    ]
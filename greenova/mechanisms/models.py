@@ -1,21 +1,68 @@
 import logging
+import time
 from builtins import property
+from collections.abc import Iterable
+from datetime import date
 
 from core.types import StatusData
-from django.core.exceptions import FieldError, ObjectDoesNotExist
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Q
 from django.db.models.query import QuerySet
-from django_matplotlib.fields import MatplotlibFigureField  # type: ignore
+from django.utils import timezone
 from obligations.constants import (
     STATUS_CHOICES,
     STATUS_COMPLETED,
     STATUS_IN_PROGRESS,
     STATUS_NOT_STARTED,
 )
-from obligations.utils import is_obligation_overdue
+from obligations.utils import get_overdue_q
+
+from .fields import MechanismStatusChartField
 
 logger = logging.getLogger(__name__)
 
+# Counter fields maintained on EnvironmentalMechanism
+COUNT_FIELDS: tuple[str, ...] = (
+    "not_started_count",
+    "in_progress_count",
+    "completed_count",
+    "overdue_count",
+)
+
+# CounterCheckpoint name for the overdue high-water mark
+OVERDUE_CHECKPOINT = "overdue"
+
+
+class CounterCheckpoint(models.Model):
+    """High-water mark recording the date mechanism counters are accurate for.
+
+    Overdue status depends on the current date, so ``overdue_count`` is kept
+    accurate as of ``as_of``. The overdue rollover job advances the mark and
+    adds the obligations whose due date was crossed in between.
+    """
+
+    name: models.CharField = models.CharField(max_length=50, primary_key=True)
+    as_of: models.DateField = models.DateField()
+    updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name: str = "Counter Checkpoint"
+        verbose_name_plural: str = "Counter Checkpoints"
+
+    def __str__(self) -> str:
+        return f"{self.name} @ {self.as_of}"
+
+    @classmethod
+    def reference_date(cls, name: str = OVERDUE_CHECKPOINT) -> date:
+        """Return the date counters are evaluated against (defaults to today)."""
+        as_of = cls.objects.filter(name=name).values_list("as_of", flat=True).first()
+        return as_of or timezone.now().date()
+
+    @classmethod
+    def record(cls, as_of: date, name: str = OVERDUE_CHECKPOINT) -> None:
+        """Store ``as_of`` as the high-water mark for ``name``."""
+        cls.objects.update_or_create(name=name, defaults={"as_of": as_of})
+
 
 class EnvironmentalMechanism(models.Model):
     """Represents an environmental mechanism that governs obligations."""
@@ -50,10 +97,9 @@ class EnvironmentalMechanism(models.Model):
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
 
-    # Add matplotlib figure fields
-    status_chart: MatplotlibFigureField = MatplotlibFigureField(
+    # Rendered from the instance's counters through mechanisms.figure_cache
+    status_chart: MechanismStatusChartField = MechanismStatusChartField(
         figure="mechanisms.figures.get_mechanism_chart",  # Full import path
-        plt_args=lambda obj: (obj.id,),  # type: ignore
         fig_width=300,
         fig_height=250,
         output_format="png",
@@ -74,35 +120,16 @@ def total_obligations(self) -> int:
         return self.not_started_count + self.in_progress_count + self.completed_count
 
     def update_obligation_counts(self) -> None:
-        """Update obligation counts based on related obligations."""
-        from obligations.models import Obligation
-
-        # Get all related obligations
-        obligations: QuerySet = Obligation.objects.filter(
-            primary_environmental_mechanism=self
-        )
-
-        # Reset counts
-        self.not_started_count = 0
-        self.in_progress_count = 0
-        self.completed_count = 0
-        self.overdue_count = 0
-
-        # Count obligations by status
-        for obligation in obligations:
-            status = obligation.status
+        """Recount obligation counts from scratch based on related obligations.
 
-            # Check if overdue using the utility function
-            if is_obligation_overdue(obligation):
-                self.overdue_count += 1
-
-            # Also count by regular status
-            if status == STATUS_NOT_STARTED:
-                self.not_started_count += 1
-            elif status == STATUS_IN_PROGRESS:
-                self.in_progress_count += 1
-            elif status == STATUS_COMPLETED:
-                self.completed_count += 1
+        Day-to-day changes are applied incrementally by ``mechanisms.counters``;
+        this full recount is the repair path for counters that have drifted.
+        """
+        counts = compute_mechanism_counts(
+            [self.pk], CounterCheckpoint.reference_date()
+        ).get(self.pk, {})
+        for field in COUNT_FIELDS:
+            setattr(self, field, counts.get(field, 0))
 
         self.save()
 
@@ -118,28 +145,76 @@ def get_status_data(self) -> StatusData:
         )
 
 
+def compute_mechanism_counts(
+    mechanism_ids: Iterable[int] | None = None, reference_date: date | None = None
+) -> dict[int, dict[str, int]]:
+    """
+    Count obligations per mechanism with a single GROUP BY query.
+
+    Args:
+        mechanism_ids: Optional mechanisms to restrict the count to
+        reference_date: Date used to evaluate overdue status (defaults to today)
+
+    Returns:
+        Mapping of mechanism id to its ``COUNT_FIELDS`` values. Mechanisms
+        without obligations are absent from the result.
+    """
+    from obligations.models import Obligation
+
+    obligations: QuerySet = Obligation.objects.filter(
+        primary_environmental_mechanism__isnull=False
+    )
+    if mechanism_ids is not None:
+        obligations = obligations.filter(
+            primary_environmental_mechanism_id__in=list(mechanism_ids)
+        )
+
+    rows = (
+        obligations.order_by()
+        .values("primary_environmental_mechanism_id")
+        .annotate(
+            not_started_count=Count("pk", filter=Q(status=STATUS_NOT_STARTED)),
+            in_progress_count=Count("pk", filter=Q(status=STATUS_IN_PROGRESS)),
+            completed_count=Count("pk", filter=Q(status=STATUS_COMPLETED)),
+            overdue_count=Count("pk", filter=get_overdue_q(reference_date)),
+        )
+    )
+    return {
+        row["primary_environmental_mechanism_id"]: {
+            field: row[field] for field in COUNT_FIELDS
+        }
+        for row in rows
+    }
+
+
 def update_all_mechanism_counts() -> int:
     """
     Update obligation counts for all mechanisms.
     Called after importing obligations to ensure counts are accurate.
+
+    All counts are computed with one aggregate query and written back with a
+    single ``bulk_update``. The overdue high-water mark is reset to today.
     """
-    mechanisms: QuerySet = EnvironmentalMechanism.objects.all().select_related(
-        "project"
+    started = time.perf_counter()
+    today = timezone.now().date()
+
+    with transaction.atomic():
+        counts = compute_mechanism_counts(reference_date=today)
+
+        mechanisms = list(EnvironmentalMechanism.objects.only("id", *COUNT_FIELDS))
+        for mechanism in mechanisms:
+            mechanism_counts = counts.get(mechanism.pk, {})
+            for field in COUNT_FIELDS:
+                setattr(mechanism, field, mechanism_counts.get(field, 0))
+
+        EnvironmentalMechanism.objects.bulk_update(
+            mechanisms, list(COUNT_FIELDS), batch_size=500
+        )
+        CounterCheckpoint.record(today)
+
+    logger.info(
+        "Updated counts for %s mechanisms in %.3fs",
+        len(mechanisms),
+        time.perf_counter() - started,
     )
-    updated_count: int = 0
-
-    for mechanism in mechanisms:
-        try:
-            mechanism.update_obligation_counts()
-            updated_count += 1
-        except (
-            ObjectDoesNotExist,  # Using imported exceptions
-            FieldError,
-            AttributeError,
-            ValueError,
-        ) as e:
-            logger.error(
-                "Error updating counts for mechanism %s: %s", mechanism.name, str(e)
-            )
-
-    return updated_count
+    return len(mechanisms)
@@ -1,5 +1,7 @@
 # Stub file for mechanisms.models
 
+from collections.abc import Iterable
+from datetime import date
 from typing import Any, TypeVar
 
 from django.db import models
@@ -42,6 +44,25 @@ def __init__(self, *args: Any, **kwargs: Any) -> None:
         """
         ...
 
+OVERDUE_CHECKPOINT: str
+
+class CounterCheckpoint(models.Model):
+    """High-water mark for date-dependent mechanism counters."""
+
+    objects: Manager[CounterCheckpoint]
+    name: str
+    as_of: date
+
+    @classmethod
+    def reference_date(cls, name: str = ...) -> date:
+        """Return the checkpoint date, or today if none is recorded."""
+        ...
+
+    @classmethod
+    def record(cls, as_of: date, name: str = ...) -> None:
+        """Store ``as_of`` as the checkpoint date."""
+        ...
+
 def update_all_mechanism_counts() -> int:
     """Update all mechanism counts.
 
@@ -49,3 +70,13 @@ def update_all_mechanism_counts() -> int:
         The number of mechanisms updated.
     """
     ...
+
+def compute_mechanism_counts(
+    mechanism_ids: Iterable[int] | None = None, reference_date: date | None = None
+) -> dict[int, dict[str, int]]:
+    """Count obligations per mechanism with a single GROUP BY query.
+
+    Returns:
+        Mapping of mechanism id to its counter values.
+    """
+    ...
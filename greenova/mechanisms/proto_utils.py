@@ -106,13 +106,13 @@ def serialize_mechanism_chart_data(
 
 def serialize_overall_chart_data(
     project_id: int,
-    mechanisms: QuerySet,  # QuerySet[EnvironmentalMechanism] if stubs available
+    mechanisms: QuerySet | Sequence[EnvironmentalMechanism],
 ) -> ChartData:
     """Serialize overall project data to protobuf for chart rendering.
 
     Args:
         project_id: ID of the project.
-        mechanisms: QuerySet of EnvironmentalMechanism objects.
+        mechanisms: EnvironmentalMechanism objects (a QuerySet or loaded list).
 
     Returns:
         ChartData protobuf message.
@@ -165,6 +165,26 @@ def serialize_chart_response(
     return response
 
 
+def serialize_project_charts(
+    project_id: int,
+    mechanisms: Sequence[EnvironmentalMechanism],
+) -> ChartResponse:
+    """Serialize the overall chart and every mechanism chart of a project.
+
+    The overall chart comes first, with ``mechanism_id`` 0.
+
+    Args:
+        project_id: ID of the project.
+        mechanisms: The project's mechanisms, already loaded.
+
+    Returns:
+        ChartResponse protobuf message.
+    """
+    charts = [serialize_overall_chart_data(project_id, mechanisms)]
+    charts.extend(serialize_mechanism_chart_data(mechanism) for mechanism in mechanisms)
+    return serialize_chart_response(charts)
+
+
 def status_string_to_enum(status: str) -> ObligationStatus:
     """Convert status string to ObligationStatus enum value.
 
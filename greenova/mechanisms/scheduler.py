@@ -0,0 +1,91 @@
+"""In-process scheduler for the nightly overdue counter rollover.
+
+Deployments without cron can set ``MECHANISM_OVERDUE_ROLLOVER_INTERVAL`` (in
+seconds) to have each web process run ``rollover_overdue_counts`` on a daemon
+timer. The rollover claims its date range atomically, so several processes
+sharing a database do not double count.
+
+The timer starts when a process serves its first request, so only server
+processes run it. Management commands (``migrate``, ``shell``, or
+``import_obligation_registers``, which forks a worker pool) and runserver's
+autoreloader parent never start the thread.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import DatabaseError, close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# The running timer, if any, under "timer"
+_state: dict[str, threading.Timer | None] = {"timer": None}
+_lock = threading.Lock()
+
+
+def _run(interval: float) -> None:
+    """Run one rollover and schedule the next."""
+    from .counters import rollover_overdue_counts
+
+    close_old_connections()
+    try:
+        rollover_overdue_counts()
+    except DatabaseError as e:
+        logger.error("Overdue counter rollover failed: %s", str(e))
+    finally:
+        close_old_connections()
+        _schedule(interval)
+
+
+def _schedule(interval: float) -> None:
+    timer = threading.Timer(interval, _run, args=(interval,))
+    timer.daemon = True
+    _state["timer"] = timer
+    timer.start()
+
+
+def start_overdue_rollover() -> bool:
+    """
+    Start the rollover timer if enabled in settings.
+
+    Returns:
+        bool: True if a timer was started by this call
+    """
+    interval = float(getattr(settings, "MECHANISM_OVERDUE_ROLLOVER_INTERVAL", 0))
+    if interval <= 0:
+        return False
+    with _lock:
+        if _state["timer"] is not None:
+            return False
+        _schedule(interval)
+    logger.info("Scheduled overdue counter rollover every %ss", interval)
+    return True
+
+
+def _start_on_first_request(sender, **kwargs) -> None:
+    request_started.disconnect(_start_on_first_request)
+    start_overdue_rollover()
+
+
+def start_overdue_rollover_on_request() -> bool:
+    """
+    Start the rollover timer with the first request, if enabled in settings.
+
+    Returns:
+        bool: True if the timer will start with the next request
+    """
+    if float(getattr(settings, "MECHANISM_OVERDUE_ROLLOVER_INTERVAL", 0)) <= 0:
+        return False
+    request_started.connect(_start_on_first_request)
+    return True
+
+
+def stop_overdue_rollover() -> None:
+    """Cancel the rollover timer, if running."""
+    with _lock:
+        timer = _state["timer"]
+        if timer is not None:
+            timer.cancel()
+            _state["timer"] = None
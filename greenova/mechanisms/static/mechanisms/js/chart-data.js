@@ -0,0 +1,104 @@
+/* eslint-env browser */
+/* global document, fetch, Plotly */
+/**
+ * Draw mechanism pie charts from the batched chart data endpoint.
+ *
+ * The chart grid names the endpoint in data-chart-source; every chart in the
+ * project arrives in one ChartResponse (as JSON) and is drawn into the
+ * container whose data-chart-id matches its mechanism_id.
+ */
+(function () {
+  'use strict';
+
+  const LAYOUT = {
+    margin: { l: 10, r: 10, t: 30, b: 10 },
+    legend: {
+      orientation: 'h',
+      yanchor: 'bottom',
+      y: -0.1,
+      xanchor: 'center',
+      x: 0.5,
+    },
+    autosize: true,
+    height: 320,
+    plot_bgcolor: 'rgba(0,0,0,0)',
+    paper_bgcolor: 'rgba(0,0,0,0)',
+  };
+
+  function pieTrace(chart) {
+    const segments = chart.segments || [];
+    const mechanismId = chart.mechanism_id || null;
+    return {
+      type: 'pie',
+      labels: segments.map((segment) => segment.label),
+      values: segments.map((segment) => segment.value),
+      marker: { colors: segments.map((segment) => segment.color) },
+      textinfo: 'percent',
+      hoverinfo: 'label+percent+value',
+      textfont: { size: 14, color: 'white' },
+      customdata: segments.map((segment) => ({
+        status: segment.label,
+        count: segment.value,
+        mechanism_id: mechanismId,
+        status_key: segment.label.toLowerCase().replace(/ /g, '_'),
+        color: segment.color,
+      })),
+      hovertemplate:
+        '<b>%{label}</b><br>' +
+        'Count: %{value}<br>' +
+        'Percentage: %{percent:.1%}<br>' +
+        '<extra></extra>',
+    };
+  }
+
+  function drawCharts(grid, response) {
+    response.charts.forEach((chart) => {
+      const container = grid.querySelector(
+        `[data-chart-id="${chart.mechanism_id}"]`
+      );
+      if (!container) return;
+      Plotly.newPlot(
+        container,
+        [pieTrace(chart)],
+        { ...LAYOUT, title: { text: chart.mechanism_name } },
+        { responsive: true, displaylogo: false }
+      );
+      container.removeAttribute('aria-busy');
+    });
+  }
+
+  function showError(grid, message) {
+    grid.querySelectorAll('[data-chart-id]').forEach((container) => {
+      container.textContent = message;
+      container.removeAttribute('aria-busy');
+    });
+  }
+
+  function loadCharts() {
+    document
+      .querySelectorAll('[data-chart-source]:not([data-charts-loaded])')
+      .forEach((grid) => {
+        grid.setAttribute('data-charts-loaded', 'true');
+        fetch(grid.dataset.chartSource, {
+          headers: { Accept: 'application/json' },
+          credentials: 'same-origin',
+        })
+          .then((response) => response.json())
+          .then((data) => {
+            if (data.error) {
+              showError(grid, data.error);
+            } else {
+              drawCharts(grid, data);
+            }
+          })
+          .catch(() => showError(grid, 'Charts could not be loaded'));
+      });
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', loadCharts);
+  } else {
+    loadCharts();
+  }
+  document.addEventListener('htmx:afterSettle', loadCharts);
+})();
@@ -0,0 +1,259 @@
+"""Dependency-free SVG renderer for status pie, donut and bar charts.
+
+Status charts have at most a handful of segments, so they are written
+directly as SVG paths and rectangles with the standard library. Each segment
+carries ``data-status``, ``data-count``, ``data-status-key``,
+``data-mechanism-id`` and ``data-color`` attributes and an
+``id="segment-<mechanism>-<status_key>"`` as expected by
+``chart-interactivity.js``, so no post-processing of the output is needed.
+"""
+
+import math
+from collections.abc import Sequence
+from html import escape
+from typing import NamedTuple
+
+STATUS_LABELS = ("Not Started", "In Progress", "Completed", "Overdue")
+STATUS_COLORS = ("#f9c74f", "#90be6d", "#43aa8b", "#f94144")
+TEXT_COLOR = "#374151"
+FONT_FAMILY = "system-ui, sans-serif"
+
+# Slices smaller than this share of the pie are not labelled
+MIN_LABELLED_SHARE = 0.05
+
+
+class StatusSlice(NamedTuple):
+    """One segment of a status chart."""
+
+    label: str
+    count: int
+    color: str
+
+    @property
+    def status_key(self) -> str:
+        return self.label.lower().replace(" ", "_")
+
+
+def status_slices(counts: Sequence[int]) -> list[StatusSlice]:
+    """Slices for mechanism counts given in ``STATUS_LABELS`` order."""
+    return [
+        StatusSlice(label, int(count), color)
+        for label, count, color in zip(STATUS_LABELS, counts, STATUS_COLORS)
+    ]
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _attrs(**attributes: object) -> str:
+    return " ".join(
+        f'{name.rstrip("_").replace("_", "-")}="{escape(str(value))}"'
+        for name, value in attributes.items()
+    )
+
+
+def _segment_attrs(item: StatusSlice, mechanism_id: int | None) -> str:
+    mechanism = "" if mechanism_id is None else str(mechanism_id)
+    return _attrs(
+        id=f"segment-{mechanism or 'all'}-{item.status_key}",
+        class_="status-segment",
+        fill=item.color,
+        data_status=item.label,
+        data_count=item.count,
+        data_status_key=item.status_key,
+        data_mechanism_id=mechanism,
+        data_color=item.color,
+    )
+
+
+def _tooltip(item: StatusSlice, total: int) -> str:
+    share = item.count / total if total else 0
+    return f"<title>{escape(item.label)}: {item.count} ({share:.1%})</title>"
+
+
+def _open(width: int, height: int, title: str | None, kind: str) -> list[str]:
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" '
+        f'{_attrs(width=width, height=height, viewBox=f"0 0 {width} {height}")} '
+        f'role="img" class="status-chart status-chart-{kind}"'
+        + (f' aria-label="{escape(title)}"' if title else "")
+        + ">"
+    ]
+    if title:
+        parts.append(f"<title>{escape(title)}</title>")
+    return parts
+
+
+def _no_data(parts: list[str], width: int, height: int) -> str:
+    parts.append(
+        f'<text {_attrs(x=_fmt(width / 2), y=_fmt(height / 2))} '
+        f'text-anchor="middle" dominant-baseline="middle" '
+        f'font-family="{FONT_FAMILY}" font-size="12" fill="{TEXT_COLOR}">'
+        "No data available</text></svg>"
+    )
+    return "".join(parts)
+
+
+def _point(cx: float, cy: float, radius: float, angle: float) -> tuple[str, str]:
+    # Angles run clockwise from 12 o'clock, like matplotlib's startangle=90
+    return (
+        _fmt(cx + radius * math.sin(angle)),
+        _fmt(cy - radius * math.cos(angle)),
+    )
+
+
+def _arc_path(
+    cx: float, cy: float, outer: float, inner: float, start: float, end: float
+) -> str:
+    large = 1 if end - start > math.pi else 0
+    x0, y0 = _point(cx, cy, outer, start)
+    x1, y1 = _point(cx, cy, outer, end)
+    if inner <= 0:
+        return (
+            f"M{_fmt(cx)} {_fmt(cy)}L{x0} {y0}"
+            f"A{_fmt(outer)} {_fmt(outer)} 0 {large} 1 {x1} {y1}Z"
+        )
+    ix0, iy0 = _point(cx, cy, inner, end)
+    ix1, iy1 = _point(cx, cy, inner, start)
+    return (
+        f"M{x0} {y0}A{_fmt(outer)} {_fmt(outer)} 0 {large} 1 {x1} {y1}"
+        f"L{ix0} {iy0}A{_fmt(inner)} {_fmt(inner)} 0 {large} 0 {ix1} {iy1}Z"
+    )
+
+
+def render_status_pie(
+    slices: Sequence[StatusSlice],
+    size: int = 240,
+    donut: float = 0.0,
+    title: str | None = None,
+    mechanism_id: int | None = None,
+) -> str:
+    """
+    Render a status pie (or donut) chart as SVG.
+
+    Args:
+        slices: Segments in drawing order, clockwise from 12 o'clock
+        size: Width and height in pixels
+        donut: Inner radius as a fraction of the outer radius (0 for a pie)
+        title: Accessible title of the chart
+        mechanism_id: Mechanism the chart belongs to, for the data attributes
+
+    Returns:
+        str: The SVG document
+    """
+    parts = _open(size, size, title, "donut" if donut else "pie")
+    total = sum(item.count for item in slices)
+    if total <= 0:
+        return _no_data(parts, size, size)
+
+    cx = cy = size / 2
+    outer = size / 2 - 2
+    inner = outer * min(max(donut, 0.0), 0.95)
+    label_radius = (outer + inner) / 2 if inner else outer * 0.65
+    start = 0.0
+    for item in slices:
+        if item.count <= 0:
+            continue
+        share = item.count / total
+        end = start + share * 2 * math.pi
+        attrs = _segment_attrs(item, mechanism_id)
+        if share >= 1:
+            # A single arc cannot close a full circle; draw the ring as circles
+            shape = (
+                f'<circle {attrs} {_attrs(cx=_fmt(cx), cy=_fmt(cy), r=_fmt(outer))}>'
+                if not inner
+                else f'<circle {attrs} fill-opacity="0" stroke="{item.color}" '
+                f'{_attrs(cx=_fmt(cx), cy=_fmt(cy), r=_fmt((outer + inner) / 2))} '
+                f'stroke-width="{_fmt(outer - inner)}">'
+            )
+            parts.append(f"{shape}{_tooltip(item, total)}</circle>")
+        else:
+            d = _arc_path(cx, cy, outer, inner, start, end)
+            parts.append(
+                f'<path {attrs} d="{d}" stroke="#fff" stroke-width="1">'
+                f"{_tooltip(item, total)}</path>"
+            )
+        if share >= MIN_LABELLED_SHARE:
+            x, y = _point(cx, cy, label_radius, (start + end) / 2)
+            parts.append(
+                f'<text x="{x}" y="{y}" text-anchor="middle" '
+                f'dominant-baseline="middle" font-family="{FONT_FAMILY}" '
+                f'font-size="11" fill="#fff" pointer-events="none">'
+                f"{share:.1%}</text>"
+            )
+        start = end
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def render_status_bars(
+    slices: Sequence[StatusSlice],
+    width: int = 320,
+    height: int = 200,
+    title: str | None = None,
+    mechanism_id: int | None = None,
+) -> str:
+    """
+    Render a status bar chart as SVG, one labelled bar per slice.
+
+    Args:
+        slices: Bars in left-to-right order
+        width: Width in pixels
+        height: Height in pixels
+        title: Accessible title of the chart
+        mechanism_id: Mechanism the chart belongs to, for the data attributes
+
+    Returns:
+        str: The SVG document
+    """
+    parts = _open(width, height, title, "bar")
+    total = sum(item.count for item in slices)
+    if not slices or total <= 0:
+        return _no_data(parts, width, height)
+
+    label_height = 18
+    plot_top = 16
+    plot_height = height - plot_top - label_height
+    slot = width / len(slices)
+    bar_width = slot * 0.6
+    tallest = max(item.count for item in slices)
+    for index, item in enumerate(slices):
+        bar_height = plot_height * item.count / tallest
+        x = slot * index + (slot - bar_width) / 2
+        y = plot_top + plot_height - bar_height
+        rect = _attrs(
+            x=_fmt(x), y=_fmt(y), width=_fmt(bar_width), height=_fmt(bar_height)
+        )
+        parts.append(
+            f"<rect {_segment_attrs(item, mechanism_id)} {rect}>"
+            f"{_tooltip(item, total)}</rect>"
+        )
+        centre = _fmt(x + bar_width / 2)
+        parts.append(
+            f'<text x="{centre}" y="{_fmt(y - 4)}" text-anchor="middle" '
+            f'font-family="{FONT_FAMILY}" font-size="11" fill="{TEXT_COLOR}">'
+            f"{item.count}</text>"
+            f'<text x="{centre}" y="{_fmt(height - 4)}" text-anchor="middle" '
+            f'font-family="{FONT_FAMILY}" font-size="11" fill="{TEXT_COLOR}">'
+            f"{escape(item.label)}</text>"
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def render_mechanism_chart(mechanism, size: int = 240, donut: float = 0.0) -> str:
+    """Render a mechanism's status counters as an SVG pie or donut chart."""
+    counts = (
+        mechanism.not_started_count,
+        mechanism.in_progress_count,
+        mechanism.completed_count,
+        mechanism.overdue_count,
+    )
+    return render_status_pie(
+        status_slices(counts),
+        size=size,
+        donut=donut,
+        title=mechanism.name,
+        mechanism_id=mechanism.id,
+    )
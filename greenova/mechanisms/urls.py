@@ -11,6 +11,7 @@
         "", views.MechanismListView.as_view(), name="list"
     ),  # Fixed class name from MechanismsListView to MechanismListView
     path("charts/", views.MechanismChartView.as_view(), name="mechanism_charts"),
+    path("charts/data/", views.MechanismChartDataView.as_view(), name="chart_data"),
     path(
         "insights/", views.ObligationInsightView.as_view(), name="obligation_insights"
     ),
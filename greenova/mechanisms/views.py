@@ -15,10 +15,13 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.urls import reverse
 from django.utils.decorators import method_decorator
+from django.views import View
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_headers
 from django.views.generic import ListView, TemplateView
+from google.protobuf import json_format
 from obligations.constants import (
     STATUS_COMPLETED,
     STATUS_IN_PROGRESS,
@@ -28,13 +31,17 @@
 from obligations.models import Obligation
 from projects.models import Project
 
-from .figures import get_mechanism_plotly_chart, get_overall_plotly_chart
 from .models import EnvironmentalMechanism
+from .proto_utils import serialize_chart_response, serialize_project_charts
 
 matplotlib.use("Agg")  # Use Agg backend for non-interactive plotting
 
 logger = logging.getLogger(__name__)
 
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+# The first type is served when the Accept header has no preference
+CHART_DATA_CONTENT_TYPES = ["application/json", PROTOBUF_CONTENT_TYPE]
+
 
 @method_decorator(cache_control(max_age=60), name="dispatch")
 @method_decorator(vary_on_headers("HX-Request"), name="dispatch")
@@ -178,8 +185,9 @@ def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
 class MechanismChartView(LoginRequiredMixin, TemplateView):
     """View for displaying mechanism charts for a selected project.
 
-    This view generates and provides interactive Plotly charts for the overall project
-    status and for each environmental mechanism within the selected project.
+    This view renders a placeholder for the overall project status chart and for
+    each environmental mechanism within the selected project. The charts are drawn
+    client-side with Plotly JS from a single MechanismChartDataView request.
     """
 
     template_name = "mechanisms/mechanism_charts.html"
@@ -188,8 +196,8 @@ class MechanismChartView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """Get context data for rendering mechanism charts.
 
-        Retrieves the project, mechanisms, and generates chart HTML for both the overall
-        project status and each individual mechanism.
+        Retrieves the project and mechanisms, and lists the charts to draw for both
+        the overall project status and each individual mechanism.
 
         Args:
             **kwargs: Additional keyword arguments.
@@ -216,30 +224,23 @@ def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         try:
             # Check if project exists
             project = Project.objects.get(id=project_id)
-            mechanisms = EnvironmentalMechanism.objects.filter(project_id=project_id)
-            mechanism_charts = []
-
-            # Add overall chart first (plotly)
-            overall_chart_html = get_overall_plotly_chart(project_id)
-            mechanism_charts.append(
-                {
-                    "name": "Overall Status",
-                    "chart_html": overall_chart_html,
-                }
+            mechanisms = list(
+                EnvironmentalMechanism.objects.filter(project_id=project_id)
             )
 
-            # Generate charts for individual mechanisms (plotly)
-            for mechanism in mechanisms:
-                chart_html = get_mechanism_plotly_chart(mechanism.id)
-                mechanism_charts.append(
-                    {
-                        "id": mechanism.id,
-                        "name": mechanism.name,
-                        "chart_html": chart_html,
-                    }
-                )
+            # Only chart placeholders are rendered here; the client fetches
+            # every chart's data in one request and draws it with Plotly JS
+            mechanism_charts: list[dict[str, Any]] = [
+                {"id": 0, "name": "Overall Status"}
+            ]
+            mechanism_charts.extend(
+                {"id": mechanism.id, "name": mechanism.name} for mechanism in mechanisms
+            )
 
             context["mechanism_charts"] = mechanism_charts
+            context["chart_data_url"] = (
+                f"{reverse('mechanisms:chart_data')}?project_id={project_id}"
+            )
             context["project"] = project
 
             # Add table data with mechanism ID
@@ -264,6 +265,64 @@ def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             return context
 
 
+@method_decorator(cache_control(max_age=60), name="dispatch")
+@method_decorator(vary_on_headers("Accept"), name="dispatch")
+class MechanismChartDataView(LoginRequiredMixin, View):
+    """Chart data for every mechanism of a project in one ``ChartResponse``.
+
+    The overall project chart comes first (``mechanism_id`` 0), followed by
+    each mechanism's chart. The response is serialized protobuf when the
+    client prefers ``application/x-protobuf`` and JSON otherwise.
+    """
+
+    @beartype  # type: ignore[misc]
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Return the project's ChartResponse as protobuf or JSON.
+
+        Args:
+            request: The HTTP request, with a ``project_id`` parameter.
+            *args: Variable positional arguments.
+            **kwargs: Variable keyword arguments.
+
+        Returns:
+            The serialized ChartResponse; errors are reported in its ``error``
+            field with a 4xx status.
+        """
+        status = 200
+        try:
+            project_id = int(request.GET.get("project_id", ""))
+        except ValueError:
+            chart_response = serialize_chart_response([], "Invalid project ID")
+            status = 400
+        else:
+            mechanisms = list(
+                EnvironmentalMechanism.objects.filter(project_id=project_id).order_by(
+                    "pk"
+                )
+            )
+            if mechanisms or Project.objects.filter(pk=project_id).exists():
+                chart_response = serialize_project_charts(project_id, mechanisms)
+            else:
+                chart_response = serialize_chart_response([], "Project not found")
+                status = 404
+
+        content_type = request.get_preferred_type(CHART_DATA_CONTENT_TYPES)
+        if content_type == PROTOBUF_CONTENT_TYPE:
+            return HttpResponse(
+                chart_response.SerializeToString(),
+                content_type=PROTOBUF_CONTENT_TYPE,
+                status=status,
+            )
+        return JsonResponse(
+            json_format.MessageToDict(
+                chart_response,
+                always_print_fields_with_no_presence=True,
+                preserving_proto_field_name=True,
+            ),
+            status=status,
+        )
+
+
 class MechanismListView(LoginRequiredMixin, ListView):
     """List all environmental mechanisms.
 
@@ -8,6 +8,7 @@
 from django.http import HttpRequest
 from django.utils import timezone
 
+from .forecasting import update_recurring_dates
 from .models import Obligation, ObligationEvidence
 from .utils import is_obligation_overdue
 
@@ -122,7 +123,8 @@ class ObligationEvidenceInline(admin.TabularInline):
 
     model = ObligationEvidence
     extra = 1
-    fields = ["file", "description"]
+    fields = ["file", "description", "file_size", "content_type"]
+    readonly_fields = ["file_size", "content_type"]
     verbose_name = "Evidence File"
     verbose_name_plural = "Evidence Files"
 
@@ -271,10 +273,6 @@ def save_model(
                 obj.project.name,
             )
             super().save_model(request, obj, form, change)
-
-            # Update mechanism counts
-            if obj.primary_environmental_mechanism:
-                obj.primary_environmental_mechanism.update_obligation_counts()
         except Exception as e:
             logger.error("Error saving obligation: %s", str(e))
             raise
@@ -284,11 +282,7 @@ def save_model(
     @admin.action(description="Update recurring forecasted dates")
     def update_recurring_dates(self, request, queryset):
         """Update recurring forecasted dates for selected obligations."""
-        count = 0
-        for obligation in queryset:
-            if obligation.update_recurring_forecasted_date():
-                obligation.save()
-                count += 1
+        count = update_recurring_dates(queryset)
 
         self.message_user(
             request, f"Successfully updated {count} recurring forecasted dates"
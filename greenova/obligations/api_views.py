@@ -12,7 +12,9 @@
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
+from .constants import STATUS_COMPLETED
 from .models import Obligation
+from .transitions import transition_status
 
 if TYPE_CHECKING:
     UserModel = AbstractUser
@@ -130,9 +132,8 @@ def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
             return error_response
 
         try:
-            updated_count: int = Obligation.objects.filter(
-                obligation_number__in=ids
-            ).update(status="Complete")
+            result = transition_status(ids, STATUS_COMPLETED)
+            updated_count = len(result.updated) + len(result.rolled_over)
 
             logger.info(
                 "User %s marked %d obligations as complete. IDs: %s",
@@ -144,7 +145,10 @@ def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
             return JsonResponse(
                 {
                     "message": f"{updated_count} obligations marked as complete.",
-                    "updated_ids": ids,
+                    "updated_ids": result.updated,
+                    "rolled_over_ids": result.rolled_over,
+                    "unchanged_ids": result.unchanged,
+                    "missing_ids": result.missing,
                 },
                 status=200,
             )
@@ -1,6 +1,20 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def create_search_index(sender, using, **kwargs):
+    """Create the full-text search index once the tables exist."""
+    from .search import ensure_search_index
+
+    ensure_search_index(using)
 
 
 class ObligationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "obligations"
+
+    def ready(self):
+        """Keep the search index in place and connect preview generation."""
+        from . import previews  # noqa: F401
+
+        post_migrate.connect(create_search_index, sender=self)
@@ -1,3 +1,6 @@
+# Obligation number format
+OBLIGATION_NUMBER_PREFIX = "PCEMP-"
+
 # Status choices for Obligation model
 STATUS_NOT_STARTED = "not started"
 STATUS_IN_PROGRESS = "in progress"
@@ -0,0 +1,212 @@
+"""Streaming CSV and XLSX export of obligations.
+
+Rows are read with ``values_list(...).iterator(chunk_size=...)`` and encoded
+as they arrive, so memory use stays flat whatever the number of obligations.
+XLSX output is produced with the standard library: the workbook is a ZIP
+archive written to an unseekable stream, and the worksheet XML is written
+row by row with inline strings, so no spreadsheet library is needed and
+nothing is buffered beyond the current chunk.
+"""
+
+import csv
+import re
+import zipfile
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from typing import Any
+from xml.sax.saxutils import escape
+
+from django.db.models import QuerySet
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# (lookup, column header) pairs in export order
+EXPORT_COLUMNS: list[tuple[str, str]] = [
+    ("obligation_number", "Obligation Number"),
+    ("project__name", "Project"),
+    ("primary_environmental_mechanism__name", "Environmental Mechanism"),
+    ("procedure", "Procedure"),
+    ("environmental_aspect", "Environmental Aspect"),
+    ("obligation", "Obligation"),
+    ("accountability", "Accountability"),
+    ("responsibility", "Responsibility"),
+    ("project_phase", "Project Phase"),
+    ("action_due_date", "Action Due Date"),
+    ("close_out_date", "Close Out Date"),
+    ("status", "Status"),
+    ("supporting_information", "Supporting Information"),
+    ("general_comments", "General Comments"),
+    ("compliance_comments", "Compliance Comments"),
+    ("non_conformance_comments", "Non-Conformance Comments"),
+    ("evidence_notes", "Evidence Notes"),
+    ("recurring_obligation", "Recurring"),
+    ("recurring_frequency", "Recurring Frequency"),
+    ("recurring_forcasted_date", "Recurring Forecasted Date"),
+    ("inspection", "Inspection"),
+    ("inspection_frequency", "Inspection Frequency"),
+    ("site_or_desktop", "Site or Desktop"),
+    ("obligation_type", "Obligation Type"),
+    ("updated_at", "Last Updated"),
+]
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def export_headers() -> list[str]:
+    return [header for _lookup, header in EXPORT_COLUMNS]
+
+
+def iter_export_rows(
+    queryset: QuerySet, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple[Any, ...]]:
+    """Yield export rows from ``queryset`` a chunk at a time."""
+    lookups = [lookup for lookup, _header in EXPORT_COLUMNS]
+    return (
+        queryset.order_by("obligation_number")
+        .values_list(*lookups)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    return str(value)
+
+
+class _Echo:
+    """File-like object whose ``write`` returns the value instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(
+    rows: Iterable[tuple[Any, ...]], headers: list[str] | None = None
+) -> Iterator[str]:
+    """Encode rows as CSV lines, one yielded string per row."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(headers or export_headers())
+    for row in rows:
+        yield writer.writerow([_cell_text(value) for value in row])
+
+
+class _ChunkBuffer:
+    """Unseekable sink that collects bytes written by ``zipfile``."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats'
+    '.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Obligations" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats'
+    '.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/></Relationships>'
+)
+_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    "<sheetData>"
+)
+_SHEET_END = "</sheetData></worksheet>"
+
+# Characters XML 1.0 does not allow; Excel rejects a sheet containing them
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+def _xlsx_row(values: Iterable[Any]) -> str:
+    cells = []
+    for value in values:
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            text = escape(_XML_ILLEGAL.sub("", _cell_text(value)))
+            cells.append(
+                f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+            )
+    return f"<row>{''.join(cells)}</row>"
+
+
+def stream_xlsx(
+    rows: Iterable[tuple[Any, ...]],
+    headers: list[str] | None = None,
+    rows_per_flush: int = 500,
+) -> Iterator[bytes]:
+    """
+    Encode rows as a single-sheet XLSX workbook, yielding compressed bytes.
+
+    Args:
+        rows: Row tuples in ``EXPORT_COLUMNS`` order
+        headers: Header row (defaults to the export headers)
+        rows_per_flush: Rows written between yields
+
+    Yields:
+        bytes: Consecutive pieces of the XLSX file
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _ROOT_RELS)
+        archive.writestr("xl/workbook.xml", _WORKBOOK)
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_SHEET_START.encode())
+            sheet.write(_xlsx_row(headers or export_headers()).encode())
+            for count, row in enumerate(rows, 1):
+                sheet.write(_xlsx_row(row).encode())
+                if count % rows_per_flush == 0:
+                    yield buffer.drain()
+            sheet.write(_SHEET_END.encode())
+        yield buffer.drain()
+    yield buffer.drain()
@@ -0,0 +1,113 @@
+"""Obligation list filters shared by views and management commands."""
+
+from datetime import date, timedelta
+from typing import Any
+
+from django.db.models import Q, QuerySet
+from django.http import QueryDict
+
+from .models import Obligation
+from .search import search_obligations
+from .utils import get_overdue_q
+
+# Status filter values, as sent by the UI, mapped to model values
+STATUS_ALIASES: dict[str, str] = {
+    "not_started": "not started",
+    "not started": "not started",
+    "in_progress": "in progress",
+    "in progress": "in progress",
+    "completed": "completed",
+    "overdue": "overdue",
+}
+
+# Due date windows accepted by the date_filter parameter, in days from today
+DUE_WINDOWS: dict[str, int] = {"14days": 14, "30days": 30}
+
+
+def filter_by_status(
+    queryset: QuerySet[Obligation], status_values: list[str]
+) -> QuerySet[Obligation]:
+    """Filter obligations by status, handling 'overdue' as a special case.
+
+    Args:
+        queryset: Base queryset.
+        status_values: List of status values to filter by.
+
+    Returns:
+        Filtered queryset.
+    """
+    canonical_statuses = [
+        STATUS_ALIASES.get(s.replace("_", " ").lower(), s.replace("_", " ").lower())
+        for s in status_values
+    ]
+    # 'overdue' isn't a database value: action_due_date < today and status !=
+    # completed. Combined with OR rather than union() so the result can be
+    # filtered further.
+    if "overdue" in canonical_statuses:
+        standard_statuses = [s for s in canonical_statuses if s != "overdue"]
+        return queryset.filter(Q(status__in=standard_statuses) | get_overdue_q())
+
+    if canonical_statuses:
+        return queryset.filter(status__in=canonical_statuses)
+    return queryset
+
+
+def apply_filters(
+    queryset: QuerySet[Obligation], filters: dict[str, Any]
+) -> QuerySet[Obligation]:
+    """Apply all filters to the queryset.
+
+    Args:
+        queryset: Base queryset.
+        filters: Dictionary of filter values, as returned by parse_filters().
+
+    Returns:
+        Filtered queryset.
+    """
+    if filters.get("status"):
+        queryset = filter_by_status(queryset, filters["status"])
+    if filters.get("phase"):
+        queryset = queryset.filter(project_phase__in=filters["phase"])
+    if filters.get("search"):
+        queryset = search_obligations(queryset, filters["search"])
+    date_filter = filters.get("date_filter")
+    if date_filter == "past_due":
+        queryset = queryset.overdue(date.today())
+    elif date_filter in DUE_WINDOWS:
+        today = date.today()
+        queryset = queryset.filter(
+            action_due_date__gte=today,
+            action_due_date__lte=today + timedelta(days=DUE_WINDOWS[date_filter]),
+        )
+    return queryset
+
+
+def parse_filters(query: QueryDict) -> dict[str, Any]:
+    """Extract and normalize filter parameters from a query string.
+
+    Args:
+        query: The request's GET parameters.
+
+    Returns:
+        Dictionary of filter parameters.
+    """
+    filters: dict[str, Any] = {}
+
+    status = query.getlist("status") or query.getlist("status[]")
+    phase = query.getlist("phase") or query.getlist("phase[]")
+    search = query.get("search", "")
+    date_filter = query.get("date_filter", "")
+
+    if status:
+        filters["status"] = [s.strip().lower() for s in status]
+    if phase:
+        filters["phase"] = [p.strip() for p in phase if p.strip()]
+    if search:
+        filters["search"] = search
+    if date_filter:
+        filters["date_filter"] = date_filter
+
+    # Sort parameters, with defaults
+    filters["sort"] = query.get("sort", "obligation_number")
+    filters["order"] = query.get("order", "asc")
+    return filters
@@ -0,0 +1,188 @@
+"""Batch forecasting of recurring obligation dates.
+
+``Obligation.calculate_next_recurring_date`` works on one instance at a time.
+For bulk recalculation the same rules are applied column-wise: the relevant
+columns are loaded with ``values_list``, each distinct frequency string is
+normalized once, the next dates are computed with NumPy ``datetime64``
+arithmetic and only changed rows are written back with ``bulk_update``.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from datetime import date
+
+import numpy as np
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .constants import (
+    FREQUENCY_ANNUAL,
+    FREQUENCY_BIANNUAL,
+    FREQUENCY_DAILY,
+    FREQUENCY_FORTNIGHTLY,
+    FREQUENCY_MONTHLY,
+    FREQUENCY_QUARTERLY,
+    FREQUENCY_WEEKLY,
+)
+from .utils import normalize_frequency
+
+logger = logging.getLogger(__name__)
+
+# (months, days) added for each canonical frequency
+FREQUENCY_OFFSETS: dict[str, tuple[int, int]] = {
+    FREQUENCY_DAILY: (0, 1),
+    FREQUENCY_WEEKLY: (0, 7),
+    FREQUENCY_FORTNIGHTLY: (0, 14),
+    FREQUENCY_MONTHLY: (1, 0),
+    FREQUENCY_QUARTERLY: (3, 0),
+    FREQUENCY_BIANNUAL: (6, 0),
+    FREQUENCY_ANNUAL: (12, 0),
+}
+DEFAULT_FREQUENCY_OFFSET = FREQUENCY_OFFSETS[FREQUENCY_MONTHLY]
+
+
+def frequency_offsets(frequencies: Iterable[str]) -> dict[str, tuple[int, int]]:
+    """
+    Resolve raw frequency strings to ``(months, days)`` offsets.
+
+    Each distinct value is normalized once. Unrecognized frequencies fall back
+    to monthly, matching ``Obligation.calculate_next_recurring_date``.
+
+    Args:
+        frequencies: Raw ``recurring_frequency`` values
+
+    Returns:
+        dict: Mapping of raw frequency to its offset
+    """
+    offsets = {}
+    for frequency in set(frequencies):
+        offset = FREQUENCY_OFFSETS.get(normalize_frequency(frequency))
+        if offset is None:
+            logger.warning(
+                "Unrecognized frequency '%s' - defaulting to monthly", frequency
+            )
+            offset = DEFAULT_FREQUENCY_OFFSET
+        offsets[frequency] = offset
+    return offsets
+
+
+def add_months(dates: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """
+    Add whole months to ``datetime64[D]`` dates, clamping to the month end.
+
+    This mirrors ``relativedelta(months=n)``: 31 January plus one month is
+    28 or 29 February.
+    """
+    month_start = dates.astype("datetime64[M]")
+    day_offset = dates - month_start.astype("datetime64[D]")
+    target = month_start + months.astype("timedelta64[M]")
+    target_start = target.astype("datetime64[D]")
+    month_length = (target + 1).astype("datetime64[D]") - target_start
+    return target_start + np.minimum(day_offset, month_length - 1)
+
+
+def forecast_next_dates(
+    base_dates: np.ndarray,
+    months: np.ndarray,
+    days: np.ndarray,
+    today: date | None = None,
+) -> np.ndarray:
+    """
+    Compute the next recurring dates for arrays of base dates and offsets.
+
+    Base dates in the past are moved to ``today`` first, as in
+    ``Obligation.calculate_next_recurring_date``.
+
+    Args:
+        base_dates: ``datetime64[D]`` array of forecast/due dates
+        months: Month offsets per row
+        days: Day offsets per row
+        today: Reference date (defaults to today)
+
+    Returns:
+        np.ndarray: ``datetime64[D]`` array of next dates
+    """
+    today64 = np.datetime64(today or timezone.now().date(), "D")
+    base = np.maximum(base_dates.astype("datetime64[D]"), today64)
+    return add_months(base, months) + days.astype("timedelta64[D]")
+
+
+def update_recurring_dates(
+    queryset: QuerySet | None = None,
+    batch_size: int = 500,
+    today: date | None = None,
+) -> int:
+    """
+    Recalculate recurring forecasted dates in bulk.
+
+    Rows are written with ``bulk_update``, so model signals are not sent; the
+    forecast date does not feed any counter or derived field.
+
+    Args:
+        queryset: Obligations to consider (defaults to all)
+        batch_size: Rows per ``bulk_update`` statement
+        today: Reference date (defaults to today)
+
+    Returns:
+        int: Number of obligations whose forecast changed
+    """
+    from .models import Obligation
+
+    started = time.perf_counter()
+    today = today or timezone.now().date()
+    if queryset is None:
+        queryset = Obligation.objects.all()
+
+    rows = list(
+        queryset.filter(recurring_obligation=True)
+        .order_by()
+        .values_list(
+            "pk", "recurring_frequency", "recurring_forcasted_date", "action_due_date"
+        )
+    )
+    if not rows:
+        return 0
+
+    pks, frequencies, forecasts, due_dates = zip(*rows, strict=True)
+    offsets = frequency_offsets(f for f in frequencies if f)
+    has_frequency = np.array([bool(f) for f in frequencies])
+    months = np.array([offsets[f][0] if f else 0 for f in frequencies])
+    days = np.array([offsets[f][1] if f else 0 for f in frequencies])
+
+    current = np.array(forecasts, dtype="datetime64[D]")
+    base = np.where(
+        np.isnat(current), np.array(due_dates, dtype="datetime64[D]"), current
+    )
+    base = np.where(np.isnat(base), np.datetime64(today, "D"), base)
+
+    next_dates = forecast_next_dates(base, months, days, today)
+    next_dates = np.where(has_frequency, next_dates, np.datetime64("NaT"))
+
+    unchanged = (next_dates == current) | (np.isnat(next_dates) & np.isnat(current))
+    changed = np.flatnonzero(~unchanged)
+    updates = [
+        Obligation(
+            pk=pks[i],
+            recurring_forcasted_date=(
+                None if np.isnat(next_dates[i]) else next_dates[i].item()
+            ),
+        )
+        for i in changed
+    ]
+
+    with transaction.atomic():
+        Obligation.objects.bulk_update(
+            updates, ["recurring_forcasted_date"], batch_size=batch_size
+        )
+
+    logger.info(
+        "Forecast %s recurring obligations (%s changed, %s distinct frequencies) "
+        "in %.3fs",
+        len(rows),
+        len(updates),
+        len(offsets),
+        time.perf_counter() - started,
+    )
+    return len(updates)
@@ -0,0 +1,257 @@
+"""Batched writing of imported obligations.
+
+Saving imported rows one at a time costs an existence query, a mechanism
+lookup and a full ``save()`` with every model signal per row.
+``ObligationBatchWriter`` takes cleaned rows a batch at a time instead: it
+prefetches the batch's existing obligation numbers and mechanisms with one
+query each, creates missing mechanisms in bulk, splits the rows into creates
+and updates, writes them with ``bulk_create``/``bulk_update`` and recomputes
+recurring forecasts for the batch in bulk. Mechanism counts are recomputed
+once by ``finish()`` after the last batch.
+
+Model signals are not sent for bulk writes, so the per-row counter and
+recurring rollover receivers do not run: statuses are stored as given in the
+register, and counts are rebuilt from scratch at the end.
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from django.db import transaction
+from django.utils import timezone
+from mechanisms.models import EnvironmentalMechanism, update_all_mechanism_counts
+from projects.models import Project
+
+from .constants import OBLIGATION_NUMBER_PREFIX
+from .forecasting import update_recurring_dates
+from .models import Obligation, ObligationNumberSequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 500
+# Set by the writer rather than taken from the cleaned row data
+_RELATED_FIELDS = ("project", "primary_environmental_mechanism")
+
+
+class ImportRecord(NamedTuple):
+    """A cleaned import row and the name of its environmental mechanism."""
+
+    data: dict[str, Any]
+    mechanism: str | None
+
+
+@dataclass
+class ImportStats:
+    """Running totals for an import."""
+
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped: int = 0
+    mechanisms_created: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def add(self, other: "ImportStats") -> None:
+        """Add another batch's row counts to these totals."""
+        self.rows += other.rows
+        self.created += other.created
+        self.updated += other.updated
+        self.skipped += other.skipped
+        self.batches += other.batches
+
+
+def _number_value(obligation_number: str) -> int | None:
+    suffix = obligation_number.removeprefix(OBLIGATION_NUMBER_PREFIX)
+    return int(suffix) if suffix.isdigit() else None
+
+
+class ObligationBatchWriter:
+    """
+    Write cleaned obligation rows for one project in batches.
+
+    Args:
+        project: Project the obligations belong to
+        force_update: Overwrite existing obligations instead of skipping them
+    """
+
+    def __init__(self, project: Project, force_update: bool = False) -> None:
+        self.project = project
+        self.force_update = force_update
+        self.stats = ImportStats()
+        self._mechanisms: dict[str, EnvironmentalMechanism | None] = {}
+        self._started = time.perf_counter()
+
+    def _resolve_mechanisms(self, names: set[str]) -> None:
+        """Load or create the mechanisms named in a batch, one query each."""
+        names -= self._mechanisms.keys()
+        if not names:
+            return
+
+        found: dict[str, list[EnvironmentalMechanism]] = {}
+        for mechanism in EnvironmentalMechanism.objects.filter(
+            project=self.project, name__in=names
+        ):
+            found.setdefault(mechanism.name, []).append(mechanism)
+
+        missing_primary = []
+        for name, mechanisms in found.items():
+            if len(mechanisms) > 1:
+                logger.error(
+                    "Multiple mechanisms found for %s in project %s",
+                    name,
+                    self.project.name,
+                )
+                self._mechanisms[name] = None
+                continue
+            (mechanism,) = mechanisms
+            if not mechanism.primary_environmental_mechanism:
+                mechanism.primary_environmental_mechanism = name
+                missing_primary.append(mechanism)
+            self._mechanisms[name] = mechanism
+        if missing_primary:
+            EnvironmentalMechanism.objects.bulk_update(
+                missing_primary, ["primary_environmental_mechanism"]
+            )
+
+        new = [
+            EnvironmentalMechanism(
+                name=name, project=self.project, primary_environmental_mechanism=name
+            )
+            for name in sorted(names - found.keys())
+        ]
+        for mechanism in EnvironmentalMechanism.objects.bulk_create(new):
+            logger.info(
+                "Created new mechanism: %s for project %s",
+                mechanism.name,
+                self.project.name,
+            )
+            self._mechanisms[mechanism.name] = mechanism
+        self.stats.mechanisms_created += len(new)
+
+    def _build(self, record: ImportRecord, obligation_number: str) -> Obligation:
+        data = {
+            **record.data,
+            "obligation_number": obligation_number,
+            "project": self.project,
+            "primary_environmental_mechanism": self._mechanisms.get(
+                (record.mechanism or "").strip()
+            ),
+        }
+        return Obligation(**data)
+
+    def write(self, records: Iterable[ImportRecord]) -> ImportStats:
+        """
+        Write one batch of records in a single transaction.
+
+        Args:
+            records: Cleaned rows; rows without an obligation number are
+                given newly reserved numbers
+
+        Returns:
+            ImportStats: Totals for this batch
+        """
+        records = list(records)
+        batch = ImportStats(rows=len(records), batches=1)
+        if not records:
+            return batch
+
+        with transaction.atomic():
+            self._resolve_mechanisms(
+                {name.strip() for r in records if (name := r.mechanism)} - {""}
+            )
+
+            unnumbered = [r for r in records if not r.data.get("obligation_number")]
+            reserved = iter(Obligation.reserve_obligation_numbers(len(unnumbered)))
+            keyed: dict[str, ImportRecord] = {}
+            replaced = 0
+            for record in records:
+                raw_number = record.data.get("obligation_number") or next(reserved)
+                number = Obligation.canonical_obligation_number(raw_number)
+                if number in keyed:
+                    # Repeated numbers behave as if the first row already existed
+                    if not self.force_update:
+                        batch.skipped += 1
+                        continue
+                    replaced += 1
+                keyed[number] = record
+
+            existing = set(
+                Obligation.objects.filter(pk__in=list(keyed)).values_list(
+                    "pk", flat=True
+                )
+            )
+            creates = [
+                self._build(record, number)
+                for number, record in keyed.items()
+                if number not in existing
+            ]
+            updates = []
+            if self.force_update:
+                updates = [
+                    self._build(record, number)
+                    for number, record in keyed.items()
+                    if number in existing
+                ]
+            else:
+                batch.skipped += len(existing)
+
+            if creates:
+                Obligation.objects.bulk_create(creates)
+                highest = max(
+                    (_number_value(o.obligation_number) or 0 for o in creates),
+                    default=0,
+                )
+                if highest:
+                    ObligationNumberSequence.observe(
+                        Obligation.format_obligation_number(highest)
+                    )
+            if updates:
+                now = timezone.now()
+                for obligation in updates:
+                    obligation.updated_at = now
+                fields = {*records[0].data, *_RELATED_FIELDS, "updated_at"}
+                fields.discard("obligation_number")
+                Obligation.objects.bulk_update(updates, sorted(fields), batch_size=500)
+
+            recurring = [
+                o.obligation_number for o in creates + updates if o.recurring_obligation
+            ]
+            if recurring:
+                update_recurring_dates(Obligation.objects.filter(pk__in=recurring))
+
+        batch.created = len(creates)
+        batch.updated = len(updates) + replaced
+        self.stats.add(batch)
+        return batch
+
+    def finish(self, refresh_counts: bool = True) -> ImportStats:
+        """
+        Recompute mechanism counts once and return the import totals.
+
+        Args:
+            refresh_counts: Recompute counts now; callers running several
+                writers pass False and call ``update_all_mechanism_counts``
+                once after the last one finishes
+        """
+        if refresh_counts and (self.stats.created or self.stats.updated):
+            update_all_mechanism_counts()
+        self.stats.seconds = time.perf_counter() - self._started
+        logger.info(
+            "Imported %s rows into %s: %s created, %s updated, %s skipped "
+            "(%.0f rows/sec)",
+            self.stats.rows,
+            self.project.name,
+            self.stats.created,
+            self.stats.updated,
+            self.stats.skipped,
+            self.stats.rows_per_second,
+        )
+        return self.stats
@@ -0,0 +1,77 @@
+import hashlib
+import logging
+import mimetypes
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from obligations.models import ObligationEvidence
+
+logger = logging.getLogger(__name__)
+
+METADATA_FIELDS = ["file_size_bytes", "content_type", "sha256"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Record the size, content type and SHA-256 digest of evidence files "
+        "uploaded before these were captured at upload time"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows written per bulk update (default: 500)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute metadata for every evidence file, not only missing ones",
+        )
+
+    def handle(self, *args, **options):
+        evidences = ObligationEvidence.objects.exclude(file="").only("pk", "file")
+        if not options["all"]:
+            evidences = evidences.filter(Q(file_size_bytes__isnull=True) | Q(sha256=""))
+
+        batch_size = max(1, options["batch_size"])
+        batch: list[ObligationEvidence] = []
+        updated = missing = 0
+        for evidence in evidences.iterator(chunk_size=batch_size):
+            try:
+                self._read_metadata(evidence)
+            except FileNotFoundError:
+                missing += 1
+                logger.warning(
+                    "Evidence %s file is missing: %s", evidence.pk, evidence.file.name
+                )
+                continue
+            batch.append(evidence)
+            if len(batch) >= batch_size:
+                updated += self._flush(batch)
+        updated += self._flush(batch)
+
+        if missing:
+            self.stderr.write(f"Skipped {missing} evidence rows with missing files")
+        self.stdout.write(
+            self.style.SUCCESS(f"Backfilled metadata for {updated} evidence files")
+        )
+
+    def _read_metadata(self, evidence: ObligationEvidence) -> None:
+        digest = hashlib.sha256()
+        size = 0
+        with evidence.file.open("rb") as handle:
+            for chunk in handle.chunks():
+                digest.update(chunk)
+                size += len(chunk)
+        evidence.file_size_bytes = size
+        evidence.sha256 = digest.hexdigest()
+        evidence.content_type = mimetypes.guess_type(evidence.file.name)[0] or ""
+
+    def _flush(self, batch: list[ObligationEvidence]) -> int:
+        count = len(batch)
+        if batch:
+            ObligationEvidence.objects.bulk_update(batch, METADATA_FIELDS)
+            batch.clear()
+        return count
@@ -1,6 +1,7 @@
 import logging
 import os
-import re
+import time
+from collections import Counter, defaultdict
 
 from django.core.management.base import BaseCommand
 
@@ -30,6 +31,21 @@ class Command(BaseCommand):
 
     help = "Clean CSV data to match Django models schema"
 
+    # Cleaning stages in the order they are applied, as (label, method name)
+    STAGES = (
+        ("map columns", "_map_columns"),
+        ("text fields", "_clean_text_fields"),
+        ("boolean fields", "_process_boolean_fields"),
+        ("date fields", "_clean_date_fields"),
+        ("status values", "_normalize_status_values"),
+        ("project phases", "_clean_project_phases"),
+        ("environmental aspects", "_clean_environmental_aspects"),
+        ("site or desktop", "_clean_site_desktop_values"),
+        ("email addresses", "_clean_email_addresses"),
+        ("obligation numbers", "_format_obligation_numbers"),
+        ("defaults and nulls", "_apply_defaults_and_nulls"),
+    )
+
     def add_arguments(self, parser):
         """Add command line arguments."""
         parser.add_argument("input_file", type=str, help="Path to the dirty CSV file")
@@ -40,6 +56,15 @@ def add_arguments(self, parser):
             help="Path where the cleaned CSV will be saved",
             default="clean_output_with_nulls.csv",
         )
+        parser.add_argument(
+            "--chunksize",
+            type=int,
+            default=None,
+            help=(
+                "Clean and write this many rows at a time instead of loading "
+                "the whole file into memory"
+            ),
+        )
 
     def handle(self, *args, **options):
         """
@@ -66,7 +91,7 @@ def handle(self, *args, **options):
             return
 
         try:
-            self.clean_csv(file_path, out_path)
+            self.clean_csv(file_path, out_path, chunksize=options["chunksize"])
             self.stdout.write(
                 self.style.SUCCESS(
                     f"Successfully cleaned CSV data and saved to {out_path}"
@@ -82,47 +107,108 @@ def handle(self, *args, **options):
             # This is intentionally broad as a last resort for unexpected errors
             self.stderr.write(self.style.ERROR(f"Unexpected error cleaning CSV: {e!s}"))
 
-    def clean_csv(self, filepath: str, outpath: str) -> None:
+    def clean_csv(
+        self, filepath: str, outpath: str, chunksize: int | None = None
+    ) -> dict[str, float]:
         """
         Clean and format CSV data to match Django models schema.
 
         Args:
             filepath: Path to the dirty CSV file
             outpath: Path where the cleaned CSV will be saved
+            chunksize: Rows cleaned and appended to the output at a time; the
+                whole file is processed at once when not given
+
+        Returns:
+            dict: Seconds spent in each stage, including reading and writing
         """
         logger.info("Reading CSV file from %s", filepath)
 
         # Read the dirty CSV file, handling potential encoding issues
         try:
-            df = pd.read_csv(filepath, encoding="utf-8")
+            timings, rows, columns = self._clean_to_file(
+                filepath, outpath, "utf-8", chunksize
+            )
         except UnicodeDecodeError:
             # Try with another common encoding if utf-8 fails
-            df = pd.read_csv(filepath, encoding="ISO-8859-1")
-
-        # Skip header row if it contains instructions instead of data
-        if df.shape[0] > 0 and (
-            "project name" in str(df.iloc[0].values).lower()
-            or "this is now the project name" in str(df.iloc[0].values).lower()
-        ):
-            self.stdout.write("Skipping instruction row")
-            df = df.iloc[1:].reset_index(drop=True)
-
-        df = self._map_columns(df)
-        df = self._clean_text_fields(df)
-        df = self._process_boolean_fields(df)
-        df = self._clean_date_fields(df)
-        df = self._normalize_status_values(df)
-        df = self._clean_project_phases(df)
-        df = self._clean_environmental_aspects(df)
-        df = self._clean_site_desktop_values(df)
-        df = self._clean_email_addresses(df)
-        df = self._format_obligation_numbers(df)
-        df = self._apply_defaults_and_nulls(df)
-
-        # Export the cleaned data to a new CSV file with proper date formatting
-        df.to_csv(outpath, index=False, date_format="%Y-%m-%d")
+            timings, rows, columns = self._clean_to_file(
+                filepath, outpath, "ISO-8859-1", chunksize
+            )
+
         logger.info("Cleaned data exported to %s", outpath)
-        self.stdout.write(f"CSV exported {len(df)} rows and {len(df.columns)} columns")
+        self.stdout.write(f"CSV exported {rows} rows and {columns} columns")
+        self._report_timings(timings, rows)
+        return timings
+
+    def _clean_to_file(
+        self, filepath: str, outpath: str, encoding: str, chunksize: int | None
+    ) -> tuple[dict[str, float], int, int]:
+        """Read, clean and write the file chunk by chunk."""
+        timings: dict[str, float] = defaultdict(float)
+        self._boolean_counts: dict[str, Counter] = defaultdict(Counter)
+        rows = columns = 0
+
+        # Cells are read as text so that every chunk gets the same dtypes;
+        # inferring them per chunk would clean e.g. numbers differently
+        read_options = {"encoding": encoding, "dtype": str}
+        if chunksize:
+            chunks = pd.read_csv(filepath, chunksize=chunksize, **read_options)
+        else:
+            # A lazy single chunk, so reading is timed like the chunked case
+            chunks = (pd.read_csv(filepath, **read_options) for _ in range(1))
+
+        with open(outpath, "w", encoding="utf-8", newline="") as output:
+            self._first_chunk = True
+            while True:
+                started = time.perf_counter()
+                df = next(chunks, None)
+                timings["read"] += time.perf_counter() - started
+                if df is None:
+                    break
+
+                # Skip header row if it contains instructions instead of data
+                if self._first_chunk and df.shape[0] > 0:
+                    first_row = str(df.iloc[0].values).lower()
+                    if (
+                        "project name" in first_row
+                        or "this is now the project name" in first_row
+                    ):
+                        self.stdout.write("Skipping instruction row")
+                        df = df.iloc[1:].reset_index(drop=True)
+
+                for label, method in self.STAGES:
+                    started = time.perf_counter()
+                    df = getattr(self, method)(df)
+                    timings[label] += time.perf_counter() - started
+
+                # Export the cleaned data with proper date formatting
+                started = time.perf_counter()
+                df.to_csv(
+                    output,
+                    header=self._first_chunk,
+                    index=False,
+                    date_format="%Y-%m-%d",
+                )
+                timings["write"] += time.perf_counter() - started
+                rows += len(df)
+                columns = len(df.columns)
+                self._first_chunk = False
+
+        for col, counts in self._boolean_counts.items():
+            self.stdout.write(
+                f"{col} after conversion: True={counts[True]}, "
+                f"False={counts[False]}, Null={counts[None]}"
+            )
+        return timings, rows, columns
+
+    def _report_timings(self, timings: dict[str, float], rows: int) -> None:
+        """Write the time spent in each stage."""
+        total = sum(timings.values())
+        self.stdout.write("Stage timings:")
+        for label in ["read", *(label for label, _method in self.STAGES), "write"]:
+            self.stdout.write(f"  {label:<22} {timings.get(label, 0.0):8.3f}s")
+        rate = rows / total if total else 0
+        self.stdout.write(f"  {'total':<22} {total:8.3f}s ({rate:.0f} rows/sec)")
 
     def _map_columns(self, df):
         """Map original column names to our expected format."""
@@ -158,15 +244,17 @@ def _map_columns(self, df):
             "Notes for Gap Analysis": "notes_for__gap__analysis",
         }
 
-        # Print available columns in the CSV for debugging
-        self.stdout.write(f"Available columns in CSV: {df.columns.tolist()}")
+        # Every chunk has the same columns, so only report on the first
+        if self._first_chunk:
+            # Print available columns in the CSV for debugging
+            self.stdout.write(f"Available columns in CSV: {df.columns.tolist()}")
 
-        # Check if all expected columns exist
-        for original_col in column_mapping:
-            if original_col not in df.columns:
-                self.stdout.write(
-                    self.style.WARNING(f"Column not found in CSV: '{original_col}'")
-                )
+            # Check if all expected columns exist
+            for original_col in column_mapping:
+                if original_col not in df.columns:
+                    self.stdout.write(
+                        self.style.WARNING(f"Column not found in CSV: '{original_col}'")
+                    )
 
         # Rename the columns
         df.rename(columns=column_mapping, inplace=True)
@@ -175,9 +263,10 @@ def _map_columns(self, df):
         required_columns = set(column_mapping.values())
         missing_columns = required_columns - set(df.columns)
 
-        for col in missing_columns:
+        for col in sorted(missing_columns):
             df[col] = None
-            logger.warning("Added missing column: %s", col)
+            if self._first_chunk:
+                logger.warning("Added missing column: %s", col)
 
         return df
 
@@ -198,15 +287,10 @@ def _clean_text_fields(self, df):
         for col in text_columns:
             if col in df.columns:
                 # Replace line breaks with dash and clean special characters
-                df[col] = (
-                    df[col]
-                    .astype(str)
-                    .apply(
-                        lambda x: re.sub(r"[\r\n•\u2022\u2013\u2019]", "-", x)
-                        if pd.notna(x) and x != "nan"
-                        else ""
-                    )
-                )
+                text = df[col].astype(str)
+                df[col] = text.str.replace(
+                    r"[\r\n•\u2022\u2013\u2019]", "-", regex=True
+                ).mask(text.eq("nan"), "")
         return df
 
     def _process_boolean_fields(self, df):
@@ -217,37 +301,34 @@ def _process_boolean_fields(self, df):
             "new__control__action_required",
         ]
 
-        # Define conv. values outside loop to avoid cell variable defined loop error
-        true_values = ["yes", "y", "true", "1", "yes ", "y ", "true "]
-        false_values = ["no", "n", "false", "0", "no ", "n ", "false ", ""]
+        true_values = ["yes", "y", "true", "1"]
+        false_values = ["no", "n", "false", "0", ""]
 
         for col in bool_columns:
             if col in df.columns:
-                self.stdout.write(f"Processing boolean column: {col}")
                 # Convert to string first to handle various input types
-                df[col] = df[col].astype(str).str.strip().str.lower()
-                # Print unique values for debugging
-                unique_vals = df[col].unique()
-                self.stdout.write(f"Unique values in {col}: {unique_vals}")
+                values = df[col].astype(str).str.strip().str.lower()
+                if self._first_chunk:
+                    self.stdout.write(f"Processing boolean column: {col}")
+                    # Print unique values for debugging
+                    self.stdout.write(f"Unique values in {col}: {values.unique()}")
 
                 # Convert various boolean indicators to Python boolean values
-                df[col] = df[col].apply(
-                    lambda x: True
-                    if x in true_values
-                    else False
-                    if x in false_values
-                    else None
+                df[col] = pd.Series(
+                    np.select(
+                        [values.isin(true_values), values.isin(false_values)],
+                        [True, False],
+                        default=None,
+                    ),
+                    index=df.index,
+                    dtype=object,
                 )
 
-                # Count values after conversion
-                true_count = (df[col] is True).sum()
-                false_count = (df[col] is False).sum()
-                null_count = df[col].isna().sum()
-
-                self.stdout.write(
-                    f"After conversion: True={true_count}, False={false_count}, "
-                    f"Null={null_count}"
-                )
+                # Count values after conversion, reported once all chunks are done
+                counts = self._boolean_counts[col]
+                counts[True] += int(df[col].eq(True).sum())
+                counts[False] += int(df[col].eq(False).sum())
+                counts[None] += int(df[col].isna().sum())
         return df
 
     def _clean_date_fields(self, df):
@@ -286,9 +367,7 @@ def _normalize_status_values(self, df):
                 "": "not started",
             }
 
-            df["status"] = df["status"].apply(
-                lambda x: status_mapping.get(x, "not started")
-            )
+            df["status"] = df["status"].map(status_mapping).fillna("not started")
         return df
 
     def _clean_project_phases(self, df):
@@ -302,28 +381,25 @@ def _clean_project_phases(self, df):
                 "Throughout the project",
             }
 
-            # Map variations to standardized values
-            df["project_phase"] = (
-                df["project_phase"]
-                .astype(str)
-                .apply(
-                    lambda x: "Construction"
-                    if "construction" in x.lower()
-                    or "design and construction" in x.lower()
-                    else "Pre-Construction"
-                    if any(term in x.lower() for term in ["pre", "design"])
-                    else "Operation"
-                    if "operation" in x.lower()
-                    else "Throughout the project"
-                    if "throughout" in x.lower()
-                    else x
-                    if (
-                        pd.notna(x)
-                        and x not in {"nan", "NULL", ""}
-                        and x in valid_phases
-                    )
-                    else None
-                )
+            # Map variations to standardized values, first match wins
+            phases = df["project_phase"].astype(str)
+            lowered = phases.str.lower()
+            df["project_phase"] = np.select(
+                [
+                    lowered.str.contains("construction", regex=False),
+                    lowered.str.contains("pre|design"),
+                    lowered.str.contains("operation", regex=False),
+                    lowered.str.contains("throughout", regex=False),
+                    phases.isin(valid_phases),
+                ],
+                [
+                    "Construction",
+                    "Pre-Construction",
+                    "Operation",
+                    "Throughout the project",
+                    phases,
+                ],
+                default=None,
             )
         return df
 
@@ -346,62 +422,51 @@ def _clean_environmental_aspects(self, df):
             }
 
             # Convert to proper format and validate against valid aspects
-            df["environmental__aspect"] = (
-                df["environmental__aspect"]
-                .astype(str)
-                .apply(
-                    lambda x: x.title()
-                    if (
-                        pd.notna(x)
-                        and x not in {"nan", "NULL", ""}
-                        and x.title() in valid_aspects
-                    )
-                    else "Other"
-                )
+            aspects = df["environmental__aspect"].astype(str).str.title()
+            df["environmental__aspect"] = aspects.where(
+                aspects.isin(valid_aspects), "Other"
             )
         return df
 
     def _clean_site_desktop_values(self, df):
         """Clean and standardize site or desktop values."""
         if "site_or__desktop" in df.columns:
-            df["site_or__desktop"] = (
-                df["site_or__desktop"]
-                .astype(str)
-                .apply(
-                    lambda x: "Site"
-                    if "site" in x.lower()
-                    else "Desktop"
-                    if "desktop" in x.lower()
-                    else None
-                    if pd.isna(x) or x in {"nan", "NULL", ""}
-                    else x
-                )
+            values = df["site_or__desktop"].astype(str)
+            lowered = values.str.lower()
+            df["site_or__desktop"] = np.select(
+                [
+                    lowered.str.contains("site", regex=False),
+                    lowered.str.contains("desktop", regex=False),
+                    values.isin({"nan", "NULL", ""}),
+                ],
+                ["Site", "Desktop", None],
+                default=values,
             )
         return df
 
     def _clean_email_addresses(self, df):
         """Clean email addresses."""
         if "person_email" in df.columns:
-            df["person_email"] = (
-                df["person_email"]
-                .astype(str)
-                .apply(
-                    lambda x: x.strip()
-                    if pd.notna(x) and x != "nan" and "@" in x
-                    else None
-                )
+            emails = df["person_email"].astype(str)
+            df["person_email"] = emails.str.strip().where(
+                emails.ne("nan") & emails.str.contains("@", regex=False)
             )
         return df
 
     def _format_obligation_numbers(self, df):
         """Format obligation numbers consistently."""
         if "obligation__number" in df.columns:
-            df["obligation__number"] = df["obligation__number"].apply(
-                lambda x: f"PCEMP-{x.split('-')[1]}"
-                if isinstance(x, str) and "-" in x
-                else f"PCEMP-{x}"
-                if isinstance(x, str) and x.isdigit()
-                else x
+            numbers = df["obligation__number"]
+            is_text = numbers.map(type).eq(str)
+            text = numbers.where(is_text, "")
+            suffix = text.str.split("-").str[1].fillna("")
+            df["obligation__number"] = np.select(
+                [
+                    is_text & text.str.contains("-", regex=False),
+                    is_text & text.str.isdigit(),
+                ],
+                ["PCEMP-" + suffix, "PCEMP-" + text],
+                default=numbers,
             )
         return df
 
@@ -409,7 +474,7 @@ def _apply_defaults_and_nulls(self, df):
         """Apply default values and handle nulls."""
         # Fill missing values with appropriate defaults
         if "status" in df.columns:
-            df["status"].fillna("not started", inplace=True)
+            df["status"] = df["status"].fillna("not started")
 
         # Replace remaining NaN values with None/NULL
         df = df.replace({np.nan: None})
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from obligations.query_plans import explain_hot_queries
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN QUERY PLAN on the hot obligation queries used by the "
+        "dashboard, summary and procedure views and report full table scans"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", type=int, default=1, help="Project id to plan with"
+        )
+        parser.add_argument(
+            "--mechanism", type=int, default=1, help="Mechanism id to plan with"
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full plan of every query, not only the failing ones",
+        )
+        parser.add_argument(
+            "--fail-on-scan",
+            action="store_true",
+            help="Exit with an error if any query scans the obligations table",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Plans are tuned for SQLite; running on {connection.vendor}"
+                )
+            )
+
+        plans = explain_hot_queries(options["project"], options["mechanism"])
+        for result in plans:
+            status = self.style.SUCCESS("ok") if result.ok else self.style.ERROR(
+                "FULL SCAN"
+            )
+            self.stdout.write(f"[{status}] {result.query.name} ({result.query.source})")
+            if options["verbose_plans"] or not result.ok:
+                for line in result.plan.splitlines():
+                    self.stdout.write(f"    {line}")
+
+        scans = sum(not result.ok for result in plans)
+        summary = f"{len(plans) - scans}/{len(plans)} hot queries use an index"
+        if scans and options["fail_on_scan"]:
+            raise CommandError(summary)
+        style = self.style.WARNING if scans else self.style.SUCCESS
+        self.stdout.write(style(summary))
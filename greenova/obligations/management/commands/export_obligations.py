@@ -0,0 +1,120 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from obligations.export import (
+    DEFAULT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    iter_export_rows,
+    stream_csv,
+    stream_xlsx,
+)
+from obligations.filters import apply_filters
+from obligations.models import Obligation
+
+
+class Command(BaseCommand):
+    help = (
+        "Export obligations to CSV, XLSX or the length-delimited protobuf "
+        "exchange format (pb, read by import_obligations_pb), streaming rows in "
+        "chunks. Filters match the obligation summary view."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output", help="File to write, or '-' for standard output (CSV only)"
+        )
+        parser.add_argument(
+            "--format",
+            choices=sorted([*EXPORT_FORMATS, "pb"]),
+            help="Output format (default: from the file extension, else csv)",
+        )
+        parser.add_argument("--project", type=int, help="Only this project id")
+        parser.add_argument("--mechanism", type=int, help="Only this mechanism id")
+        parser.add_argument(
+            "--status", action="append", help="Status filter (repeatable)"
+        )
+        parser.add_argument(
+            "--phase", action="append", help="Project phase filter (repeatable)"
+        )
+        parser.add_argument("--search", help="Free-text search")
+        parser.add_argument(
+            "--date-filter",
+            choices=["past_due", "14days", "30days"],
+            help="Due date window",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=(
+                "Rows fetched per database round trip "
+                f"(default: {DEFAULT_CHUNK_SIZE}); also the pb batch size"
+            ),
+        )
+        parser.add_argument(
+            "--source",
+            default="",
+            help="Description of this environment, stored in the pb stream header",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        suffix = output.lower().rpartition(".")[2]
+        export_format = options["format"] or (
+            suffix if suffix in ("xlsx", "pb") else "csv"
+        )
+        if output == "-" and export_format != "csv":
+            raise CommandError(f"{export_format.upper()} output needs a file path")
+
+        filters = {
+            "status": [s.strip().lower() for s in options["status"] or []],
+            "phase": options["phase"] or [],
+            "search": options["search"] or "",
+            "date_filter": options["date_filter"] or "",
+        }
+        queryset = Obligation.objects.all()
+        if options["project"]:
+            queryset = queryset.filter(project_id=options["project"])
+        if options["mechanism"]:
+            queryset = queryset.filter(
+                primary_environmental_mechanism_id=options["mechanism"]
+            )
+        queryset = apply_filters(queryset, filters)
+
+        started = time.perf_counter()
+        rows = 0
+
+        def counted():
+            nonlocal rows
+            for row in iter_export_rows(queryset, options["chunk_size"]):
+                rows += 1
+                yield row
+
+        if export_format == "pb":
+            # Needs the compiled obligation.proto, so only imported when used
+            from obligations.exchange import write_stream
+
+            with open(output, "wb") as handle:
+                rows = write_stream(
+                    handle,
+                    queryset,
+                    batch_size=options["chunk_size"],
+                    source=options["source"],
+                )
+        elif export_format == "xlsx":
+            with open(output, "wb") as handle:
+                for chunk in stream_xlsx(counted()):
+                    handle.write(chunk)
+        elif output == "-":
+            for chunk in stream_csv(counted()):
+                self.stdout.write(chunk, ending="")
+        else:
+            with open(output, "w", newline="", encoding="utf-8") as handle:
+                handle.writelines(stream_csv(counted()))
+
+        elapsed = time.perf_counter() - started
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"Exported {rows} obligations as {export_format} in {elapsed:.3f}s"
+            )
+        )
@@ -0,0 +1,295 @@
+import csv
+import glob
+import multiprocessing
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from queue import Empty
+from typing import Any, NamedTuple
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from mechanisms.models import update_all_mechanism_counts
+from obligations.importing import (
+    DEFAULT_BATCH_SIZE,
+    ImportRecord,
+    ImportStats,
+    ObligationBatchWriter,
+)
+from projects.models import Project
+
+from .import_obligations import Command as ImportCommand
+
+# Batches a worker may have queued ahead of the writer, per worker
+QUEUE_BATCHES_PER_WORKER = 4
+
+
+class RegisterBatch(NamedTuple):
+    """Cleaned rows, and invalid-row messages, from part of one register."""
+
+    path: str
+    records: list[ImportRecord]
+    errors: list[str]
+
+
+class RegisterDone(NamedTuple):
+    """Sent once a worker has finished with a register."""
+
+    path: str
+    invalid: int
+    seconds: float
+    failure: str | None = None
+
+
+# Per-process state of a parser worker, set by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(queue: Any) -> None:
+    _worker["queue"] = queue
+    # A no-op when workers are forked; spawned workers need the app registry
+    django.setup()
+
+
+def _normalized_rows(
+    importer: ImportCommand, path: str
+) -> Iterator[tuple[ImportRecord | None, str | None]]:
+    with open(path, encoding="utf-8", newline="") as handle:
+        for line, row in enumerate(csv.DictReader(handle), 2):
+            try:
+                yield importer.normalize_record(row), None
+            except (ValueError, KeyError) as e:
+                yield None, f"{path}:{line}: {e}"
+
+
+def parse_register(path: str, batch_size: int, skip_invalid: bool) -> None:
+    """
+    Read and clean one register in a worker, without database access.
+
+    Cleaned rows are put on the shared queue ``batch_size`` at a time, so
+    neither the worker nor the writer ever holds a whole register. Rows are
+    cleaned with ``import_obligations``' ``normalize_record``, which applies
+    the same ``map_environmental_aspect`` and ``parse_date_safe`` rules as a
+    single-file import. Unless ``skip_invalid`` is set, the register is
+    validated in a first pass and nothing is sent for a file with invalid
+    rows. Any other failure, such as undecodable text, is reported in the
+    ``RegisterDone`` message instead of being raised.
+    """
+    started = time.perf_counter()
+    queue = _worker["queue"]
+    importer = ImportCommand()
+    invalid = 0
+    try:
+        if not skip_invalid:
+            errors = [error for _record, error in _normalized_rows(importer, path)]
+            errors = [error for error in errors if error]
+            if errors:
+                queue.put(RegisterBatch(path, [], errors))
+                queue.put(
+                    RegisterDone(path, len(errors), time.perf_counter() - started)
+                )
+                return
+
+        records: list[ImportRecord] = []
+        errors = []
+        for record, error in _normalized_rows(importer, path):
+            if error:
+                invalid += 1
+                errors.append(error)
+            else:
+                records.append(record)
+            if len(records) >= batch_size:
+                queue.put(RegisterBatch(path, records, errors))
+                records, errors = [], []
+        if records or errors:
+            queue.put(RegisterBatch(path, records, errors))
+    except Exception as e:
+        queue.put(
+            RegisterDone(
+                path, invalid, time.perf_counter() - started, f"{type(e).__name__}: {e}"
+            )
+        )
+        return
+    queue.put(RegisterDone(path, invalid, time.perf_counter() - started))
+
+
+class Command(BaseCommand):
+    help = (
+        "Import many obligation registers at once. Files are parsed in a process "
+        "pool that streams batches through a bounded queue to a single writer, so "
+        "parsing uses every core while database writes stay serialized."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="CSV files, directories or glob patterns to import",
+        )
+        parser.add_argument(
+            "--project",
+            help="Project for every file (default: each file's name without suffix)",
+        )
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Update existing obligations instead of skipping",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Parser processes (default: number of CPUs)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows written per bulk statement (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--continue-on-error",
+            action="store_true",
+            help="Import the valid rows of files that contain invalid rows",
+        )
+
+    def _collect_paths(self, patterns: list[str]) -> list[str]:
+        paths: set[str] = set()
+        for pattern in patterns:
+            candidate = Path(pattern)
+            if candidate.is_dir():
+                paths.update(str(path) for path in candidate.glob("*.csv"))
+            elif candidate.is_file():
+                paths.add(str(candidate))
+            else:
+                paths.update(glob.glob(pattern, recursive=True))
+        return sorted(paths)
+
+    def _writer_for(
+        self,
+        path: str,
+        options: dict,
+        writers: dict[str, ObligationBatchWriter],
+    ) -> ObligationBatchWriter:
+        project_name = options["project"] or Path(path).stem
+        writer = writers.get(project_name)
+        if writer is None:
+            with transaction.atomic():
+                project, _created = Project.objects.get_or_create(name=project_name)
+            writer = writers[project_name] = ObligationBatchWriter(
+                project, force_update=options["update"]
+            )
+        return writer
+
+    def _check_workers(self, futures: dict[Future, str]) -> None:
+        """Fail registers whose worker died without reporting them."""
+        for future, path in futures.items():
+            if path in self._pending and future.done() and future.exception():
+                self._failures[path] = f"worker failed: {future.exception()!r}"
+                self._pending.discard(path)
+
+    def _finish_register(self, done: RegisterDone, options: dict) -> None:
+        path = done.path
+        self._pending.discard(path)
+        self._parse_seconds += done.seconds
+        if done.failure and path not in self._failures:
+            self._failures[path] = done.failure
+        elif done.invalid and not options["continue_on_error"]:
+            self._invalid_files.append(path)
+        if path not in self._failures and path not in self._invalid_files:
+            stats = self._file_stats[path]
+            self.stdout.write(
+                f"{path}: {stats.rows} rows, {stats.created} created, "
+                f"{stats.updated} updated, {stats.skipped} skipped"
+            )
+
+    def _write_batch(self, batch: RegisterBatch, options: dict) -> None:
+        for error in batch.errors:
+            self.stderr.write(error)
+        if batch.path in self._failures or not batch.records:
+            return
+        try:
+            writer = self._writer_for(batch.path, options, self._writers)
+            self._file_stats[batch.path].add(writer.write(batch.records))
+        except Exception as e:
+            # Keep writing the other registers; this one stops here
+            self._failures[batch.path] = f"{type(e).__name__}: {e}"
+
+    def _consume(self, queue: Any, futures: dict[Future, str], options: dict) -> None:
+        """Write batches as workers send them until every register is done."""
+        while self._pending:
+            try:
+                message = queue.get(timeout=1)
+            except Empty:
+                self._check_workers(futures)
+                continue
+            if isinstance(message, RegisterDone):
+                self._finish_register(message, options)
+            else:
+                self._write_batch(message, options)
+
+    def handle(self, *args, **options):
+        paths = self._collect_paths(options["paths"])
+        if not paths:
+            raise CommandError("No CSV files matched")
+
+        started = time.perf_counter()
+        self._writers: dict[str, ObligationBatchWriter] = {}
+        self._file_stats = {path: ImportStats() for path in paths}
+        self._parse_seconds = 0.0
+        self._invalid_files: list[str] = []
+        self._failures: dict[str, str] = {}
+        self._pending = set(paths)
+        batch_size = max(1, options["batch_size"])
+        workers = max(1, min(options["workers"], len(paths)))
+        context = multiprocessing.get_context()
+        # Bounded, so parsing can only run a few batches ahead of the writer
+        queue = context.Queue(maxsize=workers * QUEUE_BATCHES_PER_WORKER)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(queue,),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    parse_register, path, batch_size, options["continue_on_error"]
+                ): path
+                for path in paths
+            }
+            self._consume(queue, futures, options)
+
+        for path, reason in self._failures.items():
+            self.stderr.write(
+                f"{path}: failed after {self._file_stats[path].rows} rows were "
+                f"written: {reason}"
+            )
+
+        totals = [
+            writer.finish(refresh_counts=False) for writer in self._writers.values()
+        ]
+        if any(stats.created or stats.updated for stats in totals):
+            update_all_mechanism_counts()
+
+        elapsed = time.perf_counter() - started
+        rows = sum(stats.rows for stats in totals)
+        imported = len(paths) - len(self._invalid_files) - len(self._failures)
+        self.stdout.write(
+            f"{rows} rows from {imported} files in {elapsed:.2f}s "
+            f"({rows / elapsed if elapsed else 0:.0f} rows/sec, "
+            f"{self._parse_seconds:.2f}s parsing across {workers} workers)"
+        )
+        problems = []
+        if self._invalid_files:
+            problems.append(
+                "Skipped files with invalid rows (use --continue-on-error): "
+                + ", ".join(sorted(self._invalid_files))
+            )
+        if self._failures:
+            problems.append("Failed files: " + ", ".join(sorted(self._failures)))
+        if problems:
+            raise CommandError("; ".join(problems))
+        self.stdout.write(self.style.SUCCESS("Successfully imported registers"))
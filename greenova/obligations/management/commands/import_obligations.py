@@ -1,23 +1,30 @@
 import csv
 import logging
 import os
+import time
+from collections.abc import Iterator
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypedDict, cast
+from typing import TYPE_CHECKING, Any, TypedDict
 
 import django
 from django.core.management.base import BaseCommand, CommandParser
-from django.db import DatabaseError, connection, transaction
+from django.db import DatabaseError, transaction
 from django.db.models import (
     Manager,  # Add this import for type hinting
     Model,
 )
 from django.utils import timezone
 from django.utils.dateparse import parse_date
-
-from ....mechanisms.models import EnvironmentalMechanism
-from ....obligations.models import Obligation
-from ....obligations.utils import normalize_frequency
-from ....projects.models import Project  # Ensure this is the correct import path
+from mechanisms.models import EnvironmentalMechanism
+from obligations.importing import (
+    DEFAULT_BATCH_SIZE,
+    ImportRecord,
+    ImportStats,
+    ObligationBatchWriter,
+)
+from obligations.models import Obligation
+from obligations.utils import normalize_frequency
+from projects.models import Project
 
 if not hasattr(Project, "objects") or not isinstance(Project.objects, Manager):
     raise ImportError(
@@ -117,23 +124,102 @@ def handle(self, *args: Any, **options: Any) -> None:
                 if options["dry_run"]:
                     self.stdout.write("DRY RUN - No changes will be made")
 
-                for row in reader:
-                    try:
-                        with transaction.atomic():
-                            self._process_obligation_row(row, project, options)
-                    except (ValueError, DatabaseError, KeyError) as e:
-                        error_msg = f"Error processing row: {e}"
-                        if options["continue_on_error"]:
-                            self.stderr.write(error_msg)
-                            continue
-                        raise
+                if options["batch_size"] > 0 and not options["dry_run"]:
+                    stats = self._import_batched(reader, project, options)
+                else:
+                    stats = self._import_rows(reader, project, options)
 
         except (OSError, csv.Error, DatabaseError) as e:
             self.stderr.write(f"Failed to import obligations: {e}")
             return
 
+        self.stdout.write(
+            f"{stats.rows} rows in {stats.seconds:.2f}s "
+            f"({stats.rows_per_second:.0f} rows/sec): {stats.created} created, "
+            f"{stats.updated} updated, {stats.skipped} skipped"
+        )
         self.stdout.write(self.style.SUCCESS("Successfully imported obligations"))
 
+    def _import_rows(
+        self, reader: csv.DictReader, project: Project, options: dict[str, Any]
+    ) -> ImportStats:
+        """Import rows one at a time, saving each obligation individually."""
+        stats = ImportStats()
+        started = time.perf_counter()
+        for row in reader:
+            stats.rows += 1
+            try:
+                with transaction.atomic():
+                    status = self._process_obligation_row(row, project, options)
+            except (ValueError, DatabaseError, KeyError) as e:
+                error_msg = f"Error processing row: {e}"
+                if options["continue_on_error"]:
+                    self.stderr.write(error_msg)
+                    continue
+                raise
+            if status in ("created", "updated", "skipped"):
+                setattr(stats, status, getattr(stats, status) + 1)
+        stats.seconds = time.perf_counter() - started
+        return stats
+
+    def _read_batches(
+        self, reader: csv.DictReader, batch_size: int, options: dict[str, Any]
+    ) -> Iterator[tuple[list[dict[str, Any]], list[ImportRecord]]]:
+        """Yield ``batch_size`` raw rows at a time with their cleaned records."""
+        rows: list[dict[str, Any]] = []
+        records: list[ImportRecord] = []
+        for row in reader:
+            try:
+                records.append(self.normalize_record(row))
+            except (ValueError, KeyError) as e:
+                if not options["continue_on_error"]:
+                    raise
+                self.stderr.write(f"Error processing row: {e}")
+                continue
+            rows.append(row)
+            if len(records) >= batch_size:
+                yield rows, records
+                rows, records = [], []
+        if records:
+            yield rows, records
+
+    def _import_batched(
+        self, reader: csv.DictReader, project: Project, options: dict[str, Any]
+    ) -> ImportStats:
+        """Import rows in batches with bulk writes and one count refresh."""
+        writer = ObligationBatchWriter(project, force_update=options["update"])
+        for rows, records in self._read_batches(
+            reader, options["batch_size"], options
+        ):
+            try:
+                batch = writer.write(records)
+            except DatabaseError as e:
+                if not options["continue_on_error"]:
+                    raise
+                # Retry the failed batch row by row so only bad rows are lost
+                self.stderr.write(f"Error writing batch, retrying per row: {e}")
+                writer.stats.rows += len(rows)
+                for row in rows:
+                    try:
+                        with transaction.atomic():
+                            status = self._process_obligation_row(
+                                row, project, options
+                            )
+                    except (ValueError, DatabaseError, KeyError) as row_error:
+                        self.stderr.write(f"Error processing row: {row_error}")
+                        continue
+                    if status in ("created", "updated", "skipped"):
+                        setattr(
+                            writer.stats, status, getattr(writer.stats, status) + 1
+                        )
+                continue
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"Batch {writer.stats.batches}: {batch.created} created, "
+                    f"{batch.updated} updated, {batch.skipped} skipped"
+                )
+        return writer.finish()
+
     def _get_or_create_project(self, project_name: str) -> Project | None:
         """Get existing project or create new one."""
         if not hasattr(Project, "objects") or not isinstance(Project.objects, Manager):
@@ -155,11 +241,11 @@ def _get_or_create_project(self, project_name: str) -> Project | None:
 
     def _process_obligation_row(
         self, row: dict[str, Any], project: Project, options: dict[str, Any]
-    ) -> None:
+    ) -> str:
         """Process a single row from the CSV file."""
         if options["dry_run"]:
             self.stdout.write(f"Would process row: {row}")
-            return
+            return "dry run"
 
         # Process the row data
         obligation_data = self.process_row(row, project)
@@ -174,6 +260,7 @@ def _process_obligation_row(
             self.stdout.write(
                 f"{action} obligation: {obligation_data['obligation_number']}"
             )
+        return status
 
     help = "Import obligations from CSV file"
 
@@ -209,6 +296,15 @@ def add_arguments(self, parser: CommandParser) -> None:
             action="store_true",
             help="Continue processing rows even if some fail",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=(
+                "Rows written per bulk insert/update (default: "
+                f"{DEFAULT_BATCH_SIZE}); 0 saves each row individually"
+            ),
+        )
         parser.add_argument(
             "--no-transaction",
             action="store_true",
@@ -371,6 +467,31 @@ def process_row(self, row: dict[str, Any], project: Project) -> ObligationData:
             Processed data dictionary with cleaned values
         """
         mechanism = self._process_mechanism(row, project)
+        obligation_number = self._get_or_generate_obligation_number(
+            row.get("obligation__number")
+        )
+        result: ObligationData = {
+            **self.normalize_row(row),
+            "obligation_number": self.normalize_obligation_number(obligation_number),
+            "project": project,
+            "primary_environmental_mechanism": mechanism,
+        }
+        logger.info("Importing obligation: %s", obligation_number)
+        return result
+
+    def normalize_row(self, row: dict[str, Any]) -> ObligationData:
+        """
+        Clean a CSV row without touching the database.
+
+        The project and mechanism are left to the caller, and a missing
+        obligation number is left empty.
+
+        Args:
+            row: Dictionary containing CSV row data
+
+        Returns:
+            Cleaned obligation field values
+        """
         status = self._normalize_status(row.get("status", ""))
         environmental_aspect = self._map_environmental_aspect(
             row.get("environmental__aspect", "")
@@ -380,17 +501,14 @@ def process_row(self, row: dict[str, Any], project: Project) -> ObligationData:
         recurring_forecasted_date = self._parse_date_safe(
             row.get("recurring__forcasted__date")
         )
-        obligation_number = self._get_or_generate_obligation_number(
-            row.get("obligation__number")
-        )
 
         if row.get("recurring__frequency"):
             normalize_frequency(row["recurring__frequency"])
 
-        result: ObligationData = {
-            "obligation_number": self.normalize_obligation_number(obligation_number),
-            "project": project,
-            "primary_environmental_mechanism": mechanism,
+        return {
+            "obligation_number": self.normalize_obligation_number(
+                row.get("obligation__number") or ""
+            ),
             "procedure": row.get("procedure", ""),
             "environmental_aspect": environmental_aspect,
             "obligation": row.get("obligation", ""),
@@ -417,8 +535,12 @@ def process_row(self, row: dict[str, Any], project: Project) -> ObligationData:
             "gap_analysis": self.clean_boolean(row.get("gap__analysis")),
             "notes_for_gap_analysis": row.get("notes_for__gap__analysis", ""),
         }
-        logger.info("Importing obligation: %s", obligation_number)
-        return result
+
+    def normalize_record(self, row: dict[str, Any]) -> ImportRecord:
+        """Clean a CSV row for ``ObligationBatchWriter``."""
+        return ImportRecord(
+            dict(self.normalize_row(row)), row.get("primary__environmental__mechanism")
+        )
 
     def _process_mechanism(
         self, row: dict[str, Any], project: Project
@@ -485,32 +607,10 @@ def create_or_update_obligation(
                     if key != "obligation_number":  # Don't update the primary key
                         setattr(existing, key, value)
                 existing.save()
-                existing_t = cast(ObligationT, existing) if TYPE_CHECKING else existing
-                with connection.cursor() as cursor:
-                    cursor.execute(
-                        (
-                            "UPDATE obligations_obligation "
-                            "SET updated_at = NOW() "
-                            "WHERE id = %s"
-                        ),
-                        [existing_t.id],
-                    )
                 return existing, "updated"
             # Create new obligation
             new_obligation = Obligation(**obligation_data)
             new_obligation.save()
-            new_obligation_t = (
-                cast(ObligationT, new_obligation) if TYPE_CHECKING else new_obligation
-            )
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    (
-                        "UPDATE obligations_obligation "
-                        "SET created_at = NOW() "
-                        "WHERE id = %s"
-                    ),
-                    [new_obligation_t.id],  # type: ignore[attr-defined]
-                )
             return new_obligation, "created"
 
         except DatabaseError as e:
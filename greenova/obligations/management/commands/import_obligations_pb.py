@@ -0,0 +1,112 @@
+import sys
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from mechanisms.models import update_all_mechanism_counts
+from obligations.importing import ImportRecord, ObligationBatchWriter
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Import obligations from a length-delimited protobuf stream written by "
+        "'export_obligations --format pb'. Each batch is checksummed and "
+        "written with bulk inserts/updates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="Stream to read, or '-' for standard input")
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Update existing obligations instead of skipping",
+        )
+        parser.add_argument(
+            "--continue-on-error",
+            action="store_true",
+            help="Skip batches that fail their checksum instead of stopping",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from obligations.exchange import (
+                ChecksumMismatch,
+                ExchangeError,
+                read_batch,
+                read_header,
+                record_to_import,
+            )
+        except ImportError as e:
+            raise CommandError(
+                "obligation_pb2 is missing; run "
+                "'python manage.py compile_protos --app=obligations'"
+            ) from e
+
+        started = time.perf_counter()
+        writers: dict[str, ObligationBatchWriter] = {}
+        skipped_batches = []
+        stream = (
+            sys.stdin.buffer
+            if options["input"] == "-"
+            else open(options["input"], "rb")
+        )
+        try:
+            header = read_header(stream)
+            self.stdout.write(
+                f"Stream exported {header.exported_at}"
+                + (f" from {header.source}" if header.source else "")
+            )
+            while True:
+                try:
+                    batch = read_batch(stream)
+                except ChecksumMismatch as e:
+                    if not options["continue_on_error"]:
+                        raise CommandError(str(e)) from e
+                    self.stderr.write(f"{e}; skipping")
+                    skipped_batches.append(e.sequence)
+                    continue
+                if batch is None:
+                    break
+
+                by_project: dict[str, list[ImportRecord]] = defaultdict(list)
+                for record in batch.records:
+                    project, import_record = record_to_import(record)
+                    by_project[project].append(import_record)
+                for project_name, records in by_project.items():
+                    self._writer(writers, project_name, options).write(records)
+        except ExchangeError as e:
+            raise CommandError(str(e)) from e
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        totals = [writer.finish(refresh_counts=False) for writer in writers.values()]
+        if any(stats.created or stats.updated for stats in totals):
+            update_all_mechanism_counts()
+
+        elapsed = time.perf_counter() - started
+        rows = sum(stats.rows for stats in totals)
+        self.stdout.write(
+            f"{rows} records in {elapsed:.2f}s "
+            f"({rows / elapsed if elapsed else 0:.0f} rows/sec): "
+            f"{sum(stats.created for stats in totals)} created, "
+            f"{sum(stats.updated for stats in totals)} updated, "
+            f"{sum(stats.skipped for stats in totals)} skipped"
+        )
+        if skipped_batches:
+            self.stderr.write(f"Skipped corrupt batches: {skipped_batches}")
+        self.stdout.write(self.style.SUCCESS("Successfully imported obligations"))
+
+    def _writer(
+        self, writers: dict[str, ObligationBatchWriter], project_name: str, options
+    ) -> ObligationBatchWriter:
+        """Return the writer for a project, creating both on first use."""
+        if project_name not in writers:
+            with transaction.atomic():
+                project, _created = Project.objects.get_or_create(name=project_name)
+            writers[project_name] = ObligationBatchWriter(
+                project, force_update=options["update"]
+            )
+        return writers[project_name]
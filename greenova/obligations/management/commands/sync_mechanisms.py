@@ -1,10 +1,11 @@
 import logging
+import time
 from typing import Any
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
-from django.db.models import Count, Q
-from mechanisms.models import EnvironmentalMechanism
+from django.db.models import Q
+from mechanisms.models import EnvironmentalMechanism, update_all_mechanism_counts
 from obligations.models import Obligation
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,16 @@
 class Command(BaseCommand):
     help = "Sync environmental mechanisms from obligations and update all counts"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--per-mechanism",
+            action="store_true",
+            help=(
+                "Recount each mechanism individually instead of using a single "
+                "aggregate query (slower, kept for comparison)"
+            ),
+        )
+
     def update_null_statuses(self):
         """Update NULL statuses to 'not started'."""
         updated = Obligation.objects.filter(
@@ -56,8 +67,26 @@ def validate_obligations(self):
             return True
         return True
 
-    def update_mechanism_counts(self):
+    def update_mechanism_counts(self, per_mechanism=False):
         """Update all mechanism counts including overdue status."""
+        started = time.perf_counter()
+
+        if per_mechanism:
+            mechanisms_updated = self._update_mechanism_counts_individually()
+        else:
+            self.stdout.write("Updating mechanism counts with a single aggregate...")
+            mechanisms_updated = update_all_mechanism_counts()
+
+        elapsed = time.perf_counter() - started
+        path = "per-mechanism" if per_mechanism else "aggregate"
+        self.stdout.write(
+            f"Updated counts for {mechanisms_updated} mechanisms "
+            f"in {elapsed:.3f}s ({path})"
+        )
+        return mechanisms_updated
+
+    def _update_mechanism_counts_individually(self):
+        """Recount mechanisms one at a time."""
         mechanisms = EnvironmentalMechanism.objects.all().select_related("project")
         count = mechanisms.count()
 
@@ -83,29 +112,10 @@ def handle(self, *args: tuple[Any, ...], **options: dict[str, Any]) -> None:
                 if not self.validate_obligations():
                     raise ValueError("Invalid obligation statuses found")
 
-                # Create/update mechanisms based on obligations
-                # This query is a reference but does not affect mechanism updates
-                # Consider removing if not needed in future versions
-                _ = (
-                    Obligation.objects.filter(
-                        primary_environmental_mechanism__isnull=False
-                    )
-                    .values("project", "primary_environmental_mechanism__name")
-                    .annotate(
-                        not_started_count=Count(
-                            "obligation_number", filter=Q(status="not started")
-                        ),
-                        in_progress_count=Count(
-                            "obligation_number", filter=Q(status="in progress")
-                        ),
-                        completed_count=Count(
-                            "obligation_number", filter=Q(status="completed")
-                        ),
-                    )
-                )
-
                 # Now update all mechanism counts including overdue status
-                mechanisms_updated = self.update_mechanism_counts()
+                mechanisms_updated = self.update_mechanism_counts(
+                    per_mechanism=options.get("per_mechanism", False)
+                )
 
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -1,7 +1,7 @@
 import logging
 
 from django.core.management.base import BaseCommand
-from obligations.models import Obligation
+from obligations.forecasting import update_recurring_dates
 
 logger = logging.getLogger(__name__)
 
@@ -9,18 +9,19 @@
 class Command(BaseCommand):
     help = "Update all recurring forecasted dates"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of rows written per bulk update (default: 500)",
+        )
+
     def handle(self, *args, **options):
         """Update forecasted dates for all recurring obligations."""
         self.stdout.write("Updating recurring forecasted dates...")
 
-        # Get all recurring obligations
-        obligations = Obligation.objects.filter(recurring_obligation=True)
-        count = 0
-
-        for obligation in obligations:
-            if obligation.update_recurring_forecasted_date():
-                obligation.save()
-                count += 1
+        count = update_recurring_dates(batch_size=options["batch_size"])
 
         self.stdout.write(
             self.style.SUCCESS(
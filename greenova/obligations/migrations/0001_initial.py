@@ -0,0 +1,87 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import core.storage
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('mechanisms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ObligationEvidence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(help_text='Upload evidence documents (25MB max)', max_length=255, storage=core.storage.deduplicated_storage, upload_to='evidence_files/%Y/%m/%d/', validators=[django.core.validators.FileExtensionValidator(allowed_extensions=['pdf', 'doc', 'docx', 'xls', 'xlsx', 'png', 'jpg', 'jpeg', 'gif', 'txt', 'csv'])])),
+                ('uploaded_at', models.DateTimeField(auto_now_add=True)),
+                ('description', models.CharField(blank=True, max_length=255)),
+                ('file_size_bytes', models.PositiveBigIntegerField(blank=True, editable=False, null=True)),
+                ('content_type', models.CharField(blank=True, editable=False, max_length=100)),
+                ('sha256', models.CharField(blank=True, db_index=True, editable=False, max_length=64)),
+            ],
+            options={
+                'verbose_name': 'Evidence File',
+                'verbose_name_plural': 'Evidence Files',
+                'ordering': ['-uploaded_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ObligationNumberSequence',
+            fields=[
+                ('prefix', models.CharField(max_length=20, primary_key=True, serialize=False)),
+                ('last_value', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Obligation Number Sequence',
+                'verbose_name_plural': 'Obligation Number Sequences',
+            },
+        ),
+        migrations.CreateModel(
+            name='Obligation',
+            fields=[
+                ('obligation_number', models.CharField(help_text='Format: PCEMP-XXX where XXX is a number', max_length=20, primary_key=True, serialize=False)),
+                ('procedure', models.TextField(choices=[('Cultural Heritage Management', 'Cultural Heritage Management'), ('Threated Species Management', 'Threated Species Management'), ('Lighting Management', 'Lighting Management'), ('Surface Water Management', 'Surface Water Management'), ('Solid & Liquid Waste Management', 'Solid & Liquid Waste Management'), ('Dust Management', 'Dust Management'), ('Pest Management', 'Pest Management'), ('Other', 'Other')], default='Missing procedure', help_text='Procedure to follow for this obligation')),
+                ('environmental_aspect', models.CharField(choices=[('Air', 'Air'), ('Water', 'Water'), ('Waste', 'Waste'), ('Energy', 'Energy'), ('Biodiversity', 'Biodiversity'), ('Noise', 'Noise'), ('Chemicals', 'Chemicals'), ('Soil', 'Soil'), ('Administration', 'Administration'), ('Cultural Heritage Management', 'Cultural Heritage Management'), ('Terrestrial Fauna Management', 'Terrestrial Fauna Management'), ('Biosecurity And Pest Management', 'Biosecurity And Pest Management'), ('Dust Management', 'Dust Management'), ('Reporting', 'Reporting'), ('Noise Management', 'Noise Management'), ('Erosion And Sedimentation Management', 'Erosion And Sedimentation Management'), ('Hazardous Substances And Hydrocarbon Management', 'Hazardous Substances And Hydrocarbon Management'), ('Waste Management', 'Waste Management'), ('Artificial Light Management', 'Artificial Light Management'), ('Audits And Inspections', 'Audits And Inspections'), ('Design And Construction Requirements', 'Design And Construction Requirements'), ('Regulatory Compliance Reporting', 'Regulatory Compliance Reporting'), ('Other', 'Other')], max_length=255)),
+                ('custom_environmental_aspect', models.CharField(blank=True, help_text="If 'Other' is selected for Environmental Aspect, please specify the custom aspect here", max_length=255, null=True)),
+                ('obligation', models.TextField()),
+                ('accountability', models.CharField(choices=[('Perdaman', 'Perdaman'), ('SCJV', 'SCJV'), ('SCJV-during construction', 'SCJV-during construction'), ('Perdaman-during operations', 'Perdaman-during operations')], max_length=255)),
+                ('responsibility', models.CharField(choices=[('Perdaman - Management', 'Perdaman - Management'), ('Perdaman - Env & Heritage Manager', 'Perdaman - Env & Heritage Manager'), ('SCJV - Project Director', 'SCJV - Project Director'), ('SCJV - Project Manager', 'SCJV - Project Manager'), ('SCJV - Construction Manager', 'SCJV - Construction Manager'), ('SCJV - Commercial Manager', 'SCJV - Commercial Manager'), ('SCJV - Engineering Manager', 'SCJV - Engineering Manager'), ('SCJV - Environmental Lead', 'SCJV - Environmental Lead'), ('SCJV - HSSE Manager', 'SCJV - HSSE Manager'), ('SCJV - Heritage & Indigenous Relations Manager', 'SCJV - Heritage & Indigenous Relations Manager'), ('SCJV - Lead Environmental Advisor', 'SCJV - Lead Environmental Advisor'), ('SCJV - Senior Environmental Advisor', 'SCJV - Senior Environmental Advisor'), ('SCJV - Construction Director', 'SCJV - Construction Director'), ('SCJV - Project Environmental Representative', 'SCJV - Project Environmental Representative'), ('SCJV - Construction Supervisor', 'SCJV - Construction Supervisor'), ('SCJV - Community and Stakeholder', 'SCJV - Community and Stakeholder')], max_length=255)),
+                ('project_phase', models.CharField(choices=[('Pre-Construction', 'Pre-Construction'), ('Construction', 'Construction'), ('Operation', 'Operation'), ('Decommissioning', 'Decommissioning'), ('Post-Closure', 'Post-Closure'), ('Other', 'Other')], max_length=255, null=True)),
+                ('action_due_date', models.DateField(null=True)),
+                ('close_out_date', models.DateField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('not started', 'Not Started'), ('in progress', 'In Progress'), ('completed', 'Completed')], default='not started', max_length=20)),
+                ('supporting_information', models.TextField(blank=True, null=True)),
+                ('general_comments', models.TextField(blank=True, null=True)),
+                ('compliance_comments', models.TextField(blank=True, null=True)),
+                ('non_conformance_comments', models.TextField(blank=True, null=True)),
+                ('evidence_notes', models.TextField(blank=True, help_text='Notes about the uploaded evidence', null=True)),
+                ('recurring_obligation', models.BooleanField(default=False)),
+                ('recurring_frequency', models.CharField(choices=[('Daily', 'Daily'), ('Weekly', 'Weekly'), ('Fortnightly', 'Fortnightly'), ('Monthly', 'Monthly'), ('Quarterly', 'Quarterly'), ('Annually', 'Annually'), ('Bi-Annually', 'Bi-Annually'), ('As Required', 'As Required'), ('Mobilisation', 'Mobilisation'), ('Decommissioning', 'Decommissioning'), ('Extreme Weather', 'Extreme Weather')], max_length=50, null=True)),
+                ('recurring_status', models.CharField(choices=[('not started', 'Not Started'), ('in progress', 'In Progress'), ('completed', 'Completed'), ('overdue', 'Overdue')], default='not started', max_length=50, null=True)),
+                ('recurring_forcasted_date', models.DateField(blank=True, null=True)),
+                ('inspection', models.BooleanField(default=False)),
+                ('inspection_frequency', models.CharField(choices=[('Daily', 'Daily'), ('Weekly', 'Weekly'), ('Fortnightly', 'Fortnightly'), ('Monthly', 'Monthly'), ('Quarterly', 'Quarterly'), ('Annually', 'Annually')], max_length=50, null=True)),
+                ('site_or_desktop', models.CharField(choices=[('Site', 'Site'), ('Desktop', 'Desktop')], max_length=10, null=True)),
+                ('new_control_action_required', models.BooleanField(default=False)),
+                ('obligation_type', models.CharField(choices=[('Training', 'Training'), ('Monitoring', 'Monitoring'), ('Reporting', 'Reporting'), ('Site based', 'Site based'), ('Incident response', 'Incident response'), ('Plant mobilisation', 'Plant mobilisation'), ('Consultations', 'Consultations'), ('Design', 'Design'), ('Procurement', 'Procurement'), ('Safety', 'Safety')], max_length=50, null=True)),
+                ('gap_analysis', models.BooleanField(default=False)),
+                ('notes_for_gap_analysis', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('primary_environmental_mechanism', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='obligations', to='mechanisms.environmentalmechanism', verbose_name='Environmental Mechanism')),
+            ],
+            options={
+                'verbose_name': 'Obligation',
+                'verbose_name_plural': 'Obligations',
+                'ordering': ['obligation_number'],
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('obligations', '0001_initial'),
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='obligation',
+            name='project',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='obligations', to='projects.project'),
+        ),
+        migrations.AddField(
+            model_name='obligationevidence',
+            name='obligation',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evidences', to='obligations.obligation'),
+        ),
+        migrations.AddIndex(
+            model_name='obligation',
+            index=models.Index(fields=['status', 'obligation_number'], name='obligations_status_06d515_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='obligation',
+            index=models.Index(fields=['action_due_date', 'obligation_number'], name='obligations_action__0b1cd0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='obligation',
+            index=models.Index(fields=['project', 'status', 'action_due_date'], name='obligations_project_f60cfa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='obligation',
+            index=models.Index(fields=['primary_environmental_mechanism', 'status'], name='obligations_primary_bed33c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='obligation',
+            index=models.Index(fields=['responsibility', 'project'], name='obligations_respons_6ea62e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='obligation',
+            index=models.Index(condition=models.Q(('status', 'completed'), _negated=True), fields=['action_due_date'], name='obligation_open_due_idx'),
+        ),
+    ]
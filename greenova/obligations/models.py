@@ -1,16 +1,27 @@
+import hashlib
 import logging
+import mimetypes
 import re
-from datetime import date
+from datetime import date, timedelta
 from typing import Any
 
+from core.storage import deduplicated_storage
 from core.utils.roles import get_responsibility_choices
 from dateutil.relativedelta import relativedelta
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, IntegerField, Max, Value, When
+from django.db.models.functions import Cast, Lower, Substr
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
+from mechanisms.counters import (
+    COUNTER_SOURCE_FIELDS,
+    apply_counter_change,
+    counter_state,
+)
+from mechanisms.models import CounterCheckpoint
 from projects.models import Project
 
 from .constants import (
@@ -21,15 +32,176 @@
     FREQUENCY_MONTHLY,
     FREQUENCY_QUARTERLY,
     FREQUENCY_WEEKLY,
+    OBLIGATION_NUMBER_PREFIX,
     STATUS_CHOICES,
     STATUS_COMPLETED,
     STATUS_NOT_STARTED,
+    STATUS_OVERDUE,
+    STATUS_UPCOMING,
 )
-from .utils import normalize_frequency
+from .utils import get_overdue_q, normalize_frequency
 
 logger = logging.getLogger(__name__)
 
 
+class ObligationNumberSequence(models.Model):
+    """Persistent counter used to allocate sequential obligation numbers.
+
+    One row is kept per prefix. Numbers are handed out by incrementing
+    ``last_value`` with a single atomic UPDATE, so allocation costs O(1) queries
+    regardless of how many obligations exist. The row is seeded once from the
+    highest existing obligation number the first time a prefix is used.
+    """
+
+    prefix: Any = models.CharField(max_length=20, primary_key=True)
+    last_value: Any = models.PositiveBigIntegerField(default=0)
+    updated_at: Any = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Obligation Number Sequence"
+        verbose_name_plural = "Obligation Number Sequences"
+        app_label = "obligations"
+
+    def __str__(self) -> str:
+        return f"{self.prefix}{self.last_value}"
+
+    @classmethod
+    def _current_maximum(cls, prefix: str) -> int:
+        """Return the highest number already used with ``prefix``.
+
+        The maximum is computed by the database in a single aggregate query.
+        """
+        result = (
+            Obligation.objects.filter(
+                obligation_number__regex=rf"^{re.escape(prefix)}[0-9]+$"
+            )
+            .annotate(
+                number=Cast(
+                    Substr("obligation_number", len(prefix) + 1),
+                    output_field=IntegerField(),
+                )
+            )
+            .aggregate(highest=Max("number"))
+        )
+        return int(result["highest"] or 0)
+
+    @classmethod
+    def _ensure_seeded(cls, prefix: str) -> None:
+        """Create the counter row for ``prefix`` from the existing maximum."""
+        if cls.objects.filter(prefix=prefix).exists():
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    prefix=prefix, last_value=cls._current_maximum(prefix)
+                )
+                logger.info("Seeded obligation number sequence for %s", prefix)
+        except IntegrityError:
+            # Another process seeded the row first.
+            pass
+
+    @classmethod
+    def reserve(cls, count: int = 1, prefix: str = OBLIGATION_NUMBER_PREFIX) -> range:
+        """Atomically reserve a contiguous block of ``count`` numbers.
+
+        Args:
+            count: Number of values to reserve (must be positive)
+            prefix: Obligation number prefix the counter belongs to
+
+        Returns:
+            range: The reserved numeric values, in ascending order
+        """
+        if count < 1:
+            raise ValueError("count must be a positive integer")
+
+        cls._ensure_seeded(prefix)
+        with transaction.atomic():
+            # The UPDATE takes the row lock, so the value read back below
+            # cannot be handed out to a concurrent caller.
+            cls.objects.filter(prefix=prefix).update(
+                last_value=F("last_value") + count, updated_at=timezone.now()
+            )
+            last_value = (
+                cls.objects.select_for_update()
+                .values_list("last_value", flat=True)
+                .get(prefix=prefix)
+            )
+        return range(last_value - count + 1, last_value + 1)
+
+    @classmethod
+    def observe(cls, obligation_number: str) -> None:
+        """Advance the counter past an explicitly assigned obligation number.
+
+        Imports and manual entry may supply their own numbers; this keeps the
+        allocator from handing those numbers out again.
+        """
+        prefix = OBLIGATION_NUMBER_PREFIX
+        match = re.match(rf"^{re.escape(prefix)}(\d+)$", obligation_number or "")
+        if not match:
+            return
+        value = int(match.group(1))
+        cls._ensure_seeded(prefix)
+        cls.objects.filter(prefix=prefix, last_value__lt=value).update(
+            last_value=value, updated_at=timezone.now()
+        )
+
+
+# Days ahead of the due date during which an obligation counts as upcoming
+UPCOMING_WINDOW_DAYS = 14
+
+
+class ObligationQuerySet(models.QuerySet):
+    """QuerySet with database-evaluated obligation status predicates.
+
+    These mirror ``obligations.utils.is_obligation_overdue`` and
+    ``get_obligation_status`` so callers can filter and count in SQL instead of
+    loading every obligation into Python.
+    """
+
+    def active(self) -> "ObligationQuerySet":
+        """Obligations that have not been completed."""
+        return self.exclude(status=STATUS_COMPLETED)
+
+    def overdue(self, as_of: date | None = None) -> "ObligationQuerySet":
+        """Obligations past their due date that are not completed."""
+        return self.filter(get_overdue_q(as_of))
+
+    def upcoming(
+        self, days: int = UPCOMING_WINDOW_DAYS, as_of: date | None = None
+    ) -> "ObligationQuerySet":
+        """Active obligations due within the next ``days`` days (inclusive)."""
+        today = as_of or timezone.now().date()
+        return self.active().filter(
+            action_due_date__gte=today,
+            action_due_date__lte=today + timedelta(days=days),
+        )
+
+    def with_effective_status(
+        self, as_of: date | None = None, upcoming_days: int = UPCOMING_WINDOW_DAYS
+    ) -> "ObligationQuerySet":
+        """Annotate ``effective_status`` as computed by ``get_obligation_status``."""
+        today = as_of or timezone.now().date()
+        return self.annotate(
+            effective_status=Case(
+                When(status__iexact=STATUS_COMPLETED, then=Value(STATUS_COMPLETED)),
+                When(action_due_date__lt=today, then=Value(STATUS_OVERDUE)),
+                When(
+                    action_due_date__gte=today,
+                    action_due_date__lte=today + timedelta(days=upcoming_days),
+                    then=Value(STATUS_UPCOMING),
+                ),
+                default=Lower("status"),
+                output_field=models.CharField(),
+            )
+        )
+
+
+class ObligationManager(
+    models.Manager.from_queryset(ObligationQuerySet)  # type: ignore[misc]
+):
+    """Default manager for Obligation exposing the ObligationQuerySet helpers."""
+
+
 class Obligation(models.Model):
     """Represents an environmental obligation."""
 
@@ -211,20 +383,96 @@ class Obligation(models.Model):
     created_at: Any = models.DateTimeField(auto_now_add=True)
     updated_at: Any = models.DateTimeField(auto_now=True)
 
+    objects = ObligationManager()
+
+    # Column values snapshotted at load time so signal handlers can compare
+    # against the stored row without re-reading it
+    TRACKED_FIELDS: tuple[str, ...] = (
+        *COUNTER_SOURCE_FIELDS,
+        "recurring_obligation",
+        "recurring_frequency",
+    )
+
     class Meta:
         verbose_name = "Obligation"
         verbose_name_plural = "Obligations"
         ordering = ["obligation_number"]
         indexes = [
-            models.Index(fields=["status"]),
-            models.Index(fields=["action_due_date"]),
-            models.Index(fields=["project"]),
+            # Trailing obligation_number lets keyset pagination on these
+            # columns resolve each page with a single index range scan
+            models.Index(fields=["status", "obligation_number"]),
+            models.Index(fields=["action_due_date", "obligation_number"]),
+            models.Index(fields=["project", "status", "action_due_date"]),
+            models.Index(fields=["primary_environmental_mechanism", "status"]),
+            models.Index(fields=["responsibility", "project"]),
+            models.Index(
+                fields=["action_due_date"],
+                condition=~models.Q(status=STATUS_COMPLETED),
+                name="obligation_open_due_idx",
+            ),
         ]
         app_label = "obligations"
 
     def __str__(self) -> str:
         return f"{self.obligation_number} - {self.project.name}"
 
+    @classmethod
+    def from_db(cls, db: str, field_names: Any, values: Any) -> "Obligation":
+        """Load an instance and snapshot its tracked fields."""
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def refresh_from_db(
+        self, using: Any = None, fields: Any = None, from_queryset: Any = None
+    ) -> None:
+        """Reload fields from the database and re-snapshot the reloaded ones."""
+        super().refresh_from_db(
+            using=using, fields=fields, from_queryset=from_queryset
+        )
+        if fields is not None and getattr(self, "_loaded_values", None) is None:
+            # A deferred field load; the other fields may hold unsaved changes
+            return
+        self._snapshot_tracked_fields(fields)
+
+    def _snapshot_tracked_fields(self, update_fields: Any = None) -> None:
+        """
+        Store the current tracked values as the last known database state.
+
+        Args:
+            update_fields: If given, only these fields are refreshed in an
+                existing snapshot
+        """
+        loaded = self.__dict__
+        if any(field not in loaded for field in self.TRACKED_FIELDS):
+            # Deferred fields would cost a query each; fall back to no snapshot
+            self._loaded_values = None
+            return
+        current = tuple(loaded[field] for field in self.TRACKED_FIELDS)
+        previous = getattr(self, "_loaded_values", None)
+        if update_fields is None or previous is None:
+            self._loaded_values = current
+            return
+        updated = {self._meta.get_field(name).attname for name in update_fields}
+        self._loaded_values = tuple(
+            new if field in updated else old
+            for field, old, new in zip(
+                self.TRACKED_FIELDS, previous, current, strict=True
+            )
+        )
+
+    def get_loaded_values(self) -> dict[str, Any] | None:
+        """
+        Return the tracked field values as last loaded from or saved to the DB.
+
+        Returns:
+            dict or None if the instance was not loaded with all tracked fields
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if loaded is None:
+            return None
+        return dict(zip(self.TRACKED_FIELDS, loaded, strict=True))
+
     def calculate_next_recurring_date(self) -> date | None:
         """
         Calculate the next recurring date based on frequency and current/last date.
@@ -292,42 +540,47 @@ def update_recurring_forecasted_date(self) -> bool:
 
         return False
 
+    @staticmethod
+    def format_obligation_number(value: int) -> str:
+        """Format a numeric value as an obligation number (e.g., PCEMP-001)."""
+        return f"{OBLIGATION_NUMBER_PREFIX}{value:03d}"
+
+    @staticmethod
+    def canonical_obligation_number(obligation_number: str) -> str:
+        """Return the number as ``save()`` stores it (e.g. ABC-12 -> PCEMP-12)."""
+        if obligation_number.startswith(OBLIGATION_NUMBER_PREFIX):
+            return obligation_number
+        suffix = obligation_number.rsplit("-", maxsplit=1)[-1]
+        return f"{OBLIGATION_NUMBER_PREFIX}{suffix}"
+
     @classmethod
     def get_next_obligation_number(cls) -> str:
         """
-        Generate the next sequential obligation number in the format PCEMP-XXX.
+        Allocate the next sequential obligation number in the format PCEMP-XXX.
 
         Returns:
             str: The next obligation number (e.g., PCEMP-101)
         """
-        prefix = "PCEMP-"
-
-        # Extract the highest numeric value from all obligation numbers
-        highest_number = 0
-
-        # Query all obligation numbers
-        all_obligations = cls.objects.all()
+        (value,) = ObligationNumberSequence.reserve(1)
+        return cls.format_obligation_number(value)
 
-        for obligation in all_obligations:
-            if obligation.obligation_number and obligation.obligation_number.startswith(
-                prefix
-            ):
-                try:
-                    # Extract numeric part after the prefix
-                    number_part = obligation.obligation_number[len(prefix):]
-                    current_number = int(number_part)
-
-                    # Update highest if we found a larger number
-                    highest_number = max(highest_number, current_number)
-                except (ValueError, IndexError):
-                    # Skip if we can't parse the number
-                    continue
+    @classmethod
+    def reserve_obligation_numbers(cls, count: int) -> list[str]:
+        """
+        Reserve a block of obligation numbers for bulk creation.
 
-        # Increment by 1 for the next number
-        next_number = highest_number + 1
+        Args:
+            count: How many numbers to reserve
 
-        # Format with leading zeros (e.g., PCEMP-001)
-        return f"{prefix}{next_number:03d}"
+        Returns:
+            list[str]: The reserved obligation numbers in ascending order
+        """
+        if count < 1:
+            return []
+        return [
+            cls.format_obligation_number(value)
+            for value in ObligationNumberSequence.reserve(count)
+        ]
 
     def clean(self) -> None:
         """Validate the obligation number format."""
@@ -344,24 +597,25 @@ def clean(self) -> None:
                 )
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Override save to update mechanism counts and ensure proper obligation number format."""
+        """Override save to ensure proper obligation number format."""
         # Generate a new obligation number if one isn't provided
         if not self.obligation_number or self.obligation_number.strip() == "":
             self.obligation_number = self.get_next_obligation_number()
 
         # Ensure the format is correct (prefix + number)
-        if not self.obligation_number.startswith("PCEMP-"):
-            self.obligation_number = f"PCEMP-{self.obligation_number.split(
-                '-')[-1] if '-' in self.obligation_number else self.obligation_number}"
+        self.obligation_number = self.canonical_obligation_number(
+            self.obligation_number
+        )
 
+        adding = self._state.adding
         try:
             super().save(*args, **kwargs)
         except Exception as exc:
             logger.error("Error saving obligation: %s", str(exc))
-
-        # Update mechanism counts
-        if self.primary_environmental_mechanism:
-            self.primary_environmental_mechanism.update_obligation_counts()
+        else:
+            self._snapshot_tracked_fields(kwargs.get("update_fields"))
+            if adding:
+                ObligationNumberSequence.observe(self.obligation_number)
 
     @property
     def is_overdue(self) -> bool:
@@ -371,26 +625,62 @@ def is_overdue(self) -> bool:
         return False
 
 
-# Signal handlers to update mechanism counts
+def _stored_values(instance: Obligation) -> dict[str, Any] | None:
+    """Return the tracked values as stored, querying only without a snapshot."""
+    stored = instance.get_loaded_values()
+    if stored is None:
+        stored = (
+            Obligation.objects.filter(pk=instance.pk)
+            .values(*Obligation.TRACKED_FIELDS)
+            .first()
+        )
+    return stored
+
+
+# Signal handlers to keep mechanism counts in step with obligation changes
+@receiver(pre_save, sender=Obligation)
+def capture_counter_state(sender, instance, raw=False, **kwargs):
+    """Remember the obligation's counter fields as stored before this save."""
+    instance._counter_values_before = None
+    if raw or instance._state.adding:
+        return
+    stored = _stored_values(instance)
+    if stored:
+        instance._counter_values_before = {
+            field: stored[field] for field in COUNTER_SOURCE_FIELDS
+        }
+
+
 @receiver(post_save, sender=Obligation)
-def update_mechanism_counts_on_save(sender, instance, **kwargs):
-    """Update mechanism counts when an obligation is saved."""
+def update_mechanism_counts_on_save(sender, instance, raw=False, **kwargs):
+    """Apply the counter delta between the old and new obligation state."""
+    if raw:
+        return
+    before = getattr(instance, "_counter_values_before", None)
+    instance._counter_values_before = None
+    after = {field: getattr(instance, field) for field in COUNTER_SOURCE_FIELDS}
+    if before == after or (
+        before is None and after["primary_environmental_mechanism_id"] is None
+    ):
+        # Nothing that feeds a counter changed; skip the checkpoint read
+        return
     try:
-        if instance.primary_environmental_mechanism:
-            instance.primary_environmental_mechanism.update_obligation_counts()
-            logger.info(
-                "Updated counts for mechanism %s",
-                instance.primary_environmental_mechanism.name,
-            )
+        reference_date = CounterCheckpoint.reference_date()
+        apply_counter_change(
+            counter_state(before, reference_date) if before else None,
+            counter_state(after, reference_date),
+        )
     except Exception as e:
         logger.error("Error updating mechanism counts on save: %s", str(e))
 
 
 @receiver(post_delete, sender=Obligation)
 def update_mechanism_counts_on_delete(sender, instance, **kwargs):
-    """Update mechanism counts when an obligation is deleted."""
-    if instance.primary_environmental_mechanism:
-        instance.primary_environmental_mechanism.update_obligation_counts()
+    """Remove a deleted obligation's contribution from its mechanism counts."""
+    try:
+        apply_counter_change(counter_state(instance), None)
+    except Exception as e:
+        logger.error("Error updating mechanism counts on delete: %s", str(e))
 
 
 class ObligationEvidence(models.Model):
@@ -401,6 +691,7 @@ class ObligationEvidence(models.Model):
     )
     file: Any = models.FileField(
         upload_to="evidence_files/%Y/%m/%d/",
+        storage=deduplicated_storage,
         validators=[
             FileExtensionValidator(
                 allowed_extensions=[
@@ -424,6 +715,15 @@ class ObligationEvidence(models.Model):
     uploaded_at: Any = models.DateTimeField(auto_now_add=True)
     description: Any = models.CharField(max_length=255, blank=True)
 
+    # Captured when the file is uploaded, so listings never touch storage
+    file_size_bytes: Any = models.PositiveBigIntegerField(
+        null=True, blank=True, editable=False
+    )
+    content_type: Any = models.CharField(max_length=100, blank=True, editable=False)
+    sha256: Any = models.CharField(
+        max_length=64, blank=True, editable=False, db_index=True
+    )
+
     class Meta:
         ordering = ["-uploaded_at"]
         verbose_name = "Evidence File"
@@ -432,9 +732,36 @@ class Meta:
     def __str__(self) -> str:
         return f"Evidence for {self.obligation} - {self.file.name}"
 
+    def save(self, *args, **kwargs):
+        """Store a newly attached file and record its metadata."""
+        if self.file and not self.file._committed:
+            self._store_file_with_metadata()
+        super().save(*args, **kwargs)
+
+    def _store_file_with_metadata(self) -> None:
+        content = self.file.file
+        self.content_type = (
+            getattr(content, "content_type", None)
+            or mimetypes.guess_type(self.file.name)[0]
+            or ""
+        )
+        # Save through the storage now (FileField.pre_save would otherwise do
+        # it) so the digest it computes while writing can be recorded too
+        self.file.save(self.file.name, content, save=False)
+        self.file_size_bytes = getattr(content, "content_size", None)
+        self.sha256 = getattr(content, "content_digest", "")
+        if self.file_size_bytes is None or not self.sha256:
+            digest = hashlib.sha256()
+            for chunk in content.chunks():
+                digest.update(chunk)
+            self.file_size_bytes = content.size
+            self.sha256 = digest.hexdigest()
+
     def file_size(self) -> str:
         """Return the file size in a human-readable format."""
-        size = self.file.size
+        size = self.file_size_bytes
+        if size is None:
+            return "Unknown size"
         if size < 1024:
             return f"{size} bytes"
         elif size < 1024 * 1024:
@@ -452,33 +779,31 @@ def update_forecasted_date_on_change(sender, instance, **kwargs):
         instance.update_recurring_forecasted_date()
         return
 
-    try:
-        # Get the existing record to compare changes
-        old_instance = sender.objects.get(pk=instance.pk)
-
-        # Check if relevant fields changed
-        if (
-            instance.recurring_obligation != old_instance.recurring_obligation
-            or instance.recurring_frequency != old_instance.recurring_frequency
-            or instance.status != old_instance.status
-            or instance.action_due_date != old_instance.action_due_date
-        ):
-            instance.update_recurring_forecasted_date()
-
-        # If status changed to completed, handle recurring logic
-        if (
-            instance.status == STATUS_COMPLETED
-            and old_instance.status != STATUS_COMPLETED
-            and instance.recurring_obligation
-        ):
-            # When a recurring obligation is completed, reset status and calculate
-            # next date
-            instance.status = STATUS_NOT_STARTED
-            instance.update_recurring_forecasted_date()
-
-    except sender.DoesNotExist:
-        # This shouldn't happen but just in case
-        pass
+    # Compare against the values snapshotted at load time
+    old_values = None if instance._state.adding else _stored_values(instance)
+    if old_values is None:
+        return
+
+    # If status changed to completed, handle recurring logic
+    if (
+        instance.status == STATUS_COMPLETED
+        and old_values["status"] != STATUS_COMPLETED
+        and instance.recurring_obligation
+    ):
+        # When a recurring obligation is completed, reset status and calculate
+        # next date, once, as obligations.transitions does in bulk
+        instance.status = STATUS_NOT_STARTED
+        instance.update_recurring_forecasted_date()
+        return
+
+    # Check if relevant fields changed
+    if (
+        instance.recurring_obligation != old_values["recurring_obligation"]
+        or instance.recurring_frequency != old_values["recurring_frequency"]
+        or instance.status != old_values["status"]
+        or instance.action_due_date != old_values["action_due_date"]
+    ):
+        instance.update_recurring_forecasted_date()
 
 
 @receiver(pre_save, sender="obligations.Obligation")
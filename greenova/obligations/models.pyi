@@ -1,16 +1,53 @@
 # Type stub file for obligations.models
 # This stub supports both "obligations.models" and "greenova.obligations.models" imports
 
+from datetime import date
 from typing import Any, ClassVar
 
-from django.db.models import Manager, Model
+from django.db.models import Manager, Model, QuerySet
+
+class ObligationQuerySet(QuerySet['Obligation']):
+    def active(self) -> ObligationQuerySet: ...
+    def overdue(self, as_of: date | None = ...) -> ObligationQuerySet: ...
+    def upcoming(
+        self, days: int = ..., as_of: date | None = ...
+    ) -> ObligationQuerySet: ...
+    def with_effective_status(
+        self, as_of: date | None = ..., upcoming_days: int = ...
+    ) -> ObligationQuerySet: ...
 
 class ObligationManager(Manager['Obligation']):
-    pass
+    def get_queryset(self) -> ObligationQuerySet: ...
+    def active(self) -> ObligationQuerySet: ...
+    def overdue(self, as_of: date | None = ...) -> ObligationQuerySet: ...
+    def upcoming(
+        self, days: int = ..., as_of: date | None = ...
+    ) -> ObligationQuerySet: ...
+    def with_effective_status(
+        self, as_of: date | None = ..., upcoming_days: int = ...
+    ) -> ObligationQuerySet: ...
+
+class ObligationNumberSequence(Model):
+    objects: ClassVar[Manager['ObligationNumberSequence']]
+    prefix: str
+    last_value: int
+
+    @classmethod
+    def reserve(cls, count: int = ..., prefix: str = ...) -> range: ...
+    @classmethod
+    def observe(cls, obligation_number: str) -> None: ...
 
 class Obligation(Model):
     objects: ClassVar[ObligationManager]
     obligation_number: str
     status: str
+    TRACKED_FIELDS: ClassVar[tuple[str, ...]]
 
     def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+    @staticmethod
+    def canonical_obligation_number(obligation_number: str) -> str: ...
+    @classmethod
+    def get_next_obligation_number(cls) -> str: ...
+    @classmethod
+    def reserve_obligation_numbers(cls, count: int) -> list[str]: ...
+    def get_loaded_values(self) -> dict[str, Any] | None: ...
@@ -0,0 +1,177 @@
+"""Keyset (cursor) pagination for obligation lists.
+
+Pages are ordered by ``(sort field, obligation_number)`` and each page starts
+strictly after the last row of the previous one, so fetching page N is an
+index range scan instead of an ``OFFSET`` that reads and discards every
+earlier row. The cursor is an opaque URL-safe token holding the sort value and
+obligation number of that last row.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, NamedTuple
+
+from django.db.models import F, Q, QuerySet
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+DEFAULT_SORT = "obligation_number"
+
+# Sortable columns and how to restore their cursor values from JSON
+SORT_FIELDS: dict[str, Any] = {
+    "obligation_number": str,
+    "action_due_date": date.fromisoformat,
+    "status": str,
+    "environmental_aspect": str,
+    "updated_at": datetime.fromisoformat,
+}
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class KeysetPage(NamedTuple):
+    """A page of results and the cursor for the following page."""
+
+    items: list[Any]
+    next_cursor: str | None
+    sort: str
+    order: str
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def normalize_sort(sort: str | None, order: str | None) -> tuple[str, str]:
+    """Return a whitelisted sort field and ``"asc"``/``"desc"`` order."""
+    sort = sort if sort in SORT_FIELDS else DEFAULT_SORT
+    order = "desc" if order == "desc" else "asc"
+    return sort, order
+
+
+def encode_cursor(value: Any, obligation_number: str) -> str:
+    """Encode the sort value and key of a row as an opaque cursor."""
+    if isinstance(value, date | datetime):
+        value = value.isoformat()
+    payload = json.dumps([value, obligation_number], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, str]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, obligation_number = json.loads(base64.urlsafe_b64decode(padded))
+        if value is not None:
+            value = SORT_FIELDS[sort](value)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+    return value, str(obligation_number)
+
+
+def _after_cursor_q(sort: str, order: str, value: Any, obligation_number: str) -> Q:
+    """
+    Rows that follow ``(value, obligation_number)`` in the page ordering.
+
+    NULLs sort first ascending and last descending, which is SQLite's native
+    index order, so both directions are plain forward/backward index scans.
+    """
+    op = "gt" if order == "asc" else "lt"
+    after_key = Q(**{f"obligation_number__{op}": obligation_number})
+    if sort == "obligation_number":
+        return after_key
+    is_null = Q(**{f"{sort}__isnull": True})
+    if value is None:
+        after_null = is_null & after_key
+        return after_null if order == "desc" else after_null | ~is_null
+    # The redundant gte/lte bound gives the planner a range to seek to
+    after_value = Q(**{f"{sort}__{op}e": value}) & (
+        Q(**{f"{sort}__{op}": value}) | after_key
+    )
+    return after_value | is_null if order == "desc" else after_value
+
+
+def keyset_queryset(
+    queryset: QuerySet,
+    sort: str | None = None,
+    order: str | None = None,
+    cursor: str | None = None,
+) -> QuerySet:
+    """
+    Order ``queryset`` for keyset pagination and skip to ``cursor``.
+
+    Args:
+        queryset: Obligations to paginate; any existing ordering is replaced
+        sort: Field to sort by (unknown values fall back to obligation number)
+        order: ``"asc"`` or ``"desc"``
+        cursor: Cursor returned with the previous page, if any
+
+    Returns:
+        QuerySet: Rows from the cursor onwards, in page order
+
+    Raises:
+        InvalidCursor: If ``cursor`` is malformed
+    """
+    sort, order = normalize_sort(sort, order)
+    descending = order == "desc"
+
+    ordering = [F("obligation_number").desc() if descending else "obligation_number"]
+    if sort != "obligation_number":
+        ordering.insert(
+            0,
+            F(sort).desc(nulls_last=True)
+            if descending
+            else F(sort).asc(nulls_first=True),
+        )
+    queryset = queryset.order_by(*ordering)
+
+    if cursor:
+        value, obligation_number = decode_cursor(cursor, sort)
+        queryset = queryset.filter(
+            _after_cursor_q(sort, order, value, obligation_number)
+        )
+    return queryset
+
+
+def paginate_keyset(
+    queryset: QuerySet,
+    sort: str | None = None,
+    order: str | None = None,
+    cursor: str | None = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> KeysetPage:
+    """
+    Return one page of ``queryset`` ordered by ``(sort, obligation_number)``.
+
+    Args:
+        queryset: Obligations to paginate; any existing ordering is replaced
+        sort: Field to sort by (unknown values fall back to obligation number)
+        order: ``"asc"`` or ``"desc"``
+        cursor: Cursor returned with the previous page, if any
+        page_size: Number of rows per page
+
+    Returns:
+        KeysetPage: The rows of this page and the cursor for the next one
+
+    Raises:
+        InvalidCursor: If ``cursor`` is malformed
+    """
+    sort, order = normalize_sort(sort, order)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    rows = list(keyset_queryset(queryset, sort, order, cursor)[: page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort), last.obligation_number)
+    return KeysetPage(items=rows, next_cursor=next_cursor, sort=sort, order=order)
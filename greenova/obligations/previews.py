@@ -0,0 +1,232 @@
+"""Background preview generation for evidence files.
+
+Previews are small WebP renderings of an evidence image, or of the first
+page of a PDF, so the obligation modal shows evidence without downloading the
+originals. They are generated in a thread pool of
+``EVIDENCE_PREVIEW_WORKERS`` threads after the upload commits, with at most
+``EVIDENCE_PREVIEW_QUEUE`` jobs queued or running; further files stay pending
+and are queued when next viewed. Previews are cached on disk under
+``EVIDENCE_PREVIEW_ROOT`` by the file's SHA-256, so identical files share a
+preview and a cached preview never goes stale.
+
+PDF pages are rendered with poppler's ``pdftoppm`` when it is installed;
+without it PDFs fall back to a generic placeholder. A file that cannot be
+decoded, such as a corrupt image or PDF, gets a ``<digest>.failed`` marker
+next to where its preview would be, so it is reported as unsupported rather
+than queued again on every view. Other failures (a ``pdftoppm`` timeout, a
+full disk) leave the preview pending, to be retried.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import ObligationEvidence
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_SIZE = (320, 320)
+PREVIEW_FORMAT = "WEBP"
+PREVIEW_CONTENT_TYPE = "image/webp"
+PDF_RENDER_TIMEOUT = 30
+DEFAULT_QUEUE_SIZE = 32
+
+# Preview states reported by preview_status()
+READY = "ready"
+PENDING = "pending"
+UNSUPPORTED = "unsupported"
+
+# The shared thread pool, created on first use, under "executor"
+_state: dict[str, ThreadPoolExecutor | None] = {"executor": None}
+_pending: dict[str, Future] = {}
+_lock = threading.RLock()
+
+
+def preview_root() -> str:
+    """Directory holding cached previews."""
+    return getattr(
+        settings,
+        "EVIDENCE_PREVIEW_ROOT",
+        os.path.join(settings.MEDIA_ROOT, "evidence_previews"),
+    )
+
+
+def preview_path(digest: str) -> str:
+    """Cache path of the preview for content with SHA-256 ``digest``."""
+    return os.path.join(preview_root(), digest[:2], f"{digest}.webp")
+
+
+def failure_path(digest: str) -> str:
+    """Marker recording that the preview for ``digest`` could not be rendered."""
+    return os.path.join(preview_root(), digest[:2], f"{digest}.failed")
+
+
+def is_previewable(evidence: ObligationEvidence) -> bool:
+    """Whether a preview can be generated for the evidence file."""
+    if not evidence.sha256:
+        return False
+    if evidence.content_type == "application/pdf":
+        return shutil.which("pdftoppm") is not None
+    return evidence.content_type.startswith("image/")
+
+
+def preview_status(evidence: ObligationEvidence) -> str:
+    """Return READY, PENDING or UNSUPPORTED for the evidence's preview."""
+    if not is_previewable(evidence):
+        return UNSUPPORTED
+    if os.path.exists(preview_path(evidence.sha256)):
+        return READY
+    if os.path.exists(failure_path(evidence.sha256)):
+        return UNSUPPORTED
+    return PENDING
+
+
+def _render_image(source: Any, target: str) -> None:
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image.thumbnail(PREVIEW_SIZE)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        image.save(target, PREVIEW_FORMAT, quality=80)
+
+
+def _render_pdf(source: Any, target: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        pdf = os.path.join(directory, "source.pdf")
+        with open(pdf, "wb") as handle:
+            for chunk in source.chunks():
+                handle.write(chunk)
+        page = os.path.join(directory, "page")
+        subprocess.run(
+            [
+                "pdftoppm",
+                "-png",
+                "-singlefile",
+                "-f",
+                "1",
+                "-l",
+                "1",
+                "-scale-to",
+                str(max(PREVIEW_SIZE)),
+                pdf,
+                page,
+            ],
+            check=True,
+            capture_output=True,
+            timeout=PDF_RENDER_TIMEOUT,
+        )
+        with open(f"{page}.png", "rb") as rendered:
+            _render_image(rendered, target)
+
+
+def _is_undecodable(error: Exception) -> bool:
+    """Whether rendering failed because of the file rather than the moment."""
+    from PIL import Image, UnidentifiedImageError
+
+    return isinstance(
+        error,
+        UnidentifiedImageError
+        | Image.DecompressionBombError
+        | SyntaxError
+        | ValueError
+        | subprocess.CalledProcessError,
+    )
+
+
+def generate_preview(evidence: ObligationEvidence) -> str | None:
+    """
+    Render and cache the preview for an evidence file.
+
+    Returns:
+        str | None: Path of the cached preview, or None if the file cannot be
+        previewed
+    """
+    if not is_previewable(evidence):
+        return None
+    target = preview_path(evidence.sha256)
+    if os.path.exists(target):
+        return target
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+    os.close(fd)
+    try:
+        with evidence.file.open("rb") as source:
+            if evidence.content_type == "application/pdf":
+                _render_pdf(source, temporary)
+            else:
+                _render_image(source, temporary)
+        # Readers only ever see a complete preview
+        os.replace(temporary, target)
+    except Exception as e:
+        logger.exception("Could not generate a preview for evidence %s", evidence.pk)
+        if _is_undecodable(e):
+            # Remembered, so the file is not queued again on every view
+            with open(failure_path(evidence.sha256), "w") as marker:
+                marker.write(f"{type(e).__name__}: {e}\n")
+        return None
+    finally:
+        if os.path.exists(temporary):
+            os.unlink(temporary)
+    return target
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    with _lock:
+        executor = _state["executor"]
+        if executor is None:
+            executor = _state["executor"] = ThreadPoolExecutor(
+                max_workers=getattr(settings, "EVIDENCE_PREVIEW_WORKERS", 2),
+                thread_name_prefix="evidence-preview",
+            )
+        return executor
+
+
+def _finished(digest: str, future: Future) -> None:
+    with _lock:
+        if _pending.get(digest) is future:
+            del _pending[digest]
+
+
+def schedule_preview(evidence: ObligationEvidence) -> Future | None:
+    """
+    Queue preview generation, unless it is cached, queued or unsupported.
+
+    Nothing is queued while ``EVIDENCE_PREVIEW_QUEUE`` jobs are already
+    queued or running; the preview stays pending.
+
+    Returns:
+        Future | None: The queued (or already running) job, if any
+    """
+    if preview_status(evidence) != PENDING:
+        return None
+    executor = _get_executor()
+    limit = getattr(settings, "EVIDENCE_PREVIEW_QUEUE", DEFAULT_QUEUE_SIZE)
+    with _lock:
+        future = _pending.get(evidence.sha256)
+        if future is None:
+            if len(_pending) >= max(1, limit):
+                return None
+            future = executor.submit(generate_preview, evidence)
+            _pending[evidence.sha256] = future
+            future.add_done_callback(lambda done: _finished(evidence.sha256, done))
+    return future
+
+
+@receiver(post_save, sender=ObligationEvidence)
+def schedule_preview_on_upload(sender, instance, created, raw=False, **kwargs):
+    """Start generating a preview once the new evidence row is committed."""
+    if created and not raw:
+        transaction.on_commit(lambda: schedule_preview(instance))
@@ -0,0 +1 @@
+"""Proto definitions for obligation exchange."""
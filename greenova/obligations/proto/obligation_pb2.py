@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: obligations/proto/obligation.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'obligations/proto/obligation.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"obligations/proto/obligation.proto\x12\x14greenova.obligations\"\xf1\n\n\x10ObligationRecord\x12\x19\n\x11obligation_number\x18\x01 \x01(\t\x12\x0f\n\x07project\x18\x02 \x01(\t\x12,\n\x1fprimary_environmental_mechanism\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tprocedure\x18\x04 \x01(\tH\x01\x88\x01\x01\x12!\n\x14\x65nvironmental_aspect\x18\x05 \x01(\tH\x02\x88\x01\x01\x12(\n\x1b\x63ustom_environmental_aspect\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x12\n\nobligation\x18\x07 \x01(\t\x12\x1b\n\x0e\x61\x63\x63ountability\x18\x08 \x01(\tH\x04\x88\x01\x01\x12\x1b\n\x0eresponsibility\x18\t \x01(\tH\x05\x88\x01\x01\x12\x1a\n\rproject_phase\x18\n \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0f\x61\x63tion_due_date\x18\x0b \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0e\x63lose_out_date\x18\x0c \x01(\tH\x08\x88\x01\x01\x12\x0e\n\x06status\x18\r \x01(\t\x12#\n\x16supporting_information\x18\x0e \x01(\tH\t\x88\x01\x01\x12\x1d\n\x10general_comments\x18\x0f \x01(\tH\n\x88\x01\x01\x12 \n\x13\x63ompliance_comments\x18\x10 \x01(\tH\x0b\x88\x01\x01\x12%\n\x18non_conformance_comments\x18\x11 \x01(\tH\x0c\x88\x01\x01\x12\x1b\n\x0e\x65vidence_notes\x18\x12 \x01(\tH\r\x88\x01\x01\x12\x1c\n\x14recurring_obligation\x18\x13 \x01(\x08\x12 \n\x13recurring_frequency\x18\x14 \x01(\tH\x0e\x88\x01\x01\x12\x1d\n\x10recurring_status\x18\x15 \x01(\tH\x0f\x88\x01\x01\x12%\n\x18recurring_forcasted_date\x18\x16 \x01(\tH\x10\x88\x01\x01\x12\x12\n\ninspection\x18\x17 \x01(\x08\x12!\n\x14inspection_frequency\x18\x18 \x01(\tH\x11\x88\x01\x01\x12\x1c\n\x0fsite_or_desktop\x18\x19 \x01(\tH\x12\x88\x01\x01\x12#\n\x1bnew_control_action_required\x18\x1a \x01(\x08\x12\x1c\n\x0fobligation_type\x18\x1b \x01(\tH\x13\x88\x01\x01\x12\x14\n\x0cgap_analysis\x18\x1c \x01(\x08\x12#\n\x16notes_for_gap_analysis\x18\x1d \x01(\tH\x14\x88\x01\x01\x42\"\n _primary_environmental_mechanismB\x0c\n\n_procedureB\x17\n\x15_environmental_aspectB\x1e\n\x1c_custom_environmental_aspectB\x11\n\x0f_accountabilityB\x11\n\x0f_responsibilityB\x10\n\x0e_project_phaseB\x12\n\x10_action_due_dateB\x11\n\x0f_close_out_dateB\x19\n\x17_supporting_informationB\x13\n\x11_general_commentsB\x16\n\x14_compliance_commentsB\x1b\n\x19_non_conformance_commentsB\x11\n\x0f_evidence_notesB\x16\n\x14_recurring_frequencyB\x13\n\x11_recurring_statusB\x1b\n\x19_recurring_forcasted_dateB\x17\n\x15_inspection_frequencyB\x12\n\x10_site_or_desktopB\x12\n\x10_obligation_typeB\x19\n\x17_notes_for_gap_analysis\"k\n\x0fObligationBatch\x12\x10\n\x08sequence\x18\x01 \x01(\r\x12\x37\n\x07records\x18\x02 \x03(\x0b\x32&.greenova.obligations.ObligationRecord\x12\r\n\x05\x63rc32\x18\x03 \x01(\r\"U\n\x16ObligationStreamHeader\x12\x16\n\x0e\x66ormat_version\x18\x01 \x01(\r\x12\x13\n\x0b\x65xported_at\x18\x02 \x01(\t\x12\x0e\n\x06source\x18\x03 \x01(\tB0\n\x18\x63om.greenova.obligationsZ\x14greenova/obligationsb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'obligations.proto.obligation_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\030com.greenova.obligationsZ\024greenova/obligations'
+  _globals['_OBLIGATIONRECORD']._serialized_start=61
+  _globals['_OBLIGATIONRECORD']._serialized_end=1454
+  _globals['_OBLIGATIONBATCH']._serialized_start=1456
+  _globals['_OBLIGATIONBATCH']._serialized_end=1563
+  _globals['_OBLIGATIONSTREAMHEADER']._serialized_start=1565
+  _globals['_OBLIGATIONSTREAMHEADER']._serialized_end=1650
+# @@protoc_insertion_point(module_scope)
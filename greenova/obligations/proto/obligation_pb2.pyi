@@ -0,0 +1,36 @@
+"""Type stub for obligation_pb2.py."""
+
+from typing import Any, ClassVar
+
+class ObligationRecord:
+    DESCRIPTOR: ClassVar[Any]
+    obligation_number: str
+    project: str
+    primary_environmental_mechanism: str
+    status: str
+    obligation: str
+
+    def __init__(self, **kwargs: Any) -> None: ...
+    def HasField(self, field_name: str) -> bool: ...
+    def SerializeToString(self, deterministic: bool = ...) -> bytes: ...
+    def __getattr__(self, name: str) -> Any: ...
+
+class ObligationBatch:
+    sequence: int
+    records: list[ObligationRecord]
+    crc32: int
+
+    def __init__(self, **kwargs: Any) -> None: ...
+    def SerializeToString(self, deterministic: bool = ...) -> bytes: ...
+    @classmethod
+    def FromString(cls, data: bytes) -> "ObligationBatch": ...
+
+class ObligationStreamHeader:
+    format_version: int
+    exported_at: str
+    source: str
+
+    def __init__(self, **kwargs: Any) -> None: ...
+    def SerializeToString(self, deterministic: bool = ...) -> bytes: ...
+    @classmethod
+    def FromString(cls, data: bytes) -> "ObligationStreamHeader": ...
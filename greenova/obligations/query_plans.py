@@ -0,0 +1,196 @@
+"""Catalogue of hot obligation queries and their query plans.
+
+Each entry rebuilds a query issued by ``dashboard.views``, ``obligations.views``
+or ``procedures.views`` with representative parameters, so its plan can be
+checked with ``EXPLAIN QUERY PLAN`` (via ``QuerySet.explain``). The
+``explain_obligation_queries`` management command reports entries whose plan
+falls back to scanning the whole obligations table.
+"""
+
+import re
+from collections.abc import Callable
+from datetime import date, timedelta
+from typing import NamedTuple
+
+from django.db.models import Count, QuerySet
+from django.utils import timezone
+
+from .constants import STATUS_COMPLETED, STATUS_IN_PROGRESS, STATUS_NOT_STARTED
+from .pagination import DEFAULT_PAGE_SIZE, encode_cursor, keyset_queryset
+from .utils import get_overdue_q
+
+ACTIVE_STATUSES = [STATUS_NOT_STARTED, STATUS_IN_PROGRESS]
+
+# SEARCH lines seek into an index; SCAN lines read every row of the table or
+# of one of its indexes
+_SCAN_RE = re.compile(r"\bSCAN (?P<table>\w+)")
+
+
+class HotQuery(NamedTuple):
+    """A named query builder and the view it comes from."""
+
+    name: str
+    source: str
+    build: Callable[[int, int, date], QuerySet]
+
+
+class QueryPlan(NamedTuple):
+    """The plan of one catalogue entry."""
+
+    query: HotQuery
+    plan: str
+    full_scans: list[str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.full_scans
+
+
+def _obligations() -> QuerySet:
+    from .models import Obligation
+
+    return Obligation.objects.all()
+
+
+HOT_QUERIES: list[HotQuery] = [
+    HotQuery(
+        "dashboard overdue obligations",
+        "dashboard.views.DashboardHomeView.get_overdue_obligations",
+        lambda project, mechanism, today: _obligations().filter(
+            project_id=project,
+            action_due_date__lt=today,
+            status__in=ACTIVE_STATUSES,
+        ),
+    ),
+    HotQuery(
+        "dashboard active count",
+        "dashboard.views.DashboardHomeView.get_active_obligations_count",
+        lambda project, mechanism, today: _obligations()
+        .filter(project_id=project, status__in=ACTIVE_STATUSES)
+        .order_by()
+        .values("pk"),
+    ),
+    HotQuery(
+        "dashboard upcoming deadlines",
+        "dashboard.views.UpcomingObligationsView.get_queryset",
+        lambda project, mechanism, today: _obligations()
+        .filter(
+            project_id=project,
+            action_due_date__gte=today,
+            action_due_date__lte=today + timedelta(days=14),
+            status__in=ACTIVE_STATUSES,
+        )
+        .order_by("action_due_date")[:10],
+    ),
+    HotQuery(
+        "dashboard last overdue per project",
+        "dashboard.views.ProjectOverviewView.get_context_data",
+        lambda project, mechanism, today: _obligations()
+        .filter(
+            project_id=project,
+            action_due_date__lt=today,
+            status__in=ACTIVE_STATUSES,
+        )
+        .order_by("-action_due_date")[:1],
+    ),
+    HotQuery(
+        "project overdue count",
+        "obligations.views.TotalOverdueObligationsView",
+        lambda project, mechanism, today: _obligations()
+        .filter(project_id=project)
+        .overdue(today)
+        .order_by()
+        .values("pk"),
+    ),
+    HotQuery(
+        "mechanism obligations",
+        "obligations.views.ObligationSummaryView.get_context_data",
+        lambda project, mechanism, today: _obligations().filter(
+            primary_environmental_mechanism_id=mechanism
+        ),
+    ),
+    HotQuery(
+        "mechanism status breakdown",
+        "procedures.views.ProcedureChartsView._calculate_statistics",
+        lambda project, mechanism, today: _obligations()
+        .filter(primary_environmental_mechanism_id=mechanism, status=STATUS_COMPLETED)
+        .order_by()
+        .values("pk"),
+    ),
+    HotQuery(
+        "procedure status counts",
+        "procedures.figures.get_procedure_status_stats",
+        lambda project, mechanism, today: _obligations()
+        .filter(primary_environmental_mechanism_id=mechanism)
+        .exclude(procedure__isnull=True)
+        .exclude(procedure="")
+        .order_by()
+        .values("procedure", "status")
+        .annotate(
+            count=Count("pk"), overdue=Count("pk", filter=get_overdue_q(today))
+        ),
+    ),
+    HotQuery(
+        "responsibility filter",
+        "procedures.views.ProcedureChartsView._apply_filters",
+        lambda project, mechanism, today: _obligations().filter(
+            project_id=project, responsibility="Perdaman"
+        ),
+    ),
+    HotQuery(
+        "summary status filter",
+        "obligations.filters.filter_by_status",
+        lambda project, mechanism, today: _obligations().filter(
+            project_id=project, status__in=[STATUS_IN_PROGRESS]
+        ),
+    ),
+    HotQuery(
+        "keyset page by due date",
+        "obligations.views.ObligationListView",
+        lambda project, mechanism, today: _keyset_page(today),
+    ),
+]
+
+
+def _keyset_page(today: date) -> QuerySet:
+    """A later page of the due-date-sorted list, as paginate_keyset builds it."""
+    cursor = encode_cursor(today, "PCEMP-050")
+    return keyset_queryset(_obligations(), "action_due_date", "asc", cursor)[
+        :DEFAULT_PAGE_SIZE
+    ]
+
+
+def find_full_scans(plan: str, table: str) -> list[str]:
+    """Return plan lines that read all of ``table`` or one of its indexes."""
+    return [
+        line.strip(" -|`")
+        for line in plan.splitlines()
+        if (match := _SCAN_RE.search(line)) and match["table"] == table
+    ]
+
+
+def explain_hot_queries(
+    project_id: int = 1,
+    mechanism_id: int = 1,
+    today: date | None = None,
+) -> list[QueryPlan]:
+    """
+    Run ``EXPLAIN QUERY PLAN`` for every catalogue entry.
+
+    Args:
+        project_id: Project id used as the query parameter
+        mechanism_id: Mechanism id used as the query parameter
+        today: Reference date (defaults to today)
+
+    Returns:
+        list[QueryPlan]: One plan per catalogue entry
+    """
+    from .models import Obligation
+
+    today = today or timezone.now().date()
+    table = Obligation._meta.db_table
+    plans = []
+    for query in HOT_QUERIES:
+        plan = query.build(project_id, mechanism_id, today).explain()
+        plans.append(QueryPlan(query, plan, find_full_scans(plan, table)))
+    return plans
@@ -0,0 +1,229 @@
+"""Full-text search over obligations.
+
+On SQLite an FTS5 table indexes the obligation number, obligation text,
+supporting information and comment columns. It is kept in sync with
+``obligations_obligation`` by triggers so that ``QuerySet.update`` and
+``bulk_create`` are indexed as well as ``save()``. The trigram tokenizer gives
+the same case-insensitive substring semantics as the ``icontains`` lookups it
+replaces, ranked with bm25.
+
+The obligations table has a text primary key, and ``VACUUM`` may renumber its
+implicit rowids, so the index does not use them. Each obligation number gets
+a document id in a key table with an ``INTEGER PRIMARY KEY``, which ``VACUUM``
+preserves, and the contentless FTS5 table is keyed by that id.
+
+Other backends, and search terms shorter than a trigram, fall back to
+``icontains`` lookups over the same columns.
+"""
+
+import logging
+
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.db.models import Q, QuerySet
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TABLE = "obligations_obligation_fts"
+# Maps obligation numbers to the document ids of SEARCH_TABLE
+SEARCH_KEY_TABLE = "obligations_obligation_fts_key"
+SEARCH_COLUMNS: tuple[str, ...] = (
+    "obligation_number",
+    "obligation",
+    "supporting_information",
+    "general_comments",
+    "compliance_comments",
+    "non_conformance_comments",
+)
+# The trigram tokenizer cannot match shorter terms
+MIN_SEARCH_TERM_LENGTH = 3
+
+
+def _source_table() -> str:
+    from .models import Obligation
+
+    return Obligation._meta.db_table
+
+
+def _trigger_sql(source: str) -> list[str]:
+    columns = ", ".join(SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in SEARCH_COLUMNS)
+    add_key = (
+        f"INSERT INTO {SEARCH_KEY_TABLE}(obligation_number) "
+        "VALUES (new.obligation_number);"
+    )
+    insert = (
+        f"INSERT INTO {SEARCH_TABLE}(rowid, {columns}) VALUES ("
+        f"(SELECT docid FROM {SEARCH_KEY_TABLE} "
+        f"WHERE obligation_number = new.obligation_number), {new_values});"
+    )
+    # A contentless table needs the indexed values to remove a document
+    delete = (
+        f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, {columns}) "
+        f"VALUES ('delete', (SELECT docid FROM {SEARCH_KEY_TABLE} "
+        f"WHERE obligation_number = old.obligation_number), {old_values});"
+    )
+    rename_key = (
+        f"UPDATE {SEARCH_KEY_TABLE} SET obligation_number = new.obligation_number "
+        "WHERE obligation_number = old.obligation_number;"
+    )
+    remove_key = (
+        f"DELETE FROM {SEARCH_KEY_TABLE} "
+        "WHERE obligation_number = old.obligation_number;"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai "
+        f"AFTER INSERT ON {source} BEGIN {add_key} {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad "
+        f"AFTER DELETE ON {source} BEGIN {delete} {remove_key} END",
+        f"CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au "
+        f"AFTER UPDATE OF {columns} ON {source} "
+        f"BEGIN {delete} {rename_key} {insert} END",
+    ]
+
+
+def _populate_sql(source: str) -> list[str]:
+    columns = ", ".join(SEARCH_COLUMNS)
+    values = ", ".join(f"o.{column}" for column in SEARCH_COLUMNS)
+    return [
+        f"INSERT INTO {SEARCH_KEY_TABLE}(obligation_number) "
+        f"SELECT obligation_number FROM {source}",
+        f"INSERT INTO {SEARCH_TABLE}(rowid, {columns}) "
+        f"SELECT k.docid, {values} FROM {source} o "
+        f"JOIN {SEARCH_KEY_TABLE} k ON k.obligation_number = o.obligation_number",
+    ]
+
+
+def _drop_search_index(cursor) -> None:
+    for suffix in ("ai", "ad", "au"):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_{suffix}")
+    cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+    cursor.execute(f"DROP TABLE IF EXISTS {SEARCH_KEY_TABLE}")
+
+
+def search_index_available(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """Return True if the FTS5 index exists on the given database."""
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [SEARCH_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def ensure_search_index(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """
+    Create the FTS5 table and its triggers if they do not exist.
+
+    A newly created table is populated from the existing obligations. An
+    index without a key table, which was keyed by the obligations table's
+    rowids, is dropped and rebuilt.
+
+    Args:
+        using: Database alias
+
+    Returns:
+        bool: True if the index is available afterwards
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return False
+    source = _source_table()
+    if source not in connection.introspection.table_names():
+        return False
+
+    tables = connection.introspection.table_names()
+    created = SEARCH_KEY_TABLE not in tables
+    try:
+        with connection.cursor() as cursor:
+            if created and SEARCH_TABLE in tables:
+                _drop_search_index(cursor)
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {SEARCH_KEY_TABLE} ("
+                "docid INTEGER PRIMARY KEY, "
+                "obligation_number TEXT NOT NULL UNIQUE)"
+            )
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                f"{', '.join(SEARCH_COLUMNS)}, content='', tokenize='trigram')"
+            )
+            for statement in _trigger_sql(source):
+                cursor.execute(statement)
+            if created:
+                for statement in _populate_sql(source):
+                    cursor.execute(statement)
+    except OperationalError as e:
+        # e.g. SQLite built without FTS5 or older than 3.34 (no trigram)
+        logger.warning("Obligation search index unavailable: %s", str(e))
+        return False
+    return True
+
+
+def rebuild_search_index(using: str = DEFAULT_DB_ALIAS) -> int:
+    """
+    Drop and recreate the FTS5 index from the obligations table.
+
+    Returns:
+        int: Number of indexed rows, or -1 if the index is unavailable
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return -1
+    with connection.cursor() as cursor:
+        _drop_search_index(cursor)
+    if not ensure_search_index(using):
+        return -1
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM {SEARCH_KEY_TABLE}")
+        return cursor.fetchone()[0]
+
+
+def _match_expression(term: str) -> str:
+    """Quote ``term`` as a single FTS5 phrase (substring match with trigrams)."""
+    return '"{}"'.format(term.replace('"', '""'))
+
+
+def fallback_search_q(term: str) -> Q:
+    """Build the ``icontains`` filter used when the index cannot be used."""
+    query = Q()
+    for column in SEARCH_COLUMNS:
+        query |= Q(**{f"{column}__icontains": term})
+    return query
+
+
+def search_obligations(queryset: QuerySet, term: str) -> QuerySet:
+    """
+    Filter obligations matching ``term``, best matches first.
+
+    Args:
+        queryset: Obligations to search
+        term: Free-text search term
+
+    Returns:
+        QuerySet: Matching obligations, annotated with ``search_rank`` and
+        ordered by it when the FTS5 index is used
+    """
+    term = term.strip()
+    if not term:
+        return queryset
+    if len(term) < MIN_SEARCH_TERM_LENGTH or not search_index_available(
+        queryset.db
+    ):
+        return queryset.filter(fallback_search_q(term))
+
+    # One join: the MATCH drives the query, then the key table and the
+    # obligations are looked up by primary key
+    source = _source_table()
+    return queryset.extra(
+        select={"search_rank": f"{SEARCH_TABLE}.rank"},
+        tables=[SEARCH_TABLE, SEARCH_KEY_TABLE],
+        where=[
+            f"{SEARCH_TABLE} MATCH %s",
+            f"{SEARCH_KEY_TABLE}.docid = {SEARCH_TABLE}.rowid",
+            f"{SEARCH_KEY_TABLE}.obligation_number = {source}.obligation_number",
+        ],
+        params=[_match_expression(term)],
+    ).order_by("search_rank", "obligation_number")
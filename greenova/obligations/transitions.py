@@ -0,0 +1,164 @@
+"""Set-based status transitions for many obligations at once.
+
+Saving obligations one by one runs the recurring rollover and counter
+receivers per row. ``transition_status`` reproduces their effect for whole
+batches: it reads the affected rows once, writes the new statuses with one
+``UPDATE`` per outcome, recalculates recurring forecasts in bulk, applies the
+summed mechanism counter deltas and sends a single ``dashboard_data_updated``
+signal for the whole request.
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from dashboard.signals import dashboard_data_updated
+from django.db import transaction
+from django.utils import timezone
+from mechanisms.counters import (
+    COUNTER_SOURCE_FIELDS,
+    apply_counter_deltas,
+    compute_counter_deltas,
+    counter_state,
+    merge_counter_deltas,
+)
+from mechanisms.models import CounterCheckpoint
+
+from .constants import STATUS_CHOICES, STATUS_COMPLETED, STATUS_NOT_STARTED
+from .forecasting import update_recurring_dates
+from .models import Obligation
+
+logger = logging.getLogger(__name__)
+
+VALID_STATUSES = frozenset(value for value, _label in STATUS_CHOICES)
+DEFAULT_BATCH_SIZE = 2000
+
+
+class TransitionResult(NamedTuple):
+    """Outcome of a bulk status transition."""
+
+    updated: list[str]
+    rolled_over: list[str]
+    unchanged: list[str]
+    missing: list[str]
+
+
+def _batches(values: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+def _transition_batch(
+    ids: Sequence[str], status: str, reference_date: Any
+) -> tuple[list[str], list[str], list[str], set[int]]:
+    """Transition one batch inside a transaction."""
+    rows = list(
+        Obligation.objects.select_for_update()
+        .filter(obligation_number__in=ids)
+        .order_by()
+        .values("pk", "project_id", "recurring_obligation", *COUNTER_SOURCE_FIELDS)
+    )
+
+    changed: list[str] = []
+    rolled_over: list[str] = []
+    unchanged: list[str] = []
+    deltas = []
+    for row in rows:
+        if row["status"] == status:
+            unchanged.append(row["pk"])
+            continue
+        # Completing a recurring obligation starts its next cycle instead
+        rollover = status == STATUS_COMPLETED and row["recurring_obligation"]
+        new_status = STATUS_NOT_STARTED if rollover else status
+        (rolled_over if rollover else changed).append(row["pk"])
+        deltas.append(
+            compute_counter_deltas(
+                counter_state(row, reference_date),
+                counter_state({**row, "status": new_status}, reference_date),
+            )
+        )
+
+    now = timezone.now()
+    if changed:
+        Obligation.objects.filter(pk__in=changed).update(status=status, updated_at=now)
+    if rolled_over:
+        Obligation.objects.filter(pk__in=rolled_over).update(
+            status=STATUS_NOT_STARTED, updated_at=now
+        )
+    # A status change on a recurring obligation recalculates its forecast
+    recurring = [
+        row["pk"]
+        for row in rows
+        if row["recurring_obligation"] and row["status"] != status
+    ]
+    if recurring:
+        update_recurring_dates(Obligation.objects.filter(pk__in=recurring))
+    apply_counter_deltas(merge_counter_deltas(*deltas))
+
+    projects = {row["project_id"] for row in rows if row["status"] != status}
+    return changed, rolled_over, unchanged, projects
+
+
+def transition_status(
+    ids: Iterable[str | int],
+    status: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    sender: Any = Obligation,
+) -> TransitionResult:
+    """
+    Move the given obligations to ``status`` in set-based batches.
+
+    Args:
+        ids: Obligation numbers to transition
+        status: Target status, one of ``STATUS_CHOICES``
+        batch_size: Obligations handled per transaction
+        sender: Sender of the coalesced ``dashboard_data_updated`` signal
+
+    Returns:
+        TransitionResult: The obligation numbers by outcome
+
+    Raises:
+        ValueError: If ``status`` is not a valid obligation status
+    """
+    if status not in VALID_STATUSES:
+        raise ValueError(
+            f"Invalid status '{status}'. Expected one of: "
+            f"{', '.join(sorted(VALID_STATUSES))}"
+        )
+
+    requested = list(dict.fromkeys(str(pk) for pk in ids))
+    reference_date = CounterCheckpoint.reference_date()
+    updated: list[str] = []
+    rolled_over: list[str] = []
+    unchanged: list[str] = []
+    projects: set[int] = set()
+
+    for batch in _batches(requested, max(1, batch_size)):
+        with transaction.atomic():
+            changed, rolled, same, batch_projects = _transition_batch(
+                batch, status, reference_date
+            )
+        updated.extend(changed)
+        rolled_over.extend(rolled)
+        unchanged.extend(same)
+        projects |= batch_projects
+
+    found = set(updated) | set(rolled_over) | set(unchanged)
+    missing = [pk for pk in requested if pk not in found]
+
+    if updated or rolled_over:
+        dashboard_data_updated.send(
+            sender=sender,
+            obligation_ids=updated + rolled_over,
+            project_ids=sorted(projects),
+        )
+    logger.info(
+        "Transitioned obligations to '%s': %s updated, %s rolled over, "
+        "%s unchanged, %s missing",
+        status,
+        len(updated),
+        len(rolled_over),
+        len(unchanged),
+        len(missing),
+    )
+    return TransitionResult(updated, rolled_over, unchanged, missing)
@@ -73,6 +73,12 @@ def root_redirect(request: HttpRequest) -> HttpResponse:
         name="toggle_custom_aspect",
     ),
     path("list/", views.ObligationListView.as_view(), name="obligation_list"),
+    path("export/", views.ObligationExportView.as_view(), name="export"),
+    path(
+        "evidence/<int:evidence_id>/preview/",
+        views.EvidencePreviewView.as_view(),
+        name="evidence_preview",
+    ),
     # API endpoints for bulk actions
     path(
         "api/obligations/mark_complete/",
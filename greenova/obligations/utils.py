@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING, Any, Union
 
 from core.utils.roles import get_role_display
+from django.db.models import Q
 from django.utils import timezone
 
 # Import Obligation only for type checking to avoid circular imports
@@ -65,6 +66,26 @@ def is_obligation_overdue(
     return due_date < reference_date
 
 
+def get_overdue_q(reference_date: date | None = None, prefix: str = "") -> Q:
+    """
+    Build the database equivalent of ``is_obligation_overdue``.
+
+    Args:
+        reference_date: Optional date to compare against (defaults to today)
+        prefix: Optional lookup prefix for filtering through a relation
+            (e.g. ``"obligations__"``)
+
+    Returns:
+        Q: A filter matching obligations that are overdue
+    """
+    if reference_date is None:
+        reference_date = timezone.now().date()
+
+    return Q(**{f"{prefix}action_due_date__lt": reference_date}) & ~Q(
+        **{f"{prefix}status": STATUS_COMPLETED}
+    )
+
+
 def get_obligation_status(obligation):
     """
     Determine the real status of an obligation based on its due date and current status.
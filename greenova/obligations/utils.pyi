@@ -2,6 +2,8 @@
 from datetime import date
 from typing import TYPE_CHECKING, Any
 
+from django.db.models import Q
+
 if TYPE_CHECKING:
     from .models import Obligation
 
@@ -9,6 +11,7 @@ def is_obligation_overdue(
     obligation: Obligation | dict[str, Any],
     reference_date: date | None = None,
 ) -> bool: ...
+def get_overdue_q(reference_date: date | None = None, prefix: str = "") -> Q: ...
 def get_obligation_status(obligation: Any) -> str: ...
 def normalize_frequency(frequency: str) -> str: ...
 def get_responsibility_display_name(responsibility_value: str) -> str: ...
@@ -7,7 +7,7 @@
 
 import logging
 import os
-from datetime import date, timedelta
+from datetime import date
 from typing import Any, TypeVar, cast
 
 from beartype import beartype
@@ -16,12 +16,20 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
-from django.db.models import Q, QuerySet
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.db.models import QuerySet
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.loader import render_to_string
 from django.urls import reverse
-from django.utils import timezone
+from django.utils.cache import patch_cache_control
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.cache import cache_control
@@ -33,9 +41,19 @@
 from obligations.models import ObligationEvidence
 from projects.models import Project, ProjectMembership
 
+from .export import EXPORT_FORMATS, iter_export_rows, stream_csv, stream_xlsx
+from .filters import apply_filters, filter_by_status, parse_filters
 from .forms import EvidenceUploadForm, ObligationForm
 from .models import Obligation
-from .utils import is_obligation_overdue
+from .pagination import InvalidCursor, paginate_keyset
+from .previews import (
+    PENDING,
+    PREVIEW_CONTENT_TYPE,
+    READY,
+    preview_path,
+    preview_status,
+    schedule_preview,
+)
 
 # Ensure the Django settings module is correctly configured.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "greenova.settings")
@@ -44,13 +62,57 @@
 
 MAX_EVIDENCE_FILES = 5
 
+# Previews are cached by content digest, which is part of their URL
+PREVIEW_MAX_AGE = 60 * 60 * 24 * 365
+PREVIEW_PLACEHOLDER = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="160" height="120" '
+    'viewBox="0 0 160 120" role="img" aria-label="{label}">'
+    '<rect width="160" height="120" rx="8" fill="#f3f4f6"/>'
+    '<text x="80" y="66" font-family="sans-serif" font-size="14" '
+    'text-anchor="middle" fill="#6b7280">{label}</text></svg>'
+)
+
 # Type variable for models
 T = TypeVar('T')
 
 
+def _next_page_url(request: HttpRequest, cursor: str | None) -> str | None:
+    """Return the current URL with ``cursor`` set, or None on the last page."""
+    if cursor is None:
+        return None
+    query = request.GET.copy()
+    query["cursor"] = cursor
+    return f"{request.path}?{query.urlencode()}"
+
+
+class ObligationFilterMixin:
+    """Parse obligation list filters from the request and apply them."""
+
+    request: HttpRequest
+
+    @beartype
+    def _filter_by_status(
+        self, queryset: QuerySet[Obligation], status_values: list[str]
+    ) -> QuerySet[Obligation]:
+        """Filter obligations by status, see obligations.filters."""
+        return filter_by_status(queryset, status_values)
+
+    @beartype
+    def apply_filters(
+        self, queryset: QuerySet[Obligation], filters: dict[str, Any]
+    ) -> QuerySet[Obligation]:
+        """Apply all filters to the queryset, see obligations.filters."""
+        return apply_filters(queryset, filters)
+
+    @beartype
+    def get_filters(self) -> dict[str, Any]:
+        """Extract and normalize filter parameters from the request."""
+        return parse_filters(self.request.GET)
+
+
 @method_decorator(cache_control(max_age=300), name="dispatch")
 @method_decorator(vary_on_headers("HX-Request"), name="dispatch")
-class ObligationSummaryView(LoginRequiredMixin, View):
+class ObligationSummaryView(LoginRequiredMixin, ObligationFilterMixin, View):
     """View for displaying obligation summary with filtering capabilities.
 
     This view handles both standard requests and HTMX requests for
@@ -115,10 +177,20 @@ def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
                 if procedure:
                     obligations = obligations.filter(procedure__icontains=procedure)
 
+                filters = self.get_filters()
+                page = paginate_keyset(
+                    obligations,
+                    sort=filters["sort"],
+                    order=filters["order"],
+                    cursor=request.GET.get("cursor"),
+                )
                 return render(
                     request,
                     "obligations/partials/obligation_list.html",
-                    {"obligations": obligations},
+                    {
+                        "obligations": page.items,
+                        "next_page_url": _next_page_url(request, page.next_cursor),
+                    },
                 )
             except Exception as exc:
                 logger.error("Error filtering obligations: %s", str(exc))
@@ -143,140 +215,6 @@ def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
             request, "obligations/components/_obligations_summary.html", context
         )
 
-    @beartype
-    def _filter_by_status(
-        self, queryset: QuerySet[Obligation], status_values: list[str]
-    ) -> QuerySet[Obligation]:
-        """Filter obligations by status, handling 'overdue' as a special case.
-
-        Args:
-            queryset: Base queryset.
-            status_values: List of status values to filter by.
-
-        Returns:
-            Filtered queryset.
-        """
-        # Normalize all status values to canonical model values
-        status_map = {
-            "not_started": "not started",
-            "not started": "not started",
-            "in_progress": "in progress",
-            "in progress": "in progress",
-            "completed": "completed",
-            "overdue": "overdue",
-        }
-        canonical_statuses = [
-            status_map.get(s.replace("_", " ").lower(), s.replace("_", " ").lower())
-            for s in status_values
-        ]
-        # Handle the special case of 'overdue' which isn't a database field
-        if "overdue" in canonical_statuses:
-            # Remove overdue to handle separately
-            standard_statuses = [s for s in canonical_statuses if s != "overdue"]
-
-            # Get obligations that match standard statuses
-            if standard_statuses:
-                filtered_by_status = queryset.filter(status__in=standard_statuses)
-            else:
-                filtered_by_status = queryset.none()
-
-            # Find overdue obligations: action_due_date < today and status != completed
-            today = timezone.now().date()
-            overdue_queryset = queryset.filter(action_due_date__lt=today).exclude(
-                status="completed"
-            )
-
-            # Combine with standard status filter
-            if overdue_queryset.exists():
-                return filtered_by_status.union(overdue_queryset)
-            return filtered_by_status
-
-        # Standard status filtering
-        if canonical_statuses:
-            return queryset.filter(status__in=canonical_statuses)
-        return queryset
-
-    @beartype
-    def apply_filters(
-        self, queryset: QuerySet[Obligation], filters: dict[str, Any]
-    ) -> QuerySet[Obligation]:
-        """Apply all filters to the queryset.
-
-        Args:
-            queryset: Base queryset.
-            filters: Dictionary of filter values.
-
-        Returns:
-            Filtered queryset.
-        """
-        if not queryset:
-            return queryset
-        if filters.get("status"):
-            queryset = self._filter_by_status(queryset, filters["status"])
-        if filters.get("phase"):
-            queryset = queryset.filter(project_phase__in=filters["phase"])
-        if filters.get("search"):
-            search_term = filters["search"]
-            queryset = queryset.filter(
-                Q(obligation_number__icontains=search_term)
-                | Q(obligation__icontains=search_term)
-            )
-        if filters.get("date_filter"):
-            date_filter = filters["date_filter"]
-            today = date.today()
-            if date_filter == "past_due":
-                queryset = queryset.filter(
-                    action_due_date__lt=today, status__ne="completed"
-                )
-            elif date_filter == "14days":
-                future_date = today + timedelta(days=14)
-                queryset = queryset.filter(
-                    action_due_date__gte=today, action_due_date__lte=future_date
-                )
-            elif date_filter == "30days":
-                future_date = today + timedelta(days=30)
-                queryset = queryset.filter(
-                    action_due_date__gte=today, action_due_date__lte=future_date
-                )
-        return queryset
-
-    @beartype
-    def get_filters(self) -> dict[str, Any]:
-        """Extract and normalize filter parameters from request.
-
-        Returns:
-            Dictionary of filter parameters.
-        """
-        filters: dict[str, Any] = {}
-
-        # Get query parameters
-        status = self.request.GET.getlist("status") or self.request.GET.getlist(
-            "status[]"
-        )
-        phase = self.request.GET.getlist("phase") or self.request.GET.getlist("phase[]")
-        search = self.request.GET.get("search", "")
-        date_filter = self.request.GET.get("date_filter", "")
-
-        # Add sort parameters with defaults
-        sort = self.request.GET.get("sort", "obligation_number")
-        order = self.request.GET.get("order", "asc")
-
-        # Build filters dict
-        if status:
-            filters["status"] = [s.strip().lower() for s in status]
-        if phase:
-            filters["phase"] = [p.strip() for p in phase if p.strip()]
-        if search:
-            filters["search"] = search
-        if date_filter:
-            filters["date_filter"] = date_filter
-
-        # Add sort parameters
-        filters["sort"] = sort
-        filters["order"] = order
-
-        return filters
-
     @beartype
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """Get context data for the template.
@@ -351,29 +289,20 @@ def _get_overdue_data_for_user(self, context: dict[str, Any]) -> dict[str, Any]:
             # Optionally filter by responsibility if user_roles exist
             if user_roles:
                 queryset = queryset.filter(responsibility__in=user_roles)
-            overdue_obligations = [
-                obligation.obligation_number
-                for obligation in queryset
-                if is_obligation_overdue(obligation)
-            ]
-            if not overdue_obligations:
+            queryset = queryset.overdue()
+            total_count = queryset.count()
+            if not total_count:
                 context["error"] = "No overdue obligations found for your projects"
                 return context
-            queryset = queryset.filter(obligation_number__in=overdue_obligations)
         # If only company roles, show overdue obligations for those roles
         elif user_roles:
             queryset = Obligation.objects.filter(
                 responsibility__in=user_roles
-            )
-            overdue_obligations = [
-                obligation.obligation_number
-                for obligation in queryset
-                if is_obligation_overdue(obligation)
-            ]
-            if not overdue_obligations:
+            ).overdue()
+            total_count = queryset.count()
+            if not total_count:
                 context["error"] = "No overdue obligations found for your role"
                 return context
-            queryset = queryset.filter(obligation_number__in=overdue_obligations)
         else:
             context["error"] = "No overdue obligations found."
             return context
@@ -381,7 +310,7 @@ def _get_overdue_data_for_user(self, context: dict[str, Any]) -> dict[str, Any]:
         context.update(
             {
                 "obligations": queryset,
-                "total_count": len(queryset),
+                "total_count": total_count,
                 "filters": {"status": ["overdue"]},
                 "show_overdue_only": True,
             }
@@ -392,6 +321,113 @@ def _get_overdue_data_for_user(self, context: dict[str, Any]) -> dict[str, Any]:
         return context
 
 
+class ObligationExportView(LoginRequiredMixin, ObligationFilterMixin, View):
+    """Stream obligations as CSV or XLSX.
+
+    Accepts the same filter parameters as the summary view, plus optional
+    ``project_id`` and ``mechanism_id`` scopes and ``format`` (csv or xlsx).
+    Users other than superusers only export projects they are a member of.
+    """
+
+    @beartype
+    def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse | StreamingHttpResponse:
+        """Return a streaming export of the filtered obligations.
+
+        Args:
+            request: The HTTP request.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            StreamingHttpResponse with the export file.
+        """
+        export_format = request.GET.get("format", "csv").lower()
+        if export_format not in EXPORT_FORMATS:
+            # Plain text, so the echoed parameter is never rendered as HTML
+            return HttpResponseBadRequest(
+                f"Unsupported export format '{export_format}'",
+                content_type="text/plain",
+            )
+
+        queryset = Obligation.objects.all()
+        if not getattr(request.user, "is_superuser", False):
+            queryset = queryset.filter(project__members=request.user)
+        project_id = request.GET.get("project_id")
+        if project_id:
+            queryset = queryset.filter(project_id=project_id)
+        mechanism_id = request.GET.get("mechanism_id")
+        if mechanism_id:
+            queryset = queryset.filter(primary_environmental_mechanism_id=mechanism_id)
+        queryset = self.apply_filters(queryset, self.get_filters())
+
+        rows = iter_export_rows(queryset)
+        content = stream_xlsx(rows) if export_format == "xlsx" else stream_csv(rows)
+        response = StreamingHttpResponse(
+            content, content_type=EXPORT_FORMATS[export_format]
+        )
+        filename = f"obligations-{date.today():%Y%m%d}.{export_format}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class EvidencePreviewView(LoginRequiredMixin, View):
+    """Serve the cached preview of an evidence file.
+
+    Ready previews are served with long-lived cache headers. While a preview
+    is being generated, or for files that cannot be previewed, a small
+    placeholder image is returned instead.
+    """
+
+    @beartype
+    def get(
+        self, request: HttpRequest, evidence_id: int
+    ) -> HttpResponse | FileResponse:
+        """Return the preview image or a placeholder.
+
+        Args:
+            request: The HTTP request.
+            evidence_id: Primary key of the evidence file.
+
+        Returns:
+            The preview, or a placeholder SVG while it is pending.
+        """
+        evidence = get_object_or_404(
+            ObligationEvidence.objects.only("pk", "file", "content_type", "sha256"),
+            pk=evidence_id,
+        )
+        status = preview_status(evidence)
+        if status == READY:
+            preview = FileResponse(
+                open(preview_path(evidence.sha256), "rb"),
+                content_type=PREVIEW_CONTENT_TYPE,
+            )
+            preview["ETag"] = f'"{evidence.sha256}"'
+            patch_cache_control(
+                preview, private=True, max_age=PREVIEW_MAX_AGE, immutable=True
+            )
+            return preview
+
+        if status == PENDING:
+            schedule_preview(evidence)
+            response = HttpResponse(
+                PREVIEW_PLACEHOLDER.format(label="Preview pending"),
+                content_type="image/svg+xml",
+                status=202,
+            )
+            response["Retry-After"] = "2"
+            patch_cache_control(response, no_store=True)
+            return response
+
+        response = HttpResponse(
+            PREVIEW_PLACEHOLDER.format(label="No preview"),
+            content_type="image/svg+xml",
+        )
+        patch_cache_control(response, private=True, max_age=60 * 60)
+        return response
+
+
 class TotalOverdueObligationsView(LoginRequiredMixin, View):
     """View to get the count of overdue obligations for a project."""
 
@@ -412,12 +448,8 @@ def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         if not project_id:
             return JsonResponse({"error": "Project ID is required"}, status=400)
 
-        # Fix for attr-defined error
-        obligations = Obligation.objects.filter(
-            project_id=project_id
-        )
-        overdue_count = sum(
-            1 for obligation in obligations if is_obligation_overdue(obligation)
+        overdue_count = (
+            Obligation.objects.filter(project_id=project_id).overdue().count()
         )
 
         return JsonResponse(overdue_count, safe=False)
@@ -721,41 +753,6 @@ def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             context["project_id"] = self.object.project_id
         return context
 
-    @beartype
-    def _update_mechanism_counts(
-        self,
-        old_mechanism: EnvironmentalMechanism | None,
-        updated_obligation: Obligation,
-    ) -> None:
-        """Update obligation counts for mechanisms.
-
-        Args:
-            old_mechanism: Previous mechanism (if any).
-            updated_obligation: The updated obligation.
-        """
-        # Get the new mechanism from the updated obligation
-        new_mech = getattr(updated_obligation, "primary_environmental_mechanism", None)
-        updated_new_mech_flag = False
-
-        # If there was an old mechanism and it's different from the new one
-        if old_mechanism and old_mechanism != new_mech:
-            # Update old mechanism counts first
-            if hasattr(old_mechanism, "update_obligation_counts"):
-                old_mechanism.update_obligation_counts()
-            # Then update new mechanism if it exists
-            if new_mech and hasattr(new_mech, "update_obligation_counts"):
-                new_mech.update_obligation_counts()
-                updated_new_mech_flag = True
-
-        # If new_mech hasn't been updated yet, and it's valid, update it.
-        # This covers cases where old_mechanism was None or same as new_mech.
-        if (
-            not updated_new_mech_flag
-            and new_mech
-            and hasattr(new_mech, "update_obligation_counts")
-        ):
-            new_mech.update_obligation_counts()
-
     @beartype
     def form_valid(self, form: ObligationForm) -> HttpResponse:
         """Process the form submission with HTMX support.
@@ -767,13 +764,9 @@ def form_valid(self, form: ObligationForm) -> HttpResponse:
             Appropriate response based on request type.
         """
         try:
-            old_mechanism = None
-            if self.object and hasattr(self.object, "primary_environmental_mechanism"):
-                old_mechanism = getattr(self.object, "primary_environmental_mechanism")
-
-            # Save the updated obligation
+            # Save the updated obligation; mechanism counts are adjusted by the
+            # obligation save signals
             obligation = form.save()
-            self._update_mechanism_counts(old_mechanism, obligation)
 
             messages.success(
                 self.request,
@@ -845,17 +838,12 @@ def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> JsonResponse:
         try:
             obj = self.get_object()
             project_id = obj.project_id
-            mechanism = getattr(obj, "primary_environmental_mechanism", None)
             obl_number = kwargs.get("obligation_number")
 
-            # Delete the obligation
+            # Delete the obligation (mechanism counts are adjusted on delete)
             obj.delete()
             logger.info("Obligation %s deleted successfully", obl_number)
 
-            # Update mechanism counts
-            if mechanism:
-                mechanism.update_obligation_counts()
-
             base_url = reverse("dashboard:home")
             return JsonResponse(
                 {
@@ -899,21 +887,62 @@ def get(self, request: HttpRequest) -> HttpResponse:
         )
 
 
-class ObligationListView(LoginRequiredMixin, ListView):
-    """List all obligations."""
+class ObligationListView(LoginRequiredMixin, ObligationFilterMixin, ListView):
+    """List obligations one keyset page at a time.
+
+    HTMX requests receive only the rows of the requested page, followed by a
+    sentinel that loads the next page when scrolled into view.
+    """
 
     model = Obligation
     template_name = "obligations/obligations_list.html"
+    partial_template_name = "obligations/partials/obligation_list.html"
     context_object_name = "obligations"
 
     @beartype
     def get_queryset(self) -> QuerySet[Obligation]:
-        """Return the queryset for listing obligations.
+        """Return the filtered queryset for listing obligations.
 
         Returns:
-            A queryset of all Obligation objects.
+            Obligations matching the request filters.
         """
-        return Obligation.objects.all()
+        queryset = Obligation.objects.select_related("project")
+        project_id = self.request.GET.get("project_id")
+        if project_id:
+            queryset = queryset.filter(project_id=project_id)
+        return self.apply_filters(queryset, self.get_filters())
+
+    def get_template_names(self) -> list[str]:
+        if self.request.htmx:  # type: ignore[attr-defined]
+            return [self.partial_template_name]
+        return [self.template_name]
+
+    @beartype
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Add the current keyset page to the context.
+
+        Returns:
+            Context with the page rows and the URL of the next page.
+        """
+        filters = self.get_filters()
+        try:
+            page = paginate_keyset(
+                self.object_list,
+                sort=filters["sort"],
+                order=filters["order"],
+                cursor=self.request.GET.get("cursor"),
+            )
+        except InvalidCursor as exc:
+            raise Http404(str(exc)) from exc
+
+        kwargs.update(
+            {
+                "object_list": page.items,
+                "page": page,
+                "next_page_url": _next_page_url(self.request, page.next_cursor),
+            }
+        )
+        return super().get_context_data(**kwargs)
 
 
 @beartype
@@ -2,21 +2,25 @@
 
 import io
 import logging
+from datetime import date
 from typing import Any, cast
 
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 from django.db.models import Count, F, Q, QuerySet, Sum
 from matplotlib.axes import Axes
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
-from obligations.models import Obligation
+from obligations.constants import (
+    STATUS_COMPLETED,
+    STATUS_IN_PROGRESS,
+    STATUS_NOT_STARTED,
+)
+from obligations.utils import get_overdue_q
 from procedures.models import Procedure
 from projects.models import Project
 
-matplotlib.use("Agg")
+from .rendering import ChartSpec
 
 logger = logging.getLogger(__name__)
 
@@ -43,15 +47,15 @@ def generate_procedure_statistics(
         "edgecolor": "#eeeeee",
     }
 
-    fig, axes = plt.subplots(
-        nrows=2,
-        ncols=1,
-        squeeze=True,
+    # Figures are created without pyplot, so they are freed with the last
+    # reference instead of staying registered in pyplot's global state
+    fig = Figure(
         figsize=fig_config["figsize"],
         dpi=fig_config["dpi"],
         facecolor=fig_config["facecolor"],
         edgecolor=fig_config["edgecolor"],
     )
+    axes = fig.subplots(nrows=2, ncols=1, squeeze=True)
     axes_array = cast(np.ndarray, axes)
 
     try:
@@ -60,18 +64,17 @@ def generate_procedure_statistics(
             _plot_procedure_timeline_chart(cast(Axes, axes_array[1]), stats)
         else:
             logger.error("Not enough axes created for plotting charts")
-            plt.close(fig)
             raise ValueError("Failed to create required chart axes")
     except (IndexError, ValueError) as e:
         logger.error("Error plotting procedure charts: %s", str(e))
-        plt.close(fig)
+        fig.clear()
         raise
     except Exception as e:
         logger.error("Unexpected error in chart generation: %s", str(e))
-        plt.close(fig)
+        fig.clear()
         raise
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig, stats
 
 
@@ -149,101 +152,73 @@ def _plot_procedure_timeline_chart(ax: Axes, stats: dict[str, Any]) -> None:
     ax.yaxis.set_major_locator(MaxNLocator(integer=True))
 
 
-def get_procedure_charts(
-    mechanism_id: str | int, filtered_ids: list[int] | None = None
-) -> dict[str, Figure]:
-    """Generate charts for procedures related to an environmental mechanism."""
-    procedure_charts: dict[str, Figure] = {}
+# Per-procedure stat keys for each obligation status counted in the charts
+STATUS_STAT_KEYS = {
+    STATUS_NOT_STARTED: "not_started",
+    STATUS_IN_PROGRESS: "in_progress",
+    STATUS_COMPLETED: "completed",
+}
+PIE_LABELS = ("Not Started", "In Progress", "Completed")
+PIE_COLORS = ("#f39c12", "#3498db", "#2ecc71")
 
-    try:
-        query = Obligation.objects.filter(
-            primary_environmental_mechanism_id=mechanism_id
-        )
-
-        if filtered_ids is not None:
-            query = query.filter(id__in=filtered_ids)
-
-        proc_names = (
-            query.values_list("procedure", flat=True).distinct().order_by("procedure")
-        )
-
-        for proc_name in proc_names:
-            if not proc_name:
-                continue
-
-            proc_obligations = query.filter(procedure=proc_name)
-            status_counts = _get_status_counts(proc_obligations)
-
-            if sum(status_counts.values()) > 0:
-                fig = _create_pie_chart(proc_name, status_counts)
-            else:
-                fig = _create_empty_chart(proc_name)
-
-            procedure_charts[proc_name] = fig
-
-    except (Obligation.DoesNotExist, ValueError, TypeError) as e:
-        logger.error("Error generating procedure charts: %s", str(e))
-        fig = _create_error_chart(str(e))
-        procedure_charts["Error"] = fig
-
-    return procedure_charts
-
-
-def _get_status_counts(obligations: QuerySet) -> dict[str, int]:
-    """Get counts of obligations by status."""
-    return {
-        "Not Started": obligations.filter(status="not started").count(),
-        "In Progress": obligations.filter(status="in progress").count(),
-        "Completed": obligations.filter(status="completed").count(),
-    }
 
+def get_procedure_status_stats(
+    obligations: QuerySet, reference_date: date | None = None
+) -> dict[str, dict[str, int]]:
+    """Count obligations by status for every procedure in one query.
 
-def _create_pie_chart(title: str, status_counts: dict[str, int]) -> Figure:
-    """Create a pie chart for procedure status distribution."""
-    fig, ax = plt.subplots(figsize=(6, 5))
+    Groups by procedure and status, counting overdue obligations in the same
+    pass with a conditional aggregate.
 
-    labels = list(status_counts.keys())
-    sizes = list(status_counts.values())
-    colors = ["#f39c12", "#3498db", "#2ecc71"]
+    Args:
+        obligations: Obligations to count.
+        reference_date: Date overdue is judged against (defaults to today).
 
-    ax.pie(
-        sizes,
-        labels=labels,
-        colors=colors,
-        autopct="%1.1f%%",
-        startangle=90,
-        wedgeprops={"edgecolor": "w", "linewidth": 1},
-        textprops={"fontsize": 10},
+    Returns:
+        Stats per procedure name, in name order, with ``not_started``,
+        ``in_progress``, ``completed``, ``overdue`` and ``total`` (the sum of
+        the first three) counts.
+    """
+    rows = (
+        obligations.exclude(procedure__isnull=True)
+        .exclude(procedure="")
+        .order_by()
+        .values("procedure", "status")
+        .annotate(
+            count=Count("pk"),
+            overdue=Count("pk", filter=get_overdue_q(reference_date)),
+        )
     )
 
-    ax.axis("equal")
-    ax.set_title(f"{title} Status", fontsize=12)
-    return fig
-
-
-def _create_empty_chart(title: str) -> Figure:
-    """Create an empty chart with a message."""
-    fig, ax = plt.subplots(figsize=(6, 5))
-    ax.text(0.5, 0.5, "No obligations found", ha="center", va="center", fontsize=12)
-    ax.axis("off")
-    ax.set_title(title, fontsize=12)
-    return fig
-
-
-def _create_error_chart(error_message: str) -> Figure:
-    """Create an error chart with the error message."""
-    fig, ax = plt.subplots(figsize=(6, 5))
-    ax.text(
-        0.5,
-        0.5,
-        f"Error generating charts: {error_message}",
-        ha="center",
-        va="center",
-        fontsize=10,
-        wrap=True,
+    stats: dict[str, dict[str, int]] = {}
+    for row in rows:
+        procedure_stats = stats.setdefault(
+            row["procedure"],
+            {"not_started": 0, "in_progress": 0, "completed": 0, "overdue": 0},
+        )
+        key = STATUS_STAT_KEYS.get(row["status"])
+        if key:
+            procedure_stats[key] += row["count"]
+        procedure_stats["overdue"] += row["overdue"]
+
+    for procedure_stats in stats.values():
+        procedure_stats["total"] = sum(
+            procedure_stats[key] for key in STATUS_STAT_KEYS.values()
+        )
+    return dict(sorted(stats.items()))
+
+
+def chart_spec_from_stats(title: str, stats: dict[str, int]) -> ChartSpec:
+    """Describe the status pie chart for one procedure's stats."""
+    if not stats["total"]:
+        return ChartSpec("empty", title)
+    return ChartSpec(
+        "pie",
+        title,
+        labels=PIE_LABELS,
+        values=tuple(stats[key] for key in STATUS_STAT_KEYS.values()),
+        colors=PIE_COLORS,
     )
-    ax.axis("off")
-    return fig
 
 
 def get_all_procedure_charts() -> dict[str, bytes]:
@@ -267,14 +242,11 @@ def get_all_procedure_charts() -> dict[str, bytes]:
     completion_chart = get_completion_rate_chart()
     charts["completion_rate"] = chart_to_png(completion_chart)
 
-    # Clean up
-    plt.close("all")
-
     return charts
 
 
 def chart_to_png(fig: Figure) -> bytes:
-    """Convert a matplotlib figure to PNG bytes.
+    """Convert a matplotlib figure to PNG bytes, then clear the figure.
 
     Args:
         fig: Matplotlib figure to convert
@@ -285,6 +257,7 @@ def chart_to_png(fig: Figure) -> bytes:
     buf = io.BytesIO()
     canvas = FigureCanvasAgg(fig)
     canvas.print_png(buf)
+    fig.clear()
     return buf.getvalue()
 
 
@@ -306,7 +279,8 @@ def get_procedure_status_chart() -> Figure:
     counts = [s["count"] for s in status_counts]
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
     ax.pie(counts, labels=statuses, autopct="%1.1f%%")
     ax.set_title("Procedure Status Distribution")
 
@@ -332,7 +306,8 @@ def get_procedure_timeline() -> Figure:
     durations = [(p["end_date"] - p["start_date"]).days for p in procedures]
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
     ax.barh(titles, durations, left=start_dates)
     ax.set_title("Procedure Timeline")
 
@@ -361,7 +336,8 @@ def get_completion_rate_chart() -> Figure:
     completion_rates = [c / t * 100 for c, t in zip(completed, totals)]
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig = Figure(figsize=(8, 6))
+    ax = fig.add_subplot()
     ax.bar(types, completion_rates)
     ax.set_title("Procedure Completion Rates by Type")
     ax.set_ylabel("Completion Rate (%)")
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import core.storage
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Procedure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('document_id', models.CharField(help_text='Unique procedure identifier (e.g., ENV-PROC-001)', max_length=50, unique=True)),
+                ('version', models.CharField(default='1.0', max_length=10)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('review', 'In Review'), ('active', 'Active'), ('obsolete', 'Obsolete'), ('archived', 'Archived')], default='draft', max_length=20)),
+                ('compliance_status', models.CharField(choices=[('compliant', 'Compliant'), ('non_compliant', 'Non-Compliant'), ('partially_compliant', 'Partially Compliant'), ('not_assessed', 'Not Assessed')], default='not_assessed', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('effective_date', models.DateField(blank=True, null=True)),
+                ('review_date', models.DateField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('document_file', models.FileField(blank=True, null=True, storage=core.storage.deduplicated_storage, upload_to='procedures/%Y/%m/')),
+                ('is_active', models.BooleanField(default=True)),
+                ('tags', models.CharField(blank=True, max_length=255)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='procedures', to='projects.project')),
+            ],
+            options={
+                'verbose_name': 'Procedure',
+                'verbose_name_plural': 'Procedures',
+                'ordering': ['-updated_at'],
+                'indexes': [models.Index(fields=['status'], name='procedures__status_601ac0_idx'), models.Index(fields=['compliance_status'], name='procedures__complia_aa096b_idx'), models.Index(fields=['document_id'], name='procedures__documen_4efa9b_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 import logging
 from typing import ClassVar
 
+from core.storage import deduplicated_storage
 from django.db import models
 from django.utils import timezone
 from projects.models import Project
@@ -54,7 +55,10 @@ class Procedure(models.Model):
 
     # Document management
     document_file: models.FileField = models.FileField(
-        upload_to="procedures/%Y/%m/", null=True, blank=True
+        upload_to="procedures/%Y/%m/",
+        storage=deduplicated_storage,
+        null=True,
+        blank=True,
     )
 
     # Metadata
@@ -0,0 +1,309 @@
+"""Bounded render service for procedure charts.
+
+Charts are described by ``ChartSpec`` values (plain, picklable data) and
+rasterized to PNG in a small process pool, away from the request thread.
+Each job builds its own ``matplotlib.figure.Figure`` through the
+object-oriented API, so nothing is registered with pyplot's global figure
+manager, and the figure is cleared as soon as it has been rendered.
+
+The pool is bounded in two ways: at most ``PROCEDURE_CHART_RENDER_QUEUE``
+jobs may be queued or running, and each ``render_many`` call waits at most
+``PROCEDURE_CHART_RENDER_TIMEOUT`` seconds for all of its charts together.
+Charts still outstanding at the deadline are reported as ``None`` and their
+queue slots are freed at once. The pool is then retired: it takes no new jobs,
+and after another timeout its workers, including the stuck one, are
+terminated. Any job in the retired pool was submitted before it was retired,
+so by then every caller waiting for one has given up on it.
+Setting ``PROCEDURE_CHART_RENDER_WORKERS`` to 0 renders in the calling
+thread instead, which is what tests and management commands use.
+"""
+
+import io
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from multiprocessing.pool import AsyncResult, Pool
+from typing import NamedTuple
+
+from django.conf import settings
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE_SIZE = 32
+DEFAULT_TIMEOUT = 10.0
+
+CHART_SIZE = (6, 5)
+CHART_DPI = 100
+
+
+class ChartSpec(NamedTuple):
+    """What to draw for one procedure chart."""
+
+    kind: str  # "pie", "empty" or "error"
+    title: str
+    labels: tuple[str, ...] = ()
+    values: tuple[int, ...] = ()
+    colors: tuple[str, ...] = ()
+
+
+def build_figure(spec: ChartSpec) -> Figure:
+    """Build the figure for a chart spec without touching pyplot."""
+    fig = Figure(figsize=CHART_SIZE, dpi=CHART_DPI)
+    ax = fig.add_subplot()
+    if spec.kind == "pie":
+        ax.pie(
+            spec.values,
+            labels=spec.labels,
+            colors=spec.colors,
+            autopct="%1.1f%%",
+            startangle=90,
+            wedgeprops={"edgecolor": "w", "linewidth": 1},
+            textprops={"fontsize": 10},
+        )
+        ax.axis("equal")
+        ax.set_title(f"{spec.title} Status", fontsize=12)
+    elif spec.kind == "error":
+        ax.text(
+            0.5,
+            0.5,
+            f"Error generating charts: {spec.title}",
+            ha="center",
+            va="center",
+            fontsize=10,
+            wrap=True,
+        )
+        ax.axis("off")
+    else:
+        ax.text(0.5, 0.5, "No obligations found", ha="center", va="center", fontsize=12)
+        ax.axis("off")
+        ax.set_title(spec.title, fontsize=12)
+    return fig
+
+
+def render_png(spec: ChartSpec) -> bytes:
+    """Render a chart spec to PNG bytes, releasing the figure afterwards."""
+    fig = build_figure(spec)
+    try:
+        buf = io.BytesIO()
+        FigureCanvasAgg(fig).print_png(buf)
+        return buf.getvalue()
+    finally:
+        fig.clear()
+
+
+@dataclass
+class RenderMetrics:
+    """Counters and latencies of a render service."""
+
+    queue_depth: int = 0
+    rendered: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    rejected: int = 0
+    pools_retired: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean time from submission to result of the rendered charts."""
+        return self.total_seconds / self.rendered if self.rendered else 0.0
+
+
+class _Job:
+    """A submitted chart, holding one queue slot until finished or abandoned."""
+
+    def __init__(self, service: "RenderService") -> None:
+        self.service = service
+        self.submitted = time.perf_counter()
+        self.finished: float | None = None
+        self.result: AsyncResult | None = None
+        self._released = False
+
+    def finish(self, _value: object) -> None:
+        # Called from the pool's result thread, with the result or exception
+        self.finished = time.perf_counter()
+        self.release()
+
+    def release(self) -> None:
+        with self.service._lock:
+            if self._released:
+                return
+            self._released = True
+            self.service._metrics.queue_depth -= 1
+        self.service._slots.release()
+
+
+class RenderService:
+    """Renders chart specs to PNG in a bounded process pool."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        render: Callable[[ChartSpec], bytes] = render_png,
+    ) -> None:
+        """
+        Configure the service; the worker pool is started on first use.
+
+        Args:
+            workers: Worker processes (0 renders in the calling thread)
+            queue_size: Maximum jobs queued or running at once
+            timeout: Seconds each render_many call waits for its charts
+            render: Turns a spec into PNG bytes, in a worker process
+        """
+        self.workers = workers
+        self.timeout = timeout
+        # Pickled by reference to the workers, so it must be importable there
+        self.render = render
+        self._slots = threading.BoundedSemaphore(max(1, queue_size))
+        self._lock = threading.Lock()
+        self._pool: Pool | None = None
+        self._metrics = RenderMetrics()
+
+    def metrics(self) -> RenderMetrics:
+        """Return a snapshot of the service's metrics."""
+        with self._lock:
+            return RenderMetrics(**vars(self._metrics))
+
+    def _get_pool(self) -> Pool:
+        with self._lock:
+            if self._pool is None:
+                # Workers only need matplotlib; spawning avoids forking a
+                # multi-threaded server process
+                self._pool = multiprocessing.get_context("spawn").Pool(
+                    processes=self.workers
+                )
+            return self._pool
+
+    def _retire_pool(self, pool: Pool) -> None:
+        """Stop sending jobs to a pool with a stuck worker, and kill it later."""
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            self._metrics.pools_retired += 1
+        pool.close()
+        # Other callers' jobs in the pool are left a full timeout to finish,
+        # after which they have given up on them anyway
+        killer = threading.Timer(self.timeout, pool.terminate)
+        killer.daemon = True
+        killer.start()
+
+    def _record(self, field: str, seconds: float | None = None) -> None:
+        with self._lock:
+            setattr(self._metrics, field, getattr(self._metrics, field) + 1)
+            if seconds is not None:
+                self._metrics.total_seconds += seconds
+                self._metrics.max_seconds = max(self._metrics.max_seconds, seconds)
+
+    def _submit(self, pool: Pool, spec: ChartSpec) -> _Job | None:
+        """Queue one spec, or return None if the queue is full."""
+        if not self._slots.acquire(blocking=False):
+            self._record("rejected")
+            logger.warning("Chart render queue is full; skipping %s", spec.title)
+            return None
+        with self._lock:
+            self._metrics.queue_depth += 1
+        job = _Job(self)
+        try:
+            job.result = pool.apply_async(
+                self.render, (spec,), callback=job.finish, error_callback=job.finish
+            )
+        except ValueError:
+            # Another request retired the pool; the next call starts a new one
+            job.release()
+            self._record("failed")
+            logger.error("Rendering chart %s failed: its pool was retired", spec.title)
+            return None
+        return job
+
+    def render_many(self, specs: Sequence[ChartSpec]) -> list[bytes | None]:
+        """
+        Render specs concurrently, in order, within one overall deadline.
+
+        Returns:
+            list[bytes | None]: PNG data for each spec, or None for charts that
+            failed, were not finished by the deadline or could not be queued
+            because the queue is full
+        """
+        if self.workers <= 0:
+            return [self._render_inline(spec) for spec in specs]
+
+        pool = self._get_pool()
+        jobs = [self._submit(pool, spec) for spec in specs]
+
+        deadline = time.perf_counter() + self.timeout
+        for job in jobs:
+            if job is not None:
+                job.result.wait(max(0.0, deadline - time.perf_counter()))
+
+        results: list[bytes | None] = []
+        stuck = False
+        for job, spec in zip(jobs, specs):
+            if job is None:
+                results.append(None)
+            elif not job.result.ready():
+                # Given up on: its slot is free now, whatever the worker does
+                job.release()
+                stuck = True
+                self._record("timed_out")
+                logger.error("Rendering chart %s timed out", spec.title)
+                results.append(None)
+            elif not job.result.successful():
+                self._record("failed")
+                try:
+                    job.result.get()
+                except Exception:
+                    logger.exception("Rendering chart %s failed", spec.title)
+                results.append(None)
+            else:
+                # The callback may not have run yet when the result is ready
+                ended = job.finished or time.perf_counter()
+                self._record("rendered", ended - job.submitted)
+                results.append(job.result.get())
+        if stuck:
+            self._retire_pool(pool)
+        return results
+
+    def _render_inline(self, spec: ChartSpec) -> bytes | None:
+        started = time.perf_counter()
+        try:
+            data = self.render(spec)
+        except Exception:
+            self._record("failed")
+            logger.exception("Rendering chart %s failed", spec.title)
+            return None
+        self._record("rendered", time.perf_counter() - started)
+        return data
+
+
+# The process-wide service, created on first use, under "service"
+_state: dict[str, RenderService | None] = {"service": None}
+_service_lock = threading.Lock()
+
+
+def get_render_service() -> RenderService:
+    """Return the process-wide render service, configured from settings."""
+    with _service_lock:
+        service = _state["service"]
+        if service is None:
+            service = _state["service"] = RenderService(
+                workers=getattr(
+                    settings, "PROCEDURE_CHART_RENDER_WORKERS", DEFAULT_WORKERS
+                ),
+                queue_size=getattr(
+                    settings, "PROCEDURE_CHART_RENDER_QUEUE", DEFAULT_QUEUE_SIZE
+                ),
+                timeout=getattr(
+                    settings, "PROCEDURE_CHART_RENDER_TIMEOUT", DEFAULT_TIMEOUT
+                ),
+            )
+        return service
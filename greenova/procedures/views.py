@@ -1,26 +1,25 @@
 """Views for procedure analysis and charts."""
 
 import base64
-import io
 import logging
 from datetime import timedelta
 from typing import Any
 
-import matplotlib
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.decorators import method_decorator
+from django.utils.html import format_html
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_headers
 from django.views.generic import ListView, TemplateView
 from mechanisms.models import EnvironmentalMechanism
 from obligations.models import Obligation
 
-from .figures import get_procedure_charts as get_all_procedure_charts
+from .figures import chart_spec_from_stats, get_procedure_status_stats
 from .models import Procedure
+from .rendering import get_render_service
 
-matplotlib.use("Agg")  # Use Agg backend for non-interactive plotting
 logger = logging.getLogger(__name__)
 
 
@@ -141,66 +140,48 @@ def _get_available_filters(self, all_obligations: Any) -> dict[str, Any]:
             "status_options": status_options,
         }
 
-    def _generate_procedure_charts(
-        self,
-        mechanism_id: int,
-        filtered_obligations: Any,
-        all_obligations: Any,
-        filters_applied: bool,
-    ) -> list[dict[str, Any]]:
-        """Generate charts for each procedure."""
-        procedure_charts = []
-        filtered_ids = None
-        if filters_applied:
-            filtered_ids = filtered_obligations.values_list("id", flat=True)
-        charts_dict = get_all_procedure_charts(
-            mechanism_id, filtered_ids=filtered_ids
-        )
-        for procedure_name, fig in charts_dict.items():
-            procedure_data = self._create_procedure_chart_data(
-                procedure_name,
-                fig,
-                filtered_obligations if filters_applied else all_obligations,
-            )
-            procedure_charts.append(procedure_data)
-        return procedure_charts
+    def _generate_procedure_charts(self, obligations: Any) -> list[dict[str, Any]]:
+        """Generate charts for each procedure.
+
+        Every procedure's stats and chart inputs come from a single grouped
+        query, so the query count does not grow with the number of procedures.
+        """
+        stats = get_procedure_status_stats(obligations)
+        chart_specs = [
+            chart_spec_from_stats(name, procedure_stats)
+            for name, procedure_stats in stats.items()
+        ]
+        # Rasterized in the render service's process pool, not on this thread
+        images = get_render_service().render_many(chart_specs)
+        return [
+            self._create_procedure_chart_data(procedure_name, png, procedure_stats)
+            for (procedure_name, procedure_stats), png in zip(stats.items(), images)
+        ]
 
     def _create_procedure_chart_data(
         self,
         procedure_name: str,
-        fig: Any,
-        obligations: Any,
+        png: bytes | None,
+        stats: dict[str, int],
     ) -> dict[str, Any]:
         """Create data for a specific procedure chart."""
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight")
-        buf.seek(0)
-        base64_data = base64.b64encode(buf.getvalue()).decode()
-        chart_img = (
-            f'<img src="data:image/png;base64,{base64_data}" '
-            f'alt="{procedure_name} Chart" '
-            f'width="300" height="250">'
-        )
-        proc_obligations = obligations.filter(procedure=procedure_name)
-        status_counts = {
-            "not_started": sum(
-                1 for o in proc_obligations if o.status == "not started"
-            ),
-            "in_progress": sum(
-                1 for o in proc_obligations if o.status == "in progress"
-            ),
-            "completed": sum(1 for o in proc_obligations if o.status == "completed"),
-            "overdue": sum(1 for o in proc_obligations if o.is_overdue),
-        }
-        status_counts["total"] = (
-            status_counts["not_started"]
-            + status_counts["in_progress"]
-            + status_counts["completed"]
-        )
+        if png is None:
+            chart_img = format_html(
+                '<p class="chart-unavailable">Chart for {} is unavailable</p>',
+                procedure_name,
+            )
+        else:
+            base64_data = base64.b64encode(png).decode()
+            chart_img = format_html(
+                '<img src="data:image/png;base64,{}" alt="{} Chart" '
+                'width="300" height="250">',
+                base64_data,
+                procedure_name,
+            )
         return {
             "name": procedure_name,
             "chart": chart_img,
-            "stats": status_counts,
+            "stats": stats,
         }
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
@@ -239,10 +220,9 @@ def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
                 }
             )
             procedure_charts = self._generate_procedure_charts(
-                int(mechanism_id),
-                filtered_obligations,
-                all_obligations,
-                filter_params["filters_applied"],
+                filtered_obligations
+                if filter_params["filters_applied"]
+                else all_obligations
             )
             context["procedure_charts"] = procedure_charts
         except Exception as exc:
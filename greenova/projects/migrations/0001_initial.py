@@ -0,0 +1,72 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('obligations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Project',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Project',
+                'verbose_name_plural': 'Projects',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('perdaman_management', 'Perdaman - Management'), ('perdaman_env_heritage_manager', 'Perdaman - Env & Heritage Manager'), ('scjv_project_director', 'SCJV - Project Director'), ('scjv_project_manager', 'SCJV - Project Manager'), ('scjv_construction_manager', 'SCJV - Construction Manager'), ('scjv_commercial_manager', 'SCJV - Commercial Manager'), ('scjv_engineering_manager', 'SCJV - Engineering Manager'), ('scjv_environmental_lead', 'SCJV - Environmental Lead'), ('scjv_hsse_manager', 'SCJV - HSSE Manager'), ('scjv_heritage_indigenous_manager', 'SCJV - Heritage & Indigenous Relations Manager'), ('scjv_lead_env_advisor', 'SCJV - Lead Environmental Advisor'), ('scjv_senior_env_advisor', 'SCJV - Senior Environmental Advisor'), ('scjv_construction_director', 'SCJV - Construction Director'), ('scjv_project_env_representative', 'SCJV - Project Environmental Representative'), ('scjv_construction_supervisor', 'SCJV - Construction Supervisor'), ('scjv_community_stakeholder', 'SCJV - Community and Stakeholder'), ('owner', 'Owner'), ('manager', 'Manager'), ('member', 'Member'), ('viewer', 'Viewer')], default='member', max_length=50)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='projects.project')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Project Membership',
+                'verbose_name_plural': 'Project Memberships',
+                'ordering': ['project', 'user'],
+                'unique_together': {('user', 'project')},
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='members',
+            field=models.ManyToManyField(related_name='projects', through='projects.ProjectMembership', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='ProjectObligation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('obligation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_obligations', to='obligations.obligation')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_obligations', to='projects.project')),
+            ],
+            options={
+                'verbose_name': 'Project Obligation',
+                'verbose_name_plural': 'Project Obligations',
+                'ordering': ['project', 'obligation'],
+                'unique_together': {('project', 'obligation')},
+            },
+        ),
+    ]
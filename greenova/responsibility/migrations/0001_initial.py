@@ -0,0 +1,52 @@
+# Generated by Django 5.2.1 on 2026-10-17 05:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('company', '0001_initial'),
+        ('obligations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Responsibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(choices=[('Perdaman - Management', 'Perdaman - Management'), ('Perdaman - Env & Heritage Manager', 'Perdaman - Env & Heritage Manager'), ('SCJV - Project Director', 'SCJV - Project Director'), ('SCJV - Project Manager', 'SCJV - Project Manager'), ('SCJV - Construction Manager', 'SCJV - Construction Manager'), ('SCJV - Commercial Manager', 'SCJV - Commercial Manager'), ('SCJV - Engineering Manager', 'SCJV - Engineering Manager'), ('SCJV - Environmental Lead', 'SCJV - Environmental Lead'), ('SCJV - HSSE Manager', 'SCJV - HSSE Manager'), ('SCJV - Heritage & Indigenous Relations Manager', 'SCJV - Heritage & Indigenous Relations Manager'), ('SCJV - Lead Environmental Advisor', 'SCJV - Lead Environmental Advisor'), ('SCJV - Senior Environmental Advisor', 'SCJV - Senior Environmental Advisor'), ('SCJV - Construction Director', 'SCJV - Construction Director'), ('SCJV - Project Environmental Representative', 'SCJV - Project Environmental Representative'), ('SCJV - Construction Supervisor', 'SCJV - Construction Supervisor'), ('SCJV - Community and Stakeholder', 'SCJV - Community and Stakeholder')], max_length=255)),
+                ('description', models.TextField(blank=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('company', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='responsibilities', to='company.company')),
+            ],
+            options={
+                'verbose_name': 'Responsibility',
+                'verbose_name_plural': 'Responsibilities',
+                'unique_together': {('name', 'company')},
+            },
+        ),
+        migrations.CreateModel(
+            name='ResponsibilityAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_responsibility_assignments', to=settings.AUTH_USER_MODEL)),
+                ('obligation', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='responsibility_assignments', to='obligations.obligation')),
+                ('responsibility', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='responsibility.responsibility')),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='role_assignments', to='responsibility.responsibility')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='responsibility_assignments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Responsibility Assignment',
+                'verbose_name_plural': 'Responsibility Assignments',
+                'ordering': ['-created_at'],
+                'unique_together': {('user', 'obligation', 'role')},
+            },
+        ),
+    ]
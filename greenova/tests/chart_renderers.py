@@ -0,0 +1,13 @@
+"""Chart renderers for render service tests.
+
+Worker processes are spawned, so a renderer has to be importable without
+Django being set up; this module imports nothing from the project.
+"""
+
+import time
+
+
+def hang(spec) -> bytes:
+    """Never finish, like a render stuck on a pathological chart."""
+    while True:
+        time.sleep(60)
@@ -1,7 +1,24 @@
 """Pytest test cases for figures.py in mechanisms app."""
 
+import io
+from base64 import b64decode
+from pathlib import Path
+from xml.etree import ElementTree
+
+import pytest
 from beartype import beartype
-from mechanisms import figures
+from django.core.management import call_command
+from mechanisms import figure_cache, figures
+from mechanisms.models import EnvironmentalMechanism
+from mechanisms.svg_charts import (
+    StatusSlice,
+    render_mechanism_chart,
+    render_status_bars,
+    render_status_pie,
+    status_slices,
+)
+
+SVG_NS = "{http://www.w3.org/2000/svg}"
 
 PIE_LABELS: list[str] = ["Not Started", "In Progress", "Completed"]
 PIE_COLORS: list[str] = ["#f9c74f", "#90be6d", "#43aa8b"]
@@ -37,3 +54,135 @@ def test_generate_plotly_pie_chart_empty() -> None:
     html: str = figures.generate_plotly_pie_chart(data, labels, colors)
     assert isinstance(html, str)
     assert "plotly" in html or "<div" in html
+
+
+@beartype
+def test_svg_status_pie_segments_carry_data_attributes() -> None:
+    """Each non-empty slice is a segment with its status and count attached."""
+    svg = render_status_pie(status_slices([2, 0, 5, 1]), donut=0.5, mechanism_id=7)
+    root = ElementTree.fromstring(svg)
+    segments = root.findall(f"{SVG_NS}path")
+    assert [s.get("data-status") for s in segments] == [
+        "Not Started",
+        "Completed",
+        "Overdue",
+    ]
+    assert [s.get("data-count") for s in segments] == ["2", "5", "1"]
+    assert segments[0].get("id") == "segment-7-not_started"
+    assert root.get("class") == "status-chart status-chart-donut"
+
+    single = ElementTree.fromstring(render_status_pie([StatusSlice("Done", 3, "#000")]))
+    assert single.find(f"{SVG_NS}circle").get("data-count") == "3"
+
+
+@beartype
+def test_svg_status_charts_without_data() -> None:
+    """All-zero counts render the empty state instead of segments."""
+    for svg in (
+        render_status_pie(status_slices([0, 0, 0, 0])),
+        render_status_bars(status_slices([0, 0, 0, 0])),
+    ):
+        root = ElementTree.fromstring(svg)
+        assert root.find(f"{SVG_NS}path") is None
+        assert root.find(f"{SVG_NS}text").text == "No data available"
+
+    bars = ElementTree.fromstring(render_status_bars(status_slices([1, 3, 0, 2])))
+    assert [r.get("data-count") for r in bars.findall(f"{SVG_NS}rect")] == [
+        "1",
+        "3",
+        "0",
+        "2",
+    ]
+
+
+@pytest.mark.django_db
+def test_benchmark_status_charts_command(mechanism: EnvironmentalMechanism) -> None:
+    """The benchmark draws each mechanism with both renderers."""
+    mechanism.completed_count = 4
+    mechanism.save()
+    assert 'data-count="4"' in render_mechanism_chart(mechanism)
+
+    out = io.StringIO()
+    call_command("benchmark_status_charts", "--repeat", "1", stdout=out)
+    assert "Drew 1 charts per renderer" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_status_chart_is_served_from_disk_cache(
+    mechanism: EnvironmentalMechanism,
+    settings,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    django_assert_num_queries,
+) -> None:
+    """status_chart renders once per set of counts and evicts by size."""
+    settings.MECHANISM_FIGURE_CACHE_ROOT = str(tmp_path)
+    renders = []
+    original = figures.generate_pie_chart
+
+    def counting_render(params):
+        renders.append(params.data)
+        return original(params)
+
+    monkeypatch.setattr(figures, "generate_pie_chart", counting_render)
+    walks = []
+    real_walk = figure_cache.os.walk
+
+    def counting_walk(top, *args, **kwargs):
+        walks.append(top)
+        return real_walk(top, *args, **kwargs)
+
+    monkeypatch.setattr(figure_cache.os, "walk", counting_walk)
+    mechanism.completed_count = 3
+
+    with django_assert_num_queries(0):
+        first = mechanism.status_chart
+        assert mechanism.status_chart.source == first.source
+    assert not first.error
+    assert b64decode(first.source).startswith(b"\x89PNG")
+    assert renders == [[0, 0, 3, 0]]
+
+    mechanism.overdue_count = 1
+    assert mechanism.status_chart.source != first.source
+    assert len(renders) == 2
+    assert len(list(tmp_path.rglob("*.png"))) == 2
+    # The directory is measured once, then tracked from the sizes written
+    assert walks == [str(tmp_path)]
+
+    # Trimming to one file keeps the most recently used figure
+    newest = figure_cache.figure_path(
+        figure_cache.figure_digest(mechanism.id, [0, 0, 3, 1], 300, 250, "png"),
+        "png",
+    )
+    assert figure_cache.evict(max_bytes=Path(newest).stat().st_size) == 1
+    assert [str(path) for path in tmp_path.rglob("*.png")] == [newest]
+
+    # A write that takes the estimate over the limit walks and evicts
+    settings.MECHANISM_FIGURE_CACHE_MAX_BYTES = Path(newest).stat().st_size
+    walks.clear()
+    mechanism.in_progress_count = 2
+    latest = mechanism.status_chart
+    assert not latest.error
+    assert walks == [str(tmp_path)]
+    assert not Path(newest).exists()
+
+
+@pytest.mark.django_db
+def test_warm_mechanism_charts_command(
+    mechanism: EnvironmentalMechanism, settings, tmp_path: Path
+) -> None:
+    """Warming renders uncached charts once and counts hits and misses."""
+    settings.MECHANISM_FIGURE_CACHE_ROOT = str(tmp_path)
+    mechanism.completed_count = 2
+    mechanism.save()
+
+    out = io.StringIO()
+    call_command("warm_mechanism_charts", stdout=out)
+    assert "1 rendered, 0 already cached, 0 failed" in out.getvalue()
+    assert len(list(tmp_path.rglob("*.png"))) == 1
+
+    out = io.StringIO()
+    call_command("warm_mechanism_charts", "--project", mechanism.project_id, stdout=out)
+    assert "0 rendered, 1 already cached" in out.getvalue()
+    stats = figure_cache.cache_stats()
+    assert (stats.hits, stats.misses, stats.hit_rate) == (1, 0, 1.0)
@@ -0,0 +1,173 @@
+"""Tests for incremental maintenance of mechanism status counters."""
+
+# Copyright 2025 Enveng Group.
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+from datetime import timedelta
+
+import pytest
+from django.core.signals import request_started
+from django.utils import timezone
+from mechanisms import scheduler
+from mechanisms.counters import (
+    CounterState,
+    compute_counter_deltas,
+    rollover_overdue_counts,
+)
+from mechanisms.models import (
+    CounterCheckpoint,
+    EnvironmentalMechanism,
+    update_all_mechanism_counts,
+)
+from obligations.constants import (
+    STATUS_COMPLETED,
+    STATUS_IN_PROGRESS,
+    STATUS_NOT_STARTED,
+)
+from obligations.models import Obligation
+from projects.models import Project
+
+
+def _counts(mechanism: EnvironmentalMechanism) -> tuple[int, int, int, int]:
+    mechanism.refresh_from_db()
+    return (
+        mechanism.not_started_count,
+        mechanism.in_progress_count,
+        mechanism.completed_count,
+        mechanism.overdue_count,
+    )
+
+
+def test_compute_counter_deltas_moves_between_mechanisms() -> None:
+    """A mechanism change decrements the old and increments the new mechanism."""
+    old = CounterState(mechanism_id=1, status=STATUS_NOT_STARTED, overdue=True)
+    new = CounterState(mechanism_id=2, status=STATUS_IN_PROGRESS, overdue=False)
+
+    assert compute_counter_deltas(old, new) == {
+        1: {"not_started_count": -1, "overdue_count": -1},
+        2: {"in_progress_count": 1},
+    }
+    assert compute_counter_deltas(old, old) == {}
+
+
+@pytest.mark.django_db
+def test_counters_follow_obligation_lifecycle(
+    project: Project, mechanism: EnvironmentalMechanism
+) -> None:
+    """Create, update, reassign and delete keep counters in step."""
+    other = EnvironmentalMechanism.objects.create(name="Other", project=project)
+    yesterday = timezone.now().date() - timedelta(days=1)
+
+    obligation = Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation="Counted",
+        project=project,
+        primary_environmental_mechanism=mechanism,
+        status=STATUS_NOT_STARTED,
+        action_due_date=yesterday,
+    )
+    assert _counts(mechanism) == (1, 0, 0, 1)
+
+    obligation.status = STATUS_COMPLETED
+    obligation.save()
+    assert _counts(mechanism) == (0, 0, 1, 0)
+
+    obligation.primary_environmental_mechanism = other
+    obligation.save()
+    assert _counts(mechanism) == (0, 0, 0, 0)
+    assert _counts(other) == (0, 0, 1, 0)
+
+    obligation.delete()
+    assert _counts(other) == (0, 0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_update_all_mechanism_counts_repairs_drift(
+    project: Project, mechanism: EnvironmentalMechanism
+) -> None:
+    """The set-based recount restores counters changed behind the ORM's back."""
+    yesterday = timezone.now().date() - timedelta(days=1)
+    Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation="Overdue",
+        project=project,
+        primary_environmental_mechanism=mechanism,
+        status=STATUS_IN_PROGRESS,
+        action_due_date=yesterday,
+    )
+    Obligation.objects.create(
+        obligation_number="PCEMP-002",
+        obligation="Done",
+        project=project,
+        primary_environmental_mechanism=mechanism,
+        status=STATUS_COMPLETED,
+        action_due_date=yesterday,
+    )
+    empty = EnvironmentalMechanism.objects.create(
+        name="Empty", project=project, completed_count=5
+    )
+    EnvironmentalMechanism.objects.filter(pk=mechanism.pk).update(
+        not_started_count=9, overdue_count=0
+    )
+
+    assert update_all_mechanism_counts() == 2
+    assert _counts(mechanism) == (0, 1, 1, 1)
+    assert _counts(empty) == (0, 0, 0, 0)
+
+
+@pytest.mark.django_db
+def test_rollover_counts_only_newly_overdue(
+    project: Project, mechanism: EnvironmentalMechanism
+) -> None:
+    """The rollover adds obligations whose due date passed since the last run."""
+    today = timezone.now().date()
+    for number, days, status in (
+        ("PCEMP-001", 1, STATUS_NOT_STARTED),
+        ("PCEMP-002", 2, STATUS_IN_PROGRESS),
+        ("PCEMP-003", 2, STATUS_COMPLETED),
+        ("PCEMP-004", 10, STATUS_NOT_STARTED),
+    ):
+        Obligation.objects.create(
+            obligation_number=number,
+            obligation="Upcoming",
+            project=project,
+            primary_environmental_mechanism=mechanism,
+            status=status,
+            action_due_date=today + timedelta(days=days),
+        )
+    update_all_mechanism_counts()
+    assert CounterCheckpoint.reference_date() == today
+    assert _counts(mechanism)[3] == 0
+
+    assert rollover_overdue_counts(today + timedelta(days=3)) == 2
+    assert _counts(mechanism)[3] == 2
+    assert CounterCheckpoint.reference_date() == today + timedelta(days=3)
+
+    # Running again for the same date is a no-op
+    assert rollover_overdue_counts(today + timedelta(days=3)) == 0
+    assert _counts(mechanism)[3] == 2
+
+    # Edits made after the rollover are evaluated against the checkpoint date
+    completed = Obligation.objects.get(obligation_number="PCEMP-001")
+    completed.status = STATUS_COMPLETED
+    completed.save()
+    assert _counts(mechanism) == (1, 1, 2, 1)
+
+
+@pytest.mark.django_db
+def test_overdue_rollover_timer_waits_for_a_request(settings) -> None:
+    """The rollover timer only starts in a process that serves requests."""
+    settings.MECHANISM_OVERDUE_ROLLOVER_INTERVAL = 3600
+    scheduler.stop_overdue_rollover()
+    try:
+        assert scheduler.start_overdue_rollover_on_request()
+        assert scheduler._state["timer"] is None
+
+        request_started.send(sender=None)
+        assert scheduler._state["timer"] is not None
+    finally:
+        scheduler.stop_overdue_rollover()
+        request_started.disconnect(scheduler._start_on_first_request)
+
+    settings.MECHANISM_OVERDUE_ROLLOVER_INTERVAL = 0
+    assert not scheduler.start_overdue_rollover_on_request()
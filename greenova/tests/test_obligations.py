@@ -8,15 +8,46 @@
 # Copyright 2025 Enveng Group.
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import csv
+import io
+import os
+import zipfile
+from datetime import timedelta
+from pathlib import Path
+from xml.etree import ElementTree
+
+import core.storage
 import pytest
+from core.storage import BLOB_DIRECTORY, INODE_DIRECTORY
+from django.core.files.base import ContentFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from mechanisms.models import EnvironmentalMechanism
-from obligations.constants import STATUS_IN_PROGRESS, STATUS_NOT_STARTED
-from obligations.models import Obligation
+from obligations.constants import (
+    STATUS_COMPLETED,
+    STATUS_IN_PROGRESS,
+    STATUS_NOT_STARTED,
+)
+from obligations.exchange import ObligationRecord, record_to_import
+from obligations.forecasting import update_recurring_dates
+from obligations.models import (
+    Obligation,
+    ObligationEvidence,
+    ObligationNumberSequence,
+)
+from obligations.pagination import DEFAULT_PAGE_SIZE, paginate_keyset
+from obligations.query_plans import explain_hot_queries
+from obligations.search import search_index_available, search_obligations
+from obligations.utils import get_obligation_status
 from projects.models import Project
 
 HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+HTTP_BAD_REQUEST = 400
 
 
 @pytest.mark.django_db
@@ -120,3 +151,881 @@ def test_obligation_delete_view(admin_client: Client):
     response = admin_client.post(url)
     assert response.status_code == HTTP_OK
     assert not Obligation.objects.filter(obligation_number="OBL001").exists()
+
+
+@pytest.mark.django_db
+def test_obligation_number_sequence_seeds_from_existing_maximum():
+    """The number allocator continues from the highest existing number."""
+    project = Project.objects.create(name="Test Project")
+    Obligation.objects.create(
+        obligation_number="PCEMP-041", obligation="Existing", project=project
+    )
+    ObligationNumberSequence.objects.all().delete()
+
+    assert Obligation.get_next_obligation_number() == "PCEMP-042"
+    assert Obligation.get_next_obligation_number() == "PCEMP-043"
+
+
+@pytest.mark.django_db
+def test_obligation_number_block_reservation():
+    """Reserved blocks are contiguous and never handed out twice."""
+    project = Project.objects.create(name="Test Project")
+    block = Obligation.reserve_obligation_numbers(3)
+    assert block == ["PCEMP-001", "PCEMP-002", "PCEMP-003"]
+
+    # An explicitly numbered obligation pushes the counter forward
+    Obligation.objects.create(
+        obligation_number="PCEMP-010", obligation="Manual", project=project
+    )
+    assert Obligation.get_next_obligation_number() == "PCEMP-011"
+
+
+@pytest.mark.django_db
+def test_obligation_queryset_status_predicates():
+    """Overdue/upcoming filters and effective status are evaluated in SQL."""
+    project = Project.objects.create(name="Test Project")
+    today = timezone.now().date()
+    rows = {
+        "PCEMP-001": (STATUS_NOT_STARTED, today - timedelta(days=3)),
+        "PCEMP-002": (STATUS_COMPLETED, today - timedelta(days=3)),
+        "PCEMP-003": (STATUS_IN_PROGRESS, today + timedelta(days=5)),
+        "PCEMP-004": (STATUS_IN_PROGRESS, today + timedelta(days=60)),
+    }
+    for number, (status, due) in rows.items():
+        Obligation.objects.create(
+            obligation_number=number,
+            obligation=number,
+            project=project,
+            status=status,
+            action_due_date=due,
+        )
+
+    assert list(
+        Obligation.objects.overdue().values_list("obligation_number", flat=True)
+    ) == ["PCEMP-001"]
+    assert list(
+        Obligation.objects.upcoming().values_list("obligation_number", flat=True)
+    ) == ["PCEMP-003"]
+    assert Obligation.objects.active().count() == 3
+
+    effective = dict(
+        Obligation.objects.with_effective_status().values_list(
+            "obligation_number", "effective_status"
+        )
+    )
+    for obligation in Obligation.objects.all():
+        assert effective[obligation.obligation_number] == get_obligation_status(
+            obligation
+        )
+
+
+@pytest.mark.django_db
+def test_update_recurring_dates_matches_per_row_calculation(project: Project):
+    """The batch forecaster agrees with calculate_next_recurring_date."""
+    today = timezone.now().date()
+    rows = [
+        ("PCEMP-001", "Monthly", today.replace(day=1) + timedelta(days=30), None),
+        ("PCEMP-002", "quarterly", None, today + timedelta(days=10)),
+        ("PCEMP-003", "twice a year", None, today - timedelta(days=40)),
+        ("PCEMP-004", "weekly", today + timedelta(days=3), None),
+        ("PCEMP-005", "every so often", None, None),
+        ("PCEMP-006", "", today, None),
+    ]
+    for number, frequency, forecast, due in rows:
+        Obligation.objects.create(
+            obligation_number=number,
+            obligation=number,
+            project=project,
+            recurring_obligation=True,
+            recurring_frequency=frequency,
+            recurring_forcasted_date=forecast,
+            action_due_date=due,
+        )
+    expected = {
+        obligation.obligation_number: obligation.calculate_next_recurring_date()
+        for obligation in Obligation.objects.all()
+    }
+
+    assert update_recurring_dates() == len(rows)
+    assert (
+        dict(
+            Obligation.objects.values_list(
+                "obligation_number", "recurring_forcasted_date"
+            )
+        )
+        == expected
+    )
+
+
+@pytest.mark.django_db
+def test_save_compares_against_load_time_snapshot(
+    project: Project, mechanism: EnvironmentalMechanism
+):
+    """Saving a loaded obligation does not re-read its row to detect changes."""
+    Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation="Tracked",
+        project=project,
+        primary_environmental_mechanism=mechanism,
+        status=STATUS_NOT_STARTED,
+    )
+    obligation = Obligation.objects.get(pk="PCEMP-001")
+    assert obligation.get_loaded_values()["status"] == STATUS_NOT_STARTED
+
+    obligation.status = STATUS_IN_PROGRESS
+    with CaptureQueriesContext(connection) as queries:
+        obligation.save()
+    selects = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("SELECT")
+        and "obligations_obligation" in query["sql"]
+    ]
+    assert selects == []
+    assert obligation.get_loaded_values()["status"] == STATUS_IN_PROGRESS
+
+    mechanism.refresh_from_db()
+    assert (mechanism.not_started_count, mechanism.in_progress_count) == (0, 1)
+
+    # An edit that leaves the counter fields alone never reads the checkpoint
+    obligation.obligation = "Reworded"
+    with CaptureQueriesContext(connection) as queries:
+        obligation.save()
+    assert not any(
+        "countercheckpoint" in query["sql"] for query in queries.captured_queries
+    )
+
+
+@pytest.mark.django_db
+def test_refresh_from_db_resnapshots_tracked_fields(
+    project: Project, mechanism: EnvironmentalMechanism
+):
+    """A save after refresh_from_db() diffs against the refreshed values."""
+    Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation="Tracked",
+        project=project,
+        primary_environmental_mechanism=mechanism,
+        status=STATUS_NOT_STARTED,
+    )
+    obligation = Obligation.objects.get(pk="PCEMP-001")
+    Obligation.objects.filter(pk="PCEMP-001").update(status=STATUS_IN_PROGRESS)
+    mechanism.update_obligation_counts()
+
+    obligation.refresh_from_db()
+    assert obligation.get_loaded_values()["status"] == STATUS_IN_PROGRESS
+    obligation.status = STATUS_COMPLETED
+    obligation.save()
+
+    mechanism.refresh_from_db()
+    assert (
+        mechanism.not_started_count,
+        mechanism.in_progress_count,
+        mechanism.completed_count,
+    ) == (0, 0, 1)
+
+
+@pytest.mark.django_db
+def test_search_obligations_uses_full_text_index(project: Project):
+    """Search finds text and comments, including rows changed by update()."""
+    assert search_index_available()
+    Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation="Install dust suppression on haul roads",
+        project=project,
+    )
+    Obligation.objects.create(
+        obligation_number="PCEMP-002",
+        obligation="Monitor groundwater",
+        general_comments="Dust observed near the bore",
+        project=project,
+    )
+    Obligation.objects.create(
+        obligation_number="PCEMP-003", obligation="Lighting survey", project=project
+    )
+
+    def search(term: str) -> list[str]:
+        return list(
+            search_obligations(Obligation.objects.all(), term).values_list(
+                "obligation_number", flat=True
+            )
+        )
+
+    assert sorted(search("DUST")) == ["PCEMP-001", "PCEMP-002"]
+    assert search("haul road") == ["PCEMP-001"]
+    assert search("EMP-003") == ["PCEMP-003"]
+
+    Obligation.objects.filter(pk="PCEMP-003").update(
+        supporting_information="Dust lighting interaction"
+    )
+    assert sorted(search("dust")) == ["PCEMP-001", "PCEMP-002", "PCEMP-003"]
+
+    Obligation.objects.filter(pk="PCEMP-001").delete()
+    assert sorted(search("dust")) == ["PCEMP-002", "PCEMP-003"]
+    # Terms too short for the index fall back to icontains
+    assert search("03") == ["PCEMP-003"]
+
+    # Matches and ranks come from one MATCH joined to the obligations
+    sql = str(search_obligations(Obligation.objects.all(), "dust").query)
+    assert sql.count("MATCH") == 1
+    assert sql.count("SELECT") == 1
+
+    # Renumbering rowids, as VACUUM may, leaves the index keyed correctly
+    with connection.cursor() as cursor:
+        cursor.execute(f"UPDATE {Obligation._meta.db_table} SET rowid = -rowid")
+    assert search("groundwater") == ["PCEMP-002"]
+    Obligation.objects.filter(pk="PCEMP-002").delete()
+    assert search("dust") == ["PCEMP-003"]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_keyset_pagination_walks_every_row_once(project: Project, order: str):
+    """Following cursors visits each obligation once, in sort order."""
+    today = timezone.now().date()
+    for i in range(7):
+        Obligation.objects.create(
+            obligation_number=f"PCEMP-{i + 1:03d}",
+            obligation=f"Obligation {i}",
+            project=project,
+            action_due_date=None if i % 3 == 0 else today + timedelta(days=i % 2),
+        )
+    expected = sorted(
+        Obligation.objects.values_list("action_due_date", "obligation_number"),
+        key=lambda row: (row[0] is not None, row[0] or today, row[1]),
+        reverse=order == "desc",
+    )
+
+    seen = []
+    cursor = None
+    while True:
+        page = paginate_keyset(
+            Obligation.objects.all(),
+            sort="action_due_date",
+            order=order,
+            cursor=cursor,
+            page_size=3,
+        )
+        seen.extend((o.action_due_date, o.obligation_number) for o in page.items)
+        if not page.has_next:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_obligation_list_view_serves_htmx_pages(
+    authenticated_client: Client, project: Project
+):
+    """The list view returns rows plus a sentinel that loads the next page."""
+    for i in range(DEFAULT_PAGE_SIZE + 1):
+        Obligation.objects.create(
+            obligation_number=f"PCEMP-{i + 1:03d}",
+            obligation=f"Obligation {i}",
+            project=project,
+        )
+    url = reverse("obligations:obligation_list")
+
+    response = authenticated_client.get(
+        url, {"sort": "obligation_number", "order": "desc"}, HTTP_HX_REQUEST="true"
+    )
+    assert response.status_code == HTTP_OK
+    content = response.content.decode()
+    assert f"PCEMP-{DEFAULT_PAGE_SIZE + 1:03d}" in content
+    assert "PCEMP-001" not in content
+    next_url = response.context["next_page_url"]
+    assert "cursor=" in next_url
+
+    response = authenticated_client.get(next_url, HTTP_HX_REQUEST="true")
+    assert [o.obligation_number for o in response.context["obligations"]] == [
+        "PCEMP-001"
+    ]
+    assert response.context["next_page_url"] is None
+
+    response = authenticated_client.get(url, {"cursor": "not-a-cursor"})
+    assert response.status_code == HTTP_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_hot_obligation_queries_use_indexes():
+    """Every catalogued hot query seeks into an index instead of scanning."""
+    plans = {plan.query.name: plan for plan in explain_hot_queries()}
+
+    assert [name for name, plan in plans.items() if not plan.ok] == []
+    assert "project_id=? AND status=? AND action_due_date<?" in (
+        plans["dashboard overdue obligations"].plan
+    )
+    assert "(project_id=?" in plans["project overdue count"].plan
+
+
+@pytest.mark.django_db
+def test_obligation_export_streams_filtered_rows(
+    admin_client: Client,
+    project: Project,
+    mechanism: EnvironmentalMechanism,
+    tmp_path: Path,
+):
+    """CSV and XLSX exports stream the rows selected by the summary filters."""
+    today = timezone.now().date()
+    Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation='Dust <control> & "monitoring"\x0b\x1f',
+        project=project,
+        primary_environmental_mechanism=mechanism,
+        status=STATUS_IN_PROGRESS,
+        action_due_date=today - timedelta(days=1),
+    )
+    Obligation.objects.create(
+        obligation_number="PCEMP-002",
+        obligation="Lighting",
+        project=project,
+        status=STATUS_COMPLETED,
+    )
+    url = reverse("obligations:export")
+
+    response = admin_client.get(url, {"project_id": project.pk, "status": "overdue"})
+    assert response.status_code == HTTP_OK
+    assert response.streaming
+    rows = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert rows[0][:2] == ["Obligation Number", "Project"]
+    assert [row[0] for row in rows[1:]] == ["PCEMP-001"]
+    assert rows[1][2] == mechanism.name
+
+    response = admin_client.get(url, {"format": "xlsx"})
+    assert response.status_code == HTTP_OK
+    with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content))) as book:
+        sheet = book.read("xl/worksheets/sheet1.xml").decode()
+    assert "Dust &lt;control&gt; &amp;" in sheet
+    # Control characters are illegal in XML and are dropped
+    ElementTree.fromstring(sheet)
+    assert "PCEMP-002" in sheet
+
+    output = tmp_path / "export.csv"
+    call_command("export_obligations", str(output), "--search", "lighting")
+    assert [row[0] for row in csv.reader(output.open())] == [
+        "Obligation Number",
+        "PCEMP-002",
+    ]
+    out = io.StringIO()
+    call_command(
+        "export_obligations",
+        "-",
+        "--search",
+        "lighting",
+        stdout=out,
+        stderr=io.StringIO(),
+    )
+    assert [row[0] for row in csv.reader(io.StringIO(out.getvalue()))] == [
+        "Obligation Number",
+        "PCEMP-002",
+    ]
+
+
+@pytest.mark.django_db
+def test_obligation_export_rejects_unknown_format_as_plain_text(admin_client: Client):
+    """The echoed format parameter is never served as HTML."""
+    response = admin_client.get(
+        reverse("obligations:export"), {"format": "<script>alert(1)</script>"}
+    )
+    assert response.status_code == HTTP_BAD_REQUEST
+    assert response["Content-Type"].startswith("text/plain")
+
+
+IMPORT_HEADER = [
+    "obligation__number",
+    "primary__environmental__mechanism",
+    "obligation",
+    "status",
+    "action__due_date",
+    "recurring__obligation",
+    "recurring__frequency",
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("batch_size", [0, 2])
+def test_import_obligations_batched_and_per_row_agree(
+    project: Project,
+    mechanism: EnvironmentalMechanism,
+    tmp_path: Path,
+    batch_size: int,
+):
+    """Both import modes create, update and skip rows and leave exact counts."""
+    Obligation.objects.create(
+        obligation_number="PCEMP-001",
+        obligation="Old text",
+        project=project,
+        primary_environmental_mechanism=mechanism,
+    )
+    csv_path = tmp_path / "register.csv"
+    with csv_path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(IMPORT_HEADER)
+        writer.writerow(
+            ["PCEMP-001", mechanism.name, "New text", "completed", "", "", ""]
+        )
+        writer.writerow(
+            ["PCEMP-002", mechanism.name, "Dust", "in progress", "2020-01-01", "", ""]
+        )
+        writer.writerow(["PCEMP-003", "Noise Plan", "Noise", "", "", "yes", "weekly"])
+        writer.writerow(["PCEMP-003", "Noise Plan", "Repeat", "", "", "", ""])
+    out = io.StringIO()
+
+    call_command(
+        "import_obligations",
+        str(csv_path),
+        "--project",
+        project.name,
+        "--update",
+        "--batch-size",
+        str(batch_size),
+        stdout=out,
+    )
+
+    assert "rows/sec" in out.getvalue()
+    assert Obligation.objects.get(pk="PCEMP-001").obligation == "New text"
+    assert Obligation.objects.get(pk="PCEMP-003").obligation == "Repeat"
+    noise = EnvironmentalMechanism.objects.get(project=project, name="Noise Plan")
+    assert noise.primary_environmental_mechanism == "Noise Plan"
+    mechanism.refresh_from_db()
+    assert (mechanism.completed_count, mechanism.in_progress_count) == (1, 1)
+    assert mechanism.overdue_count == 1
+    noise.refresh_from_db()
+    assert noise.not_started_count == 1
+
+
+@pytest.mark.django_db
+def test_import_obligations_batches_use_constant_queries(project: Project):
+    """A batch costs the same number of queries whatever its size."""
+    from obligations.importing import ImportRecord, ObligationBatchWriter
+
+    def records(start: int, count: int) -> list[ImportRecord]:
+        return [
+            ImportRecord(
+                {"obligation_number": f"PCEMP-{n:03d}", "obligation": f"Row {n}"},
+                f"Mechanism {n % 3}",
+            )
+            for n in range(start, start + count)
+        ]
+
+    writer = ObligationBatchWriter(project)
+    writer.write(records(1, 3))
+    with CaptureQueriesContext(connection) as small:
+        writer.write(records(10, 5))
+    with CaptureQueriesContext(connection) as large:
+        writer.write(records(100, 20))
+    skipped = writer.write([*records(1, 3), ImportRecord({"obligation": "x"}, None)])
+    stats = writer.finish()
+
+    assert len(large.captured_queries) == len(small.captured_queries)
+    assert (skipped.created, skipped.skipped) == (1, 3)
+    assert (stats.rows, stats.created, stats.mechanisms_created) == (32, 29, 3)
+    assert Obligation.objects.count() == stats.created
+    assert Obligation.get_next_obligation_number() == "PCEMP-121"
+
+
+@pytest.mark.django_db
+def test_import_obligations_counts_rows_retried_after_a_failed_batch(
+    project: Project, mechanism: EnvironmentalMechanism, tmp_path: Path, monkeypatch
+):
+    """Rows written one at a time after a batch fails still show in the stats."""
+    from obligations.importing import ObligationBatchWriter
+
+    def failing_write(self, records):
+        raise DatabaseError("batch rejected")
+
+    monkeypatch.setattr(ObligationBatchWriter, "write", failing_write)
+    csv_path = tmp_path / "register.csv"
+    with csv_path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(IMPORT_HEADER)
+        for number in (1, 2, 3):
+            writer.writerow(
+                [f"PCEMP-00{number}", mechanism.name, "Dust", "", "", "", ""]
+            )
+    out = io.StringIO()
+
+    call_command(
+        "import_obligations",
+        str(csv_path),
+        "--project",
+        project.name,
+        "--batch-size",
+        "2",
+        "--continue-on-error",
+        stdout=out,
+        stderr=io.StringIO(),
+    )
+
+    assert "3 created, 0 updated, 0 skipped" in out.getvalue()
+    assert Obligation.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_import_obligation_registers_parses_in_parallel(tmp_path: Path):
+    """Registers in a directory are parsed by workers and written per project."""
+    for name, numbers in (("Alpha", [1, 2]), ("Beta", [3, 4, 5])):
+        with (tmp_path / f"{name}.csv").open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(IMPORT_HEADER)
+            for number in numbers:
+                writer.writerow(
+                    [f"PCEMP-{number:03d}", f"{name} Plan", "Text", "", "", "", ""]
+                )
+    out = io.StringIO()
+
+    call_command(
+        "import_obligation_registers",
+        str(tmp_path),
+        "--workers",
+        "2",
+        "--batch-size",
+        "2",
+        stdout=out,
+    )
+
+    assert "5 rows from 2 files" in out.getvalue()
+    assert f"{tmp_path / 'Beta.csv'}: 3 rows, 3 created" in out.getvalue()
+    beta = EnvironmentalMechanism.objects.get(project__name="Beta", name="Beta Plan")
+    assert beta.not_started_count == 3
+    assert Obligation.objects.filter(project__name="Alpha").count() == 2
+
+
+@pytest.mark.django_db
+def test_import_obligation_registers_reports_failed_files(tmp_path: Path):
+    """A register that cannot be read fails alone; the others are imported."""
+    with (tmp_path / "Alpha.csv").open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(IMPORT_HEADER)
+        writer.writerow(["PCEMP-001", "Alpha Plan", "Text", "", "", "", ""])
+    (tmp_path / "Broken.csv").write_bytes(
+        ",".join(IMPORT_HEADER).encode() + b"\nPCEMP-002,Plan,\xff\xfe,,,,\n"
+    )
+    out, err = io.StringIO(), io.StringIO()
+
+    with pytest.raises(CommandError, match=r"Failed files: .*Broken\.csv"):
+        call_command(
+            "import_obligation_registers",
+            str(tmp_path),
+            "--workers",
+            "2",
+            stdout=out,
+            stderr=err,
+        )
+
+    assert "UnicodeDecodeError" in err.getvalue()
+    assert "1 rows from 1 files" in out.getvalue()
+    assert list(Obligation.objects.values_list("pk", flat=True)) == ["PCEMP-001"]
+
+
+@pytest.mark.django_db
+def test_clean_csv_to_import_chunked_output_matches(tmp_path: Path):
+    """Cleaning in chunks writes the same file as cleaning all at once."""
+    source = tmp_path / "dirty.csv"
+    with source.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["Obligation Number", "Status", "ProjectPhase", "Inspection"])
+        writer.writerows(
+            [
+                ["12", "Complete", "Design phase", "Yes"],
+                ["A-7", "In-Progress", "operation", "no"],
+                ["", "", "Throughout", "maybe"],
+                ["PCEMP-9", "weird", "unknown", ""],
+                ["3", "not started", "Construction", "TRUE"],
+            ]
+        )
+    whole, chunked = tmp_path / "whole.csv", tmp_path / "chunked.csv"
+    out = io.StringIO()
+
+    call_command("clean_csv_to_import", str(source), "--output", str(whole), stdout=out)
+    call_command(
+        "clean_csv_to_import",
+        str(source),
+        "--output",
+        str(chunked),
+        "--chunksize",
+        "2",
+        stdout=io.StringIO(),
+    )
+
+    assert "Stage timings:" in out.getvalue()
+    assert chunked.read_text() == whole.read_text()
+    rows = list(csv.DictReader(whole.open()))
+    assert [row["obligation__number"] for row in rows] == [
+        "PCEMP-12",
+        "PCEMP-7",
+        "",
+        "PCEMP-9",
+        "PCEMP-3",
+    ]
+    assert [row["status"] for row in rows] == [
+        "completed",
+        "in progress",
+        "not started",
+        "not started",
+        "not started",
+    ]
+    assert [row["project_phase"] for row in rows] == [
+        "Pre-Construction",
+        "Operation",
+        "Throughout the project",
+        "",
+        "Construction",
+    ]
+    assert [row["inspection"] for row in rows] == ["True", "False", "", "", "True"]
+
+
+@pytest.mark.django_db
+def test_protobuf_exchange_round_trips_obligations(
+    project: Project, mechanism: EnvironmentalMechanism, tmp_path: Path
+):
+    """A pb export re-imports to the same rows and rejects corrupt batches."""
+    other = Project.objects.create(name="Other Project")
+    today = timezone.now().date()
+    for number in range(1, 6):
+        Obligation.objects.create(
+            obligation_number=f"PCEMP-{number:03d}",
+            obligation=f"Obligation {number} marker",
+            project=project if number % 2 else other,
+            primary_environmental_mechanism=mechanism if number % 2 else None,
+            status=STATUS_IN_PROGRESS,
+            action_due_date=today if number < 3 else None,
+            general_comments="" if number == 1 else None,
+            inspection=number == 2,
+        )
+    columns = ["obligation_number", "project__name", "obligation", "status"]
+    columns += ["action_due_date", "general_comments", "inspection"]
+    columns += ["primary_environmental_mechanism__name", "recurring_forcasted_date"]
+    before = list(Obligation.objects.order_by("pk").values(*columns))
+    stream = tmp_path / "obligations.pb"
+
+    call_command(
+        "export_obligations", str(stream), "--chunk-size", "2", stderr=io.StringIO()
+    )
+    Obligation.objects.all().delete()
+    out = io.StringIO()
+    call_command("import_obligations_pb", str(stream), stdout=out)
+
+    assert "5 records" in out.getvalue()
+    assert list(Obligation.objects.order_by("pk").values(*columns)) == before
+    mechanism.refresh_from_db()
+    assert mechanism.in_progress_count == 3
+
+    corrupt = tmp_path / "corrupt.pb"
+    corrupt.write_bytes(stream.read_bytes().replace(b"3 marker", b"3 marked"))
+    Obligation.objects.all().delete()
+    with pytest.raises(CommandError, match="Checksum mismatch in batch 1"):
+        call_command("import_obligations_pb", str(corrupt), stdout=io.StringIO())
+    call_command(
+        "import_obligations_pb",
+        str(corrupt),
+        "--continue-on-error",
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+    assert sorted(Obligation.objects.values_list("pk", flat=True)) == [
+        "PCEMP-001",
+        "PCEMP-002",
+        "PCEMP-005",
+    ]
+
+
+def test_protobuf_record_with_empty_date_imports_as_unset():
+    """An empty date string in a pb record is read as no date."""
+    _project, imported = record_to_import(
+        ObligationRecord(project="P", obligation_number="X", action_due_date="")
+    )
+
+    assert imported.data["action_due_date"] is None
+
+
+@pytest.mark.django_db
+def test_evidence_files_share_one_blob(
+    project: Project, settings, tmp_path: Path, monkeypatch
+):
+    """Identical uploads are stored once and the blob goes with its last name."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    obligation = Obligation.objects.create(
+        obligation_number="PCEMP-001", obligation="Evidence", project=project
+    )
+    first, second = (
+        ObligationEvidence.objects.create(
+            obligation=obligation, file=ContentFile(b"signed report", name="a.pdf")
+        )
+        for _ in range(2)
+    )
+    storage = first.file.storage
+    blobs = list(storage.iter_blobs())
+
+    assert first.file.name != second.file.name
+    assert os.path.samefile(first.file.path, second.file.path)
+    assert [blob.references for blob in blobs] == [2]
+    assert second.file.read() == b"signed report"
+
+    # Deleting finds the blob by inode without reading the file again
+    def no_hashing(path):
+        raise AssertionError(f"{path} was hashed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(core.storage, "file_digest", no_hashing)
+        second.file.delete()
+        assert [blob.references for blob in storage.iter_blobs()] == [1]
+        first.file.delete()
+    assert list(storage.iter_blobs()) == []
+    assert list((tmp_path / BLOB_DIRECTORY / INODE_DIRECTORY).iterdir()) == []
+
+    # Files written before the storage was in use are linked by the command
+    for number, evidence in enumerate((first, second)):
+        name = f"evidence_files/legacy-{number}.pdf"
+        (tmp_path / "evidence_files").mkdir(exist_ok=True)
+        (tmp_path / name).write_bytes(b"legacy scan")
+        ObligationEvidence.objects.filter(pk=evidence.pk).update(file=name)
+    out = io.StringIO()
+    call_command("deduplicate_media", "--dry-run", stdout=out)
+    assert list(storage.iter_blobs()) == []
+    call_command("deduplicate_media", stdout=out)
+
+    assert "Checked 2 files" in out.getvalue()
+    assert [blob.references for blob in storage.iter_blobs()] == [2]
+    assert os.path.samefile(
+        tmp_path / "evidence_files/legacy-0.pdf",
+        tmp_path / "evidence_files/legacy-1.pdf",
+    )
+
+
+@pytest.mark.django_db
+def test_evidence_metadata_is_recorded_at_upload(
+    project: Project, settings, tmp_path: Path, monkeypatch
+):
+    """Size, type and digest are stored, so listings never stat the file."""
+    settings.MEDIA_ROOT = str(tmp_path)
+    obligation = Obligation.objects.create(
+        obligation_number="PCEMP-001", obligation="Evidence", project=project
+    )
+    evidence = ObligationEvidence.objects.create(
+        obligation=obligation, file=ContentFile(b"x" * 2048, name="scan.pdf")
+    )
+    evidence.refresh_from_db()
+
+    assert evidence.file_size_bytes == 2048
+    assert evidence.content_type == "application/pdf"
+    assert len(evidence.sha256) == 64
+
+    def no_storage_access(*args, **kwargs):
+        raise AssertionError("storage was accessed")
+
+    storage = evidence.file.storage
+    monkeypatch.setattr(storage, "size", no_storage_access)
+    monkeypatch.setattr(storage, "open", no_storage_access)
+    assert evidence.file_size() == "2.0 KB"
+    monkeypatch.undo()
+
+    digest = evidence.sha256
+    ObligationEvidence.objects.update(file_size_bytes=None, content_type="", sha256="")
+    call_command("backfill_evidence_metadata", stdout=io.StringIO())
+    evidence.refresh_from_db()
+    assert (evidence.file_size_bytes, evidence.sha256) == (2048, digest)
+    assert evidence.content_type == "application/pdf"
+
+
+@pytest.mark.django_db
+def test_evidence_preview_is_generated_in_background(
+    admin_client: Client, project: Project, settings, tmp_path: Path
+):
+    """Uploads queue a thumbnail; the view serves a placeholder until it exists."""
+    from obligations.previews import preview_status, schedule_preview
+    from PIL import Image
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.EVIDENCE_PREVIEW_ROOT = str(tmp_path / "previews")
+    obligation = Obligation.objects.create(
+        obligation_number="PCEMP-001", obligation="Evidence", project=project
+    )
+    photo = io.BytesIO()
+    Image.new("RGB", (1600, 1200), "green").save(photo, "PNG")
+    evidence = ObligationEvidence.objects.create(
+        obligation=obligation, file=ContentFile(photo.getvalue(), name="site.png")
+    )
+    url = reverse("obligations:evidence_preview", args=[evidence.pk])
+
+    response = admin_client.get(url)
+    assert response.status_code == 202
+    assert response["Content-Type"] == "image/svg+xml"
+    assert "no-store" in response["Cache-Control"]
+
+    # The request above queued the job; wait for it (or a fresh one)
+    future = schedule_preview(evidence)
+    if future is not None:
+        future.result(timeout=10)
+    assert preview_status(evidence) == "ready"
+
+    modal = admin_client.get(
+        reverse("obligations:detail", args=[obligation.pk]),
+        headers={"X-Requested-With": "XMLHttpRequest"},
+    )
+    assert f"{url}?v={evidence.sha256}" in modal.json()["content"]
+
+    response = admin_client.get(url)
+    assert response.status_code == HTTP_OK
+    assert response["Content-Type"] == "image/webp"
+    assert "immutable" in response["Cache-Control"]
+    with Image.open(io.BytesIO(b"".join(response.streaming_content))) as preview:
+        assert max(preview.size) == 320
+
+    text = ObligationEvidence.objects.create(
+        obligation=obligation, file=ContentFile(b"notes", name="notes.txt")
+    )
+    assert schedule_preview(text) is None
+    response = admin_client.get(
+        reverse("obligations:evidence_preview", args=[text.pk])
+    )
+    assert response.status_code == HTTP_OK
+    assert "No preview" in response.content.decode()
+
+    # A preview that fails to render is not queued again on every view
+    broken = ObligationEvidence.objects.create(
+        obligation=obligation, file=ContentFile(b"not a png", name="broken.png")
+    )
+    future = schedule_preview(broken)
+    if future is not None:
+        assert future.result(timeout=10) is None
+    assert preview_status(broken) == "unsupported"
+    assert schedule_preview(broken) is None
+    response = admin_client.get(
+        reverse("obligations:evidence_preview", args=[broken.pk])
+    )
+    assert response.status_code == HTTP_OK
+    assert "No preview" in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_evidence_preview_retries_transient_failures_and_bounds_queue(
+    project: Project, settings, tmp_path: Path, monkeypatch
+):
+    """Only undecodable files are marked failed, and the job queue is capped."""
+    from concurrent.futures import Future
+
+    from obligations import previews
+
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.EVIDENCE_PREVIEW_ROOT = str(tmp_path / "previews")
+    obligation = Obligation.objects.create(
+        obligation_number="PCEMP-001", obligation="Evidence", project=project
+    )
+    evidence = ObligationEvidence.objects.create(
+        obligation=obligation, file=ContentFile(b"\x89PNG pixels", name="site.png")
+    )
+
+    def disk_full(source, target):
+        raise OSError(28, "No space left on device")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(previews, "_render_image", disk_full)
+        assert previews.generate_preview(evidence) is None
+    assert previews.preview_status(evidence) == previews.PENDING
+
+    settings.EVIDENCE_PREVIEW_QUEUE = 1
+    monkeypatch.setitem(previews._pending, "0" * 64, Future())
+    assert previews.schedule_preview(evidence) is None
+    assert previews.preview_status(evidence) == previews.PENDING
@@ -16,10 +16,14 @@
 from typing import TYPE_CHECKING
 
 import pytest
+from dashboard.signals import dashboard_data_updated
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User as DjangoUser
 from django.test import Client
+from mechanisms.models import EnvironmentalMechanism
+from obligations.constants import STATUS_COMPLETED, STATUS_NOT_STARTED
 from obligations.models import Obligation
+from obligations.transitions import transition_status
 from projects.models import Project
 
 HTTP_OK = 200
@@ -70,7 +74,7 @@ def test_mark_single_obligation_complete(
     resp = client.post(url, data={"ids": [oid]}, content_type="application/json")
     assert resp.status_code == HTTP_OK
     overdue_obligations_fixture[0].refresh_from_db()
-    assert overdue_obligations_fixture[0].status == "Complete"
+    assert overdue_obligations_fixture[0].status == STATUS_COMPLETED
 
 
 @pytest.mark.django_db
@@ -87,7 +91,7 @@ def test_mark_bulk_obligations_complete(
     assert resp.status_code == HTTP_OK
     for o in overdue_obligations_fixture:
         o.refresh_from_db()
-        assert o.status == "Complete"
+        assert o.status == STATUS_COMPLETED
 
 
 @pytest.mark.django_db
@@ -157,3 +161,74 @@ def test_delete_invalid_payload(
     url = "/obligations/api/obligations/delete/"
     resp = client.delete(url, data={}, content_type="application/json")
     assert resp.status_code == HTTP_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_transition_status_rolls_over_and_counts(
+    overdue_project_fixture: Project,
+) -> None:
+    """Bulk completion rolls recurring rows over and keeps counters exact."""
+    mechanism = EnvironmentalMechanism.objects.create(
+        name="Mechanism", project=overdue_project_fixture
+    )
+    for number, recurring in (("PCEMP-001", False), ("PCEMP-002", True)):
+        Obligation.objects.create(
+            obligation_number=number,
+            project=overdue_project_fixture,
+            primary_environmental_mechanism=mechanism,
+            status=STATUS_NOT_STARTED,
+            recurring_obligation=recurring,
+            recurring_frequency="monthly" if recurring else None,
+        )
+    events = []
+
+    def receiver(sender, **kwargs):
+        events.append(kwargs)
+
+    dashboard_data_updated.connect(receiver)
+    try:
+        result = transition_status(
+            ["PCEMP-001", "PCEMP-002", "PCEMP-404"], STATUS_COMPLETED, batch_size=1
+        )
+    finally:
+        dashboard_data_updated.disconnect(receiver)
+
+    assert result.updated == ["PCEMP-001"]
+    assert result.rolled_over == ["PCEMP-002"]
+    assert result.missing == ["PCEMP-404"]
+    assert len(events) == 1
+    assert sorted(events[0]["obligation_ids"]) == ["PCEMP-001", "PCEMP-002"]
+
+    recurring = Obligation.objects.get(pk="PCEMP-002")
+    assert recurring.status == STATUS_NOT_STARTED
+    assert recurring.recurring_forcasted_date is not None
+    mechanism.refresh_from_db()
+    assert (mechanism.not_started_count, mechanism.completed_count) == (1, 1)
+
+    with pytest.raises(ValueError, match="Invalid status"):
+        transition_status(["PCEMP-001"], "Complete")
+
+
+@pytest.mark.django_db
+def test_completion_forecast_matches_between_save_and_bulk(
+    overdue_project_fixture: Project,
+) -> None:
+    """Completing a recurring obligation advances its forecast once either way."""
+    for number in ("PCEMP-001", "PCEMP-002"):
+        Obligation.objects.create(
+            obligation_number=number,
+            project=overdue_project_fixture,
+            status=STATUS_NOT_STARTED,
+            recurring_obligation=True,
+            recurring_frequency="monthly",
+        )
+
+    saved = Obligation.objects.get(pk="PCEMP-001")
+    saved.status = STATUS_COMPLETED
+    saved.save()
+    transition_status(["PCEMP-002"], STATUS_COMPLETED)
+
+    saved.refresh_from_db()
+    bulk = Obligation.objects.get(pk="PCEMP-002")
+    assert saved.status == bulk.status == STATUS_NOT_STARTED
+    assert saved.recurring_forcasted_date == bulk.recurring_forcasted_date
@@ -8,11 +8,23 @@
 # Copyright 2025 Enveng Group.
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
+import multiprocessing
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import matplotlib.pyplot as plt
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from mechanisms.models import EnvironmentalMechanism
 from obligations.models import Obligation
+from procedures.figures import get_procedure_status_stats
+from procedures.rendering import ChartSpec, RenderService
 from projects.models import Project
+from tests.chart_renderers import hang
 
 HTTP_OK = 200
 
@@ -39,3 +51,159 @@ def test_procedure_charts_interactivity(authenticated_client):
     response = authenticated_client.get(url, HTTP_HX_REQUEST="true")
     assert response.status_code == HTTP_OK
     assert "Test Obligation" in response.content.decode()
+
+
+def test_render_service_renders_in_process_pool():
+    """Charts render in worker processes and the service reports metrics."""
+    service = RenderService(workers=1, queue_size=4, timeout=60)
+    specs = [
+        ChartSpec(
+            "pie",
+            "Dust Management",
+            labels=("Not Started", "In Progress", "Completed"),
+            values=(1, 2, 3),
+            colors=("#f39c12", "#3498db", "#2ecc71"),
+        ),
+        ChartSpec("empty", "Noise Management"),
+    ]
+    figures_before = len(plt.get_fignums())
+
+    images = service.render_many(specs)
+
+    assert all(image and image.startswith(b"\x89PNG") for image in images)
+    metrics = service.metrics()
+    assert (metrics.rendered, metrics.failed, metrics.queue_depth) == (2, 0, 0)
+    assert metrics.max_seconds >= metrics.mean_seconds > 0
+    assert len(plt.get_fignums()) == figures_before
+
+
+def test_render_service_rejects_jobs_beyond_queue_bound():
+    """Specs that do not fit in the queue are skipped, not waited for."""
+    service = RenderService(workers=1, queue_size=1, timeout=60)
+    images = service.render_many([ChartSpec("empty", "A"), ChartSpec("empty", "B")])
+
+    assert images[0] is not None
+    assert images[1] is None
+    assert service.metrics().rejected == 1
+
+
+def test_render_service_applies_one_deadline_per_call():
+    """Charts unfinished at the deadline time out together and retire the pool."""
+    service = RenderService(workers=1, queue_size=8, timeout=0.01)
+    started = time.perf_counter()
+    images = service.render_many([ChartSpec("empty", str(n)) for n in range(4)])
+
+    # Starting a spawned worker alone takes longer than the deadline
+    assert images == [None] * 4
+    assert time.perf_counter() - started < 2
+    metrics = service.metrics()
+    assert (metrics.timed_out, metrics.pools_retired) == (4, 1)
+
+    service.timeout = 60
+    assert service.render_many([ChartSpec("empty", "Later")])[0] is not None
+
+
+def test_render_service_kills_hung_renders_and_frees_their_slots():
+    """A hung chart gives its slot back at the deadline and its worker is killed."""
+    before = set(multiprocessing.active_children())
+    service = RenderService(workers=1, queue_size=1, timeout=1, render=hang)
+
+    assert service.render_many([ChartSpec("empty", "Stuck")]) == [None]
+    metrics = service.metrics()
+    assert (metrics.timed_out, metrics.pools_retired) == (1, 1)
+    assert metrics.queue_depth == 0
+    assert set(multiprocessing.active_children()) - before
+
+    # The slot was freed, so the next chart is queued rather than rejected
+    assert service.render_many([ChartSpec("empty", "Next")]) == [None]
+    assert service.metrics().rejected == 0
+
+    deadline = time.perf_counter() + 10
+    while set(multiprocessing.active_children()) - before:
+        assert time.perf_counter() < deadline, "hung workers were not terminated"
+        time.sleep(0.1)
+
+
+@pytest.mark.django_db
+def test_procedure_chart_view_renders_charts(admin_client):
+    """The procedure chart view embeds a PNG per procedure."""
+    project = Project.objects.create(name="Test Project")
+    mechanism = EnvironmentalMechanism.objects.create(
+        name="Test Mechanism", project=project
+    )
+    Obligation.objects.create(
+        obligation_number="OBL001",
+        obligation="Test Obligation",
+        status="in progress",
+        primary_environmental_mechanism=mechanism,
+        project=project,
+        procedure="Cultural Heritage Management",
+    )
+    service = RenderService(workers=0)
+    with patch("procedures.views.get_render_service", return_value=service):
+        response = admin_client.get(
+            reverse("procedures:procedure_charts", args=[mechanism.id])
+        )
+
+    assert response.status_code == HTTP_OK
+    assert "data:image/png;base64," in response.content.decode()
+    assert service.metrics().rendered == 1
+
+
+@pytest.mark.django_db
+def test_procedure_stats_come_from_one_grouped_query(admin_client):
+    """Stats for every procedure, overdue included, cost a constant query count."""
+    project = Project.objects.create(name="Test Project")
+    mechanism = EnvironmentalMechanism.objects.create(
+        name="Test Mechanism", project=project
+    )
+    yesterday = timezone.now().date() - timedelta(days=1)
+
+    def add(number, procedure, status, due=None):
+        Obligation.objects.create(
+            obligation_number=f"OBL{number:03d}",
+            obligation="Test Obligation",
+            status=status,
+            action_due_date=due,
+            primary_environmental_mechanism=mechanism,
+            project=project,
+            procedure=procedure,
+        )
+
+    add(1, "Dust", "not started", due=yesterday)
+    add(2, "Dust", "completed", due=yesterday)
+    add(3, "Dust", "in progress")
+    add(4, "Noise", "in progress", due=yesterday)
+
+    with CaptureQueriesContext(connection) as queries:
+        stats = get_procedure_status_stats(Obligation.objects.all())
+    assert len(queries) == 1
+    assert stats == {
+        "Dust": {
+            "not_started": 1,
+            "in_progress": 1,
+            "completed": 1,
+            "overdue": 1,
+            "total": 3,
+        },
+        "Noise": {
+            "not_started": 0,
+            "in_progress": 1,
+            "completed": 0,
+            "overdue": 1,
+            "total": 1,
+        },
+    }
+
+    url = reverse("procedures:procedure_charts", args=[mechanism.id])
+    service = RenderService(workers=0)
+    with patch("procedures.views.get_render_service", return_value=service):
+        with CaptureQueriesContext(connection) as two_procedures:
+            admin_client.get(url)
+        for number, procedure in enumerate(["Flora", "Fauna", "Waste"], start=5):
+            add(number, procedure, "not started")
+        with CaptureQueriesContext(connection) as five_procedures:
+            response = admin_client.get(url)
+
+    assert len(response.context["procedure_charts"]) == 5
+    assert len(five_procedures) == len(two_procedures)
@@ -3,8 +3,12 @@
 from datetime import date
 
 import pytest
+from django.urls import reverse
 from mechanisms import proto_utils
 from mechanisms.models import EnvironmentalMechanism
+from mechanisms.proto.mechanism_pb2 import (  # pylint: disable=no-name-in-module
+    ChartResponse,
+)
 
 OBLIGATION_COUNT: int = 2
 SEGMENT_COUNT: int = 4
@@ -106,3 +110,41 @@ def test_serialize_mechanism_chart_data() -> None:
     assert chart_data.segments[0].value == 1
     assert chart_data.segments[3].label == "Overdue"
     assert chart_data.segments[3].value == OVERDUE_COUNT
+
+
+@pytest.mark.django_db
+def test_chart_data_endpoint_negotiates_protobuf_and_json(
+    admin_client, project, mechanism: EnvironmentalMechanism
+) -> None:
+    """All of a project's charts come back in one ChartResponse payload."""
+    other = EnvironmentalMechanism.objects.create(
+        name="Second", project=project, overdue_count=OVERDUE_COUNT
+    )
+    url = reverse("mechanisms:chart_data") + f"?project_id={project.id}"
+
+    response = admin_client.get(url, HTTP_ACCEPT="application/x-protobuf")
+    assert response["Content-Type"] == "application/x-protobuf"
+    charts = ChartResponse.FromString(response.content).charts
+    assert [chart.mechanism_id for chart in charts] == [0, mechanism.id, other.id]
+    assert charts[0].segments[3].value == OVERDUE_COUNT + mechanism.overdue_count
+
+    response = admin_client.get(url, HTTP_ACCEPT="application/json")
+    payload = response.json()
+    assert [chart["mechanism_name"] for chart in payload["charts"]] == [
+        "Overall Status",
+        mechanism.name,
+        "Second",
+    ]
+    assert len(payload["charts"][2]["segments"]) == SEGMENT_COUNT
+
+    missing = admin_client.get(reverse("mechanisms:chart_data") + "?project_id=999")
+    assert missing.status_code == 404
+    assert missing.json() == {"charts": [], "error": "Project not found"}
+
+    page = admin_client.get(
+        reverse("mechanisms:mechanism_charts") + f"?project_id={project.id}"
+    )
+    html = page.content.decode()
+    assert f'data-chart-source="{url}"' in html
+    assert f'data-chart-id="{other.id}"' in html
+    assert "plotly-graph-div" not in html
@@ -13,7 +13,10 @@
 
 
 def calculate_overdue_obligations(user_id: int) -> list[Obligation]:
-    """Calculate overdue obligations for a given user."""
+    """Calculate overdue obligations for a given user.
+
+    The overdue rule is evaluated by the database rather than per obligation.
+    """
     company_memberships = CompanyMembership.objects.filter(user_id=user_id)
     user_roles = company_memberships.values_list("role", flat=True).distinct()
     project_ids = Project.objects.filter(members=user_id).values_list("id", flat=True)
@@ -21,7 +24,8 @@ def calculate_overdue_obligations(user_id: int) -> list[Obligation]:
         Obligation.objects.filter(
             responsibility__in=user_roles, project_id__in=project_ids
         )
+        .overdue()
         .select_related("project")
         .distinct()
     )
-    return [obligation for obligation in obligations if obligation.is_overdue]
+    return list(obligations)
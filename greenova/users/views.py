@@ -77,23 +77,20 @@ def profile_view(request: HttpRequest) -> HttpResponse:
             "id", flat=True
         )
 
-        # Find obligations that match any of the user's roles and are in their projects
-        obligations = (
+        # Count overdue obligations that match any of the user's roles and are in
+        # their projects
+        overdue_count = (
             Obligation.objects.filter(
                 responsibility__in=user_roles, project_id__in=project_ids
             )
-            .select_related("project")
+            .overdue()
             .distinct()
+            .count()
         )
 
-        # Get obligations that are overdue
-        overdue_obligations = [
-            obligation for obligation in obligations if obligation.is_overdue
-        ]
-
         context: dict[str, Any] = {
             "profile": profile,
-            "overdue_count": len(overdue_obligations),
+            "overdue_count": overdue_count,
         }
 
     if request.htmx: